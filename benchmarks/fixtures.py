@@ -0,0 +1,198 @@
+"""
+Synthetic, deterministic benchmark fixtures: resumes (text, PDF, DOCX) and job descriptions.
+
+Everything is generated from a seed, so two runs (or two machines) benchmark identical inputs.
+PDFs are drawn with ReportLab one page at a time so the page count is exact; DOCX files are
+written as raw WordprocessingML, so python-docx is only needed to read them back.
+"""
+import os
+import json
+import random
+import zipfile
+from html import escape
+from typing import Dict, Iterable, List
+
+LINES_PER_PAGE = 45
+
+FIRST_NAMES = ["Ada", "Grace", "Alan", "Edsger", "Barbara", "Donald", "Frances", "Ken", "Radia", "Tim"]
+LAST_NAMES = ["Lovelace", "Hopper", "Turing", "Dijkstra", "Liskov", "Knuth", "Allen", "Thompson", "Perlman", "Berners"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries", "Wayne Enterprises"]
+TITLES = ["Software Engineer", "Senior Software Engineer", "Data Scientist", "Machine Learning Engineer",
+          "Backend Developer", "Platform Engineer", "Engineering Manager"]
+SKILLS = ["Python", "Java", "C++", "Machine Learning", "Data Analysis", "SQL", "Project Management",
+          "Docker", "Kubernetes", "AWS", "React", "TensorFlow", "PyTorch", "Spark", "Go"]
+DEGREES = ["Bachelor of Science in Computer Science", "Master of Science in Data Science",
+           "BSc in Mathematics", "MBA, Technology Management", "PhD in Machine Learning"]
+SCHOOLS = ["State University", "Institute of Technology", "City College", "Polytechnic University"]
+VERBS = ["Built", "Designed", "Led", "Scaled", "Migrated", "Optimized", "Automated", "Shipped", "Reduced", "Owned"]
+OBJECTS = ["a distributed ingestion pipeline", "the billing service", "an internal ML platform",
+           "customer-facing APIs", "the CI/CD system", "a real-time analytics dashboard",
+           "data warehouse jobs", "the search ranking model", "on-call tooling"]
+OUTCOMES = ["cutting latency by 40%", "serving 2M daily users", "saving $300k per year",
+            "with a team of five engineers", "improving reliability to 99.95%", "ahead of schedule"]
+JOB_WORDS = ["experience", "python", "distributed", "systems", "machine", "learning", "cloud", "aws",
+             "kubernetes", "docker", "sql", "data", "pipelines", "team", "communication", "ownership",
+             "design", "scalable", "services", "apis", "testing", "monitoring", "react", "frontend",
+             "backend", "security", "agile", "mentoring", "stakeholders", "analytics", "spark", "etl"]
+
+
+def resume_lines(pages: int, seed: int = 0) -> List[str]:
+    """Returns about `pages` pages worth of resume lines: contact block, skills, experience, education."""
+    rng = random.Random(seed)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        f"{name.split()[0].lower()}.{name.split()[1].lower()}@example.com",
+        f"+1555{rng.randint(1000000, 9999999)}",
+        "Skills: " + ", ".join(rng.sample(SKILLS, 6)),
+        "",
+        "Work Experience",
+    ]
+    education = ["", "Education"] + [
+        f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)}, {rng.randint(2000, 2020)}" for _ in range(2)]
+
+    target = pages * LINES_PER_PAGE - len(education)
+    year = 2024
+    while len(lines) < target:
+        start = year - rng.randint(1, 4)
+        lines.append(f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)} {start} - {year}")
+        for _ in range(rng.randint(3, 6)):
+            lines.append(f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)}, {rng.choice(OUTCOMES)}")
+        year = start
+    return lines[:target] + education
+
+
+def resume_text(pages: int, seed: int = 0) -> str:
+    return "\n".join(resume_lines(pages, seed))
+
+
+def resume_data(seed: int = 0, jobs: int = 5) -> Dict:
+    """Returns structured resume data of the shape `parse_resume` produces, for rendering benchmarks."""
+    rng = random.Random(seed)
+    return {
+        "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        "email": "candidate@example.com",
+        "phone": "+15551234567",
+        "skills": rng.sample(SKILLS, 8),
+        "work_experience": [f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)} {2024 - 2 * i - 2} - {2024 - 2 * i}"
+                            for i in range(jobs)],
+        "education": [f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)}"],
+    }
+
+
+def job_description(words: int, seed: int = 0) -> str:
+    """Returns a job description of about `words` words, skewed towards a few frequent terms like real postings."""
+    rng = random.Random(seed)
+    weights = [1.0 / (rank + 1) for rank in range(len(JOB_WORDS))]
+    sentences = []
+    count = 0
+    while count < words:
+        length = rng.randint(8, 20)
+        sentence = rng.choices(JOB_WORDS, weights, k=length)
+        sentence.insert(rng.randint(0, length), rng.choice(["the", "and", "with", "for", "our", "you", "will"]))
+        sentences.append(" ".join(sentence).capitalize() + ".")
+        count += length + 1
+    return " ".join(sentences)
+
+
+def job_posting_html(words: int, seed: int = 0, json_ld: bool = False) -> str:
+    """
+    Returns a job posting page with navigation/footer boilerplate around requirement and
+    responsibility sections, optionally with the posting embedded as schema.org JSON-LD.
+    """
+    rng = random.Random(seed)
+    sentences = job_description(words, seed).split(". ")
+    third = max(len(sentences) // 3, 1)
+    intro, duties, needs = sentences[:third], sentences[third:2 * third], sentences[2 * third:]
+    title = f"{rng.choice(['Senior ', 'Junior ', ''])}{rng.choice(TITLES)}"
+    company = rng.choice(COMPANIES)
+
+    def bullets(items):
+        return "<ul>" + "".join(f"<li>{escape(item)}</li>" for item in items) + "</ul>"
+
+    body = (f"<p>{escape('. '.join(intro))}</p><h2>Responsibilities</h2>{bullets(duties)}"
+            f"<h2>Requirements</h2>{bullets(needs)}<h3>Nice to have</h3>{bullets(rng.sample(SKILLS, 3))}")
+    ld = ""
+    if json_ld:
+        posting = {"@context": "https://schema.org", "@type": "JobPosting", "title": title, "description": body,
+                   "hiringOrganization": {"@type": "Organization", "name": company},
+                   "jobLocation": {"@type": "Place", "address": {"addressLocality": "Berlin", "addressCountry": "DE"}}}
+        ld = f'<script type="application/ld+json">{json.dumps(posting)}</script>'
+    boilerplate = "".join(f'<a href="/jobs/{i}">Other job {i}</a>' for i in range(50))
+    return (f"<html><head><title>{escape(title)} | {escape(company)}</title>{ld}"
+            f"<style>body {{ font-family: sans-serif; }}</style><script>window.analytics = {{}};</script></head>"
+            f"<body><nav>{boilerplate}</nav><main><h1>{escape(title)}</h1>{body}</main>"
+            f"<footer>{boilerplate}</footer></body></html>")
+
+
+def write_pdf(path: str, lines: Iterable[str]) -> str:
+    """Draws the lines onto letter-size pages, LINES_PER_PAGE per page."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    pdf = canvas.Canvas(path, pagesize=letter)
+    width, height = letter
+    for index, line in enumerate(lines):
+        row = index % LINES_PER_PAGE
+        if index and row == 0:
+            pdf.showPage()
+        pdf.setFont("Helvetica", 10)
+        pdf.drawString(54, height - 54 - row * 15, line)
+    pdf.save()
+    return path
+
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="word/document.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    '</Relationships>'
+)
+
+
+def write_docx(path: str, lines: Iterable[str]) -> str:
+    """Writes the lines as DOCX paragraphs, with a page break every LINES_PER_PAGE lines."""
+    paragraphs = []
+    for index, line in enumerate(lines):
+        page_break = '<w:r><w:br w:type="page"/></w:r>' if index and index % LINES_PER_PAGE == 0 else ""
+        paragraphs.append(f'<w:p>{page_break}<w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>')
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{"".join(paragraphs)}</w:body></w:document>'
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        docx.writestr("_rels/.rels", _RELS)
+        docx.writestr("word/document.xml", document)
+    return path
+
+
+def build_resume_files(directory: str, page_counts: Iterable[int], formats=("pdf", "docx")) -> Dict[str, str]:
+    """
+    Writes one synthetic resume per page count and format into `directory`, reusing files that exist.
+
+    Returns:
+    - dict: {"<format>-<pages>p": path}.
+    """
+    os.makedirs(directory, exist_ok=True)
+    writers = {"pdf": write_pdf, "docx": write_docx}
+    files = {}
+    for pages in page_counts:
+        lines = resume_lines(pages, seed=pages)
+        for fmt in formats:
+            path = os.path.join(directory, f"resume-{pages}p.{fmt}")
+            if not os.path.exists(path):
+                writers[fmt](path, lines)
+            files[f"{fmt}-{pages}p"] = path
+    return files
@@ -0,0 +1,296 @@
+"""
+Hot-path benchmarks for parsing, keyword scoring and rendering, with a baseline regression gate.
+
+Runs entirely offline on synthetic fixtures (see fixtures.py): resumes of 1-40 pages as PDF and
+DOCX, and job descriptions of 100-10,000 words. For each case it reports the median wall time
+over `--repeat` runs, throughput, and peak traced memory (tracemalloc, from one extra run).
+Cases whose optional dependency is not installed are reported as skipped.
+
+The reference baseline is committed as benchmarks/baseline.json (full suite, default --repeat;
+the machine it was recorded on is in its "platform", "machine" and "cpu_count" fields). Gate a
+change against it on that same machine before merging:
+
+    python benchmarks/hot_paths.py --baseline benchmarks/baseline.json --tolerance 1.0
+
+The committed baseline was recorded on a shared single-CPU VM, where the whole host runs up to
+~1.8x slower from one run to the next; hence the wide tolerance. On dedicated hardware, with a
+baseline recorded there, 0.25 is a useful gate.
+
+With --baseline the exit status is 1 if any case got slower or used more memory than the
+baseline allows. Baselines are machine-specific: comparing against one recorded elsewhere
+prints a warning, and timings are only meaningful once you re-record it on your own hardware
+from a known-good commit:
+
+    python benchmarks/hot_paths.py --save-baseline benchmarks/baseline.json
+
+Usage: python benchmarks/hot_paths.py [--quick] [--repeat 5] [-k FILTER] [--json OUT]
+"""
+import os
+import sys
+import json
+import time
+import logging
+import platform
+import argparse
+import tempfile
+import tracemalloc
+import statistics
+from typing import Callable, Dict, List, NamedTuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCH_DIR), "src")
+sys.path.insert(0, SRC_DIR)
+
+import fixtures  # noqa: E402
+
+PAGE_COUNTS = (1, 5, 20, 40)
+QUICK_PAGE_COUNTS = (1, 5)
+JOB_WORD_COUNTS = (100, 1000, 10000)
+
+# Baseline entries faster than this are too noisy to gate on
+MIN_GATED_SECONDS = 0.0005
+
+
+class Case(NamedTuple):
+    name: str
+    fn: Callable[[], object]
+    units: float  # amount of work per call, for throughput
+    unit: str
+
+
+def build_cases(workdir: str, page_counts) -> List[Case]:
+    from hr_buddy.utils import resume_parser
+    from hr_buddy.utils.resume_generator import ResumeGenerator
+    from hr_buddy.utils.templates import get_template_registry
+
+    cases = []
+    files = {}
+    for fmt in ("pdf", "docx"):
+        try:
+            files.update(fixtures.build_resume_files(os.path.join(workdir, "resumes"), page_counts, formats=(fmt,)))
+        except ImportError as e:
+            print(f"Skipping {fmt} fixtures: {e}")
+
+    # File parsing, cold (no cache) and warm (served from the parsed-resume cache)
+    largest = max(page_counts)
+    for fmt in ("pdf", "docx"):
+        for pages in page_counts:
+            path = files.get(f"{fmt}-{pages}p")
+            if path:
+                cases.append(Case(f"parse_resume[{fmt}-{pages}p]",
+                                  lambda path=path: resume_parser.parse_resume(path, use_cache=False), pages, "pages"))
+        path = files.get(f"{fmt}-{largest}p")
+        if path:
+            cases.append(Case(f"parse_resume[{fmt}-{largest}p,cached]",
+                              lambda path=path: resume_parser.parse_resume(path), largest, "pages"))
+            cases.append(Case(f"extract_contact_info[{fmt}-{largest}p]",
+                              lambda path=path: resume_parser.extract_contact_info(path), 1, "resumes"))
+
+    # Field extraction on already-extracted text
+    text = fixtures.resume_text(largest, seed=largest)
+    megabytes = len(text.encode("utf-8")) / 1e6
+    for name in ("parse_resume_text", "extract_name", "extract_email", "extract_phone", "extract_skills",
+                 "extract_experience", "extract_education"):
+        cases.append(Case(f"{name}[{largest}p]", lambda fn=getattr(resume_parser, name): fn(text), megabytes, "MB"))
+
+    # Keyword extraction and ATS optimization
+    generator = ResumeGenerator()
+    data = fixtures.resume_data(seed=1)
+    for words in JOB_WORD_COUNTS:
+        description = fixtures.job_description(words, seed=words)
+        cases.append(Case(f"_extract_keywords[{words}w]",
+                          lambda description=description: generator._extract_keywords(description), words, "words"))
+        cases.append(Case(f"_optimize_for_ats[{words}w]", _optimize_case(generator, data, description), 1, "resumes"))
+
+    # Job posting parsing, from page HTML and from embedded JSON-LD
+    from hr_buddy.utils.job_parser import parse_job_posting
+
+    for words in JOB_WORD_COUNTS:
+        for json_ld in (False, True):
+            html = fixtures.job_posting_html(words, seed=words, json_ld=json_ld)
+            cases.append(Case(f"parse_job_posting[{words}w{',json-ld' if json_ld else ''}]",
+                              lambda html=html: parse_job_posting(html), len(html) / 1e6, "MB"))
+
+    # Template rendering and PDF generation
+    description = fixtures.job_description(1000, seed=1000)
+    try:
+        layouts = get_template_registry().layouts()
+    except ImportError as e:
+        print(f"Skipping template fixtures: {e}")
+        layouts = []
+    for layout in layouts:
+        cases.append(Case(f"render_resume_text[{layout}]",
+                          lambda layout=layout: generator.render_resume_text(data, description, layout), 1, "resumes"))
+        cases.append(Case(f"render_pdf[{layout}]",
+                          lambda layout=layout: generator.render_pdf(data, description, layout), 1, "resumes"))
+    markup = "\n\n".join(fixtures.resume_lines(5, seed=5))
+    cases.append(Case("_generate_pdf[5p]",
+                      lambda: generator._generate_pdf(markup, "bench.pdf", output_dir=workdir), 1, "resumes"))
+
+    # Semantic job -> candidates retrieval over an already-built vector index
+    corpus_size = 200 if largest <= max(QUICK_PAGE_COUNTS) else 2000
+    cases.append(Case(f"vector_index.similar[{corpus_size} resumes]",
+                      _similar_case(os.path.join(workdir, "vectors"), corpus_size, description), corpus_size, "resumes"))
+
+    # Interview question selection from the compiled question bank
+    from hr_buddy.utils.question_bank import get_question_bank
+
+    posting = parse_job_posting(fixtures.job_posting_html(1000, seed=1000))
+    cases.append(Case("question_bank.for_job[1000w]",
+                      lambda: get_question_bank().for_job(posting, data), 1, "jobs"))
+
+    # Agent tool call served from the tool cache (the overhead a repeated call still pays)
+    from hr_buddy.utils.disk_cache import DiskCache
+    from hr_buddy.utils.tool_cache import ToolCache
+
+    tool_cache = ToolCache(DiskCache(os.path.join(workdir, "tools")))
+    cases.append(Case("tool_cache.call[hit]", lambda: tool_cache.call(
+        "website_search", lambda query: description, (description[:200],)), 1, "calls"))
+
+    # End to end through the crew, with offline stand-ins for the network-backed agents
+    resume_path = files.get("docx-5p") or files.get("pdf-5p")
+    if resume_path:
+        from hr_buddy.crew import HRBuddyCrew
+        from stand_ins import offline_registry
+
+        logging.getLogger().setLevel(logging.WARNING)  # crew.py configures INFO logging on import
+
+        job_url = "https://jobs.example.com/posting/1"
+        crew = HRBuddyCrew(registry=offline_registry({job_url: fixtures.job_posting_html(1000, seed=1000)}))
+        cases.append(Case("run_crew_concurrent[offline]", lambda: crew.run_crew_concurrent(
+            job_url, "https://linkedin.com/in/someone", "https://github.com/someone",
+            resume_file=resume_path, in_memory=True), 1, "runs"))
+    return cases
+
+
+def _optimize_case(generator, data, description):
+    # Keywords and resume markup are prepared on the first call so only the optimization is timed
+    state = {}
+
+    def run():
+        if not state:
+            state["keywords"] = generator._extract_keywords(description)
+            state["text"] = generator.render_resume_text(data)
+        return generator._optimize_for_ats(state["text"], state["keywords"])
+    return run
+
+
+def _similar_case(directory, corpus_size, description):
+    # The index is built (or reused from --workdir) on the first call so only retrieval is timed
+    state = {}
+
+    def run():
+        if not state:
+            from hr_buddy.utils.vector_index import VectorIndex, JOB
+
+            index = VectorIndex(directory)
+            index.add_many((f"resume-{i}", fixtures.resume_text(1 + i % 3, seed=i)) for i in range(corpus_size))
+            index.add("job", description, kind=JOB)
+            state["index"] = index
+        return state["index"].similar("job", top_k=50)
+    return run
+
+
+def measure(case: Case, repeat: int) -> Dict[str, float]:
+    case.fn()  # Warm-up: imports, template compilation, caches
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        case.fn()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        case.fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(times)
+    return {
+        "median_s": median,
+        "min_s": min(times),
+        "throughput": case.units / median if median else float("inf"),
+        "unit": case.unit,
+        "peak_kb": peak / 1024,
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """Returns a description of every case that regressed past the tolerance."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or "median_s" not in result or "median_s" not in base:
+            continue
+        if base["median_s"] >= MIN_GATED_SECONDS and result["median_s"] > base["median_s"] * (1 + tolerance):
+            regressions.append(f"{name}: {result['median_s'] * 1000:.2f} ms vs baseline {base['median_s'] * 1000:.2f} ms")
+        if result["peak_kb"] > base["peak_kb"] * (1 + tolerance) + 64:
+            regressions.append(f"{name}: peak {result['peak_kb']:.0f} KB vs baseline {base['peak_kb']:.0f} KB")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (the median counts)")
+    parser.add_argument("--quick", action="store_true", help=f"Only {QUICK_PAGE_COUNTS}-page resumes")
+    parser.add_argument("-k", "--filter", help="Only run cases whose name contains this string")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    parser.add_argument("--save-baseline", help="Write results to this file as the new baseline")
+    parser.add_argument("--baseline", help="Compare against this baseline and fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown/memory growth (0.25 = 25%%)")
+    parser.add_argument("--workdir", help="Where fixtures are generated (default: a temporary directory)")
+    args = parser.parse_args(argv)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="hr_buddy_bench_")
+    # Keep the benchmark's caches away from the user's
+    os.environ["HR_BUDDY_CACHE_DIR"] = os.path.join(workdir, "cache")
+    os.environ.pop("HR_BUDDY_NO_CACHE", None)
+
+    cases = build_cases(workdir, QUICK_PAGE_COUNTS if args.quick else PAGE_COUNTS)
+    if args.filter:
+        cases = [case for case in cases if args.filter in case.name]
+
+    results = {}
+    print(f"{'case':40} {'median ms':>10} {'throughput':>18} {'peak KB':>10}")
+    for case in cases:
+        try:
+            result = measure(case, args.repeat)
+        except ImportError as e:
+            results[case.name] = {"skipped": str(e)}
+            print(f"{case.name:40} {'skipped':>10}  {e}")
+            continue
+        results[case.name] = result
+        throughput = f"{result['throughput']:,.1f} {result['unit']}/s"
+        print(f"{case.name:40} {result['median_s'] * 1000:>10.2f} {throughput:>18} {result['peak_kb']:>10.0f}")
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    for path in filter(None, (args.json, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline_report = json.load(f)
+        recorded_on = [baseline_report.get(key) for key in ("platform", "machine", "cpu_count")]
+        if recorded_on != [report[key] for key in ("platform", "machine", "cpu_count")]:
+            print(f"WARNING {args.baseline} was recorded on another machine ({', '.join(map(str, recorded_on))}); "
+                  "timings may not be comparable")
+        regressions = compare(results, baseline_report["results"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+Offline stand-ins for the network- and LLM-backed agents, so the crew can be benchmarked end to end.
+
+The researcher and profiler return canned data instead of scraping; the strategist and preparer
+are the real agents minus their crewai/RAG tools, so resume and question rendering run the
+production code paths.
+"""
+from hr_buddy.agents.registry import AgentRegistry
+from hr_buddy.agents.strategist import ResumeStrategistAgent
+from hr_buddy.agents.preparer import InterviewPreparerAgent
+from hr_buddy.utils.resume_generator import ResumeGenerator
+from hr_buddy.utils.job_parser import parse_job_posting
+
+
+class OfflineResearcher:
+    def __init__(self, job_pages):
+        self.job_pages = job_pages
+
+    def extract_job_details(self, url):
+        html = self.job_pages.get(url)
+        return parse_job_posting(html, url) if html else None
+
+
+class OfflineProfiler:
+    def extract_profiles(self, linkedin_url, github_url):
+        return {
+            "linkedin": self.fetch_linkedin_profile(linkedin_url) if linkedin_url else None,
+            "github": self.fetch_github_profile(github_url) if github_url else None,
+        }
+
+    def fetch_linkedin_profile(self, url):
+        return {"url": url, "headline": "Software Engineer", "experience": []}
+
+    def fetch_github_profile(self, url):
+        return {"url": url, "public_repos": 12, "languages": ["Python", "Go"]}
+
+
+class OfflineStrategist(ResumeStrategistAgent):
+    def __init__(self):
+        self.generator_tool = ResumeGenerator()
+
+
+class OfflinePreparer(InterviewPreparerAgent):
+    def __init__(self):
+        pass
+
+
+def offline_registry(job_pages) -> AgentRegistry:
+    """
+    Returns an agent registry wired to the stand-ins.
+
+    Parameters:
+    - job_pages (dict): Job posting HTML keyed by URL, served by the researcher.
+    """
+    registry = AgentRegistry()
+    registry.register("researcher", lambda: OfflineResearcher(job_pages))
+    registry.register("profiler", OfflineProfiler)
+    registry.register("strategist", OfflineStrategist)
+    registry.register("preparer", OfflinePreparer)
+    return registry
@@ -0,0 +1,87 @@
+"""
+Startup import-time benchmark.
+
+Imports each HR Buddy entry module in a fresh interpreter with `python -X importtime`, then
+checks two things: that the module's cumulative import time stays within its budget, and
+that none of the heavy optional dependencies (crewai, reportlab, pdfplumber, ...) are pulled
+in at import time. The second check is machine-independent and is the one that matters for
+air-gapped and autoscaled workers.
+
+Usage: python benchmarks/startup.py [--repeat 5] [--budget-scale 1.0]
+"""
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(REPO_ROOT, "src")
+
+# Cumulative import time budgets in milliseconds
+BUDGETS_MS = {
+    "hr_buddy.crew": 100,
+    "hr_buddy.utils.resume_parser": 80,
+    "hr_buddy.utils.resume_generator": 80,
+    "hr_buddy.utils.ats_scorer": 50,
+    "hr_buddy.agents.registry": 50,
+    "hr_buddy.agents.researcher": 300,  # requests is imported eagerly by the fetcher
+    "hr_buddy.agents.strategist": 80,
+    "hr_buddy.agents.preparer": 80,
+}
+
+HEAVY_MODULES = ("crewai", "crewai_tools", "embedchain", "reportlab", "jinja2", "pdfplumber",
+                 "docx", "nltk", "bs4", "lxml", "numpy", "scipy", "streamlit")
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(module):
+    """Returns (cumulative microseconds, set of imported top-level packages) for one cold import."""
+    env = dict(os.environ, PYTHONPATH=SRC_DIR + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, env=env, cwd=REPO_ROOT)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    cumulative = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        name = match.group(4)
+        imported.add(name.split(".")[0])
+        if name == module:
+            cumulative = int(match.group(2))
+    return cumulative, imported
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Cold imports per module (the fastest counts)")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply all budgets, e.g. for slow CI")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    print(f"{'module':40} {'import ms':>10} {'budget ms':>10}  heavy deps")
+    for module, budget in BUDGETS_MS.items():
+        try:
+            runs = [measure(module) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"{module:40} {'error':>10} {budget:>10}  {e}")
+            failures += 1
+            continue
+
+        best_ms = min(cumulative for cumulative, _ in runs) / 1000
+        heavy = sorted(set().union(*(imported for _, imported in runs)) & set(HEAVY_MODULES))
+        limit = budget * args.budget_scale
+        ok = best_ms <= limit and not heavy
+        failures += not ok
+        print(f"{module:40} {best_ms:>10.1f} {limit:>10.0f}  {', '.join(heavy) or '-'}{'' if ok else '  FAIL'}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
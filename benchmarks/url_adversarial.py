@@ -0,0 +1,116 @@
+"""
+Adversarial-input benchmark for URL validation and normalization.
+
+Feeds hr_buddy.utils.urls inputs shaped to trigger regex backtracking (long runs of path
+characters before an invalid one, hosts with thousands of labels, huge query strings) at
+sizes from 64 characters to 1 MB, and checks two things for every function and input shape:
+
+- no validator call takes longer than the per-call budget at any size (validators reject
+  anything over MAX_URL_LENGTH before parsing, so their time is bounded outright);
+- the cost per input character does not grow with the input: at the largest size it stays
+  within GROWTH_LIMIT times the cost at GROWTH_BASE_SIZE, i.e. runtime is at most linear.
+  `normalize_url` accepts any length, so this is the check that bounds it.
+
+With --legacy the validator these checks replaced is run too, in a subprocess with a timeout,
+to show the blow-up this guards against.
+
+Usage: python benchmarks/url_adversarial.py [--repeat 5] [--budget-scale 1.0] [--legacy]
+"""
+import os
+import sys
+import time
+import argparse
+import subprocess
+import statistics
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCH_DIR), "src")
+sys.path.insert(0, SRC_DIR)
+
+from hr_buddy.utils import urls  # noqa: E402
+
+SIZES = (64, 256, 1024, 2000, 10_000, 100_000, 1_000_000)
+BUDGET_MS = 1.0  # per validator call, at any size
+GROWTH_BASE_SIZE = 1024
+GROWTH_LIMIT = 4.0
+
+# name -> input of (about) n characters
+ADVERSARIAL_INPUTS = {
+    "path-run": lambda n: "http://example.com/" + "a" * n + "!",
+    "spaced-path": lambda n: "example.com/" + "a ." * (n // 3) + "\x00",
+    "dotted-host": lambda n: "a." * (n // 2) + "!",
+    "long-label": lambda n: "https://" + "a" * n + ".com",
+    "deep-path": lambda n: "https://example.com" + "/a" * (n // 2),
+    "tracking-query": lambda n: "https://example.com/job?" + "&".join(f"utm_{i}=x" for i in range(n // 10)),
+    "linkedin-slug": lambda n: "https://www.linkedin.com/in/" + "a-" * (n // 2) + "!",
+    "github-login": lambda n: "https://github.com/" + "a" * n + "/",
+}
+# name -> (function, whether the per-call budget applies)
+FUNCTIONS = {
+    "is_valid_url": (urls.is_valid_url, True),
+    "is_valid_linkedin_url": (urls.is_valid_linkedin_url, True),
+    "is_valid_github_url": (urls.is_valid_github_url, True),
+    "normalize_url": (urls.normalize_url, False),
+}
+
+LEGACY_PATTERN = r"^(https?:\/\/)?([\da-z\.-]+)\.([a-z\.]{2,6})([\/\w \.-]*)*\/?$"
+LEGACY_SIZES = (16, 20, 22, 24, 26)
+LEGACY_TIMEOUT = 10.0
+
+
+def time_call(fn, value, repeat):
+    """Returns the median seconds per call, looping fast calls so timer resolution doesn't dominate."""
+    start = time.perf_counter()
+    fn(value)
+    loops = max(1, min(1000, int(0.002 / max(time.perf_counter() - start, 1e-7))))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn(value)
+        samples.append((time.perf_counter() - start) / loops)
+    return statistics.median(samples)
+
+
+def run_legacy():
+    print(f"\nlegacy is_valid_url on 'a.com/' + 'a' * n + '!' (timeout {LEGACY_TIMEOUT:.0f}s):")
+    for n in LEGACY_SIZES:
+        code = (f"import re, time; url = 'a.com/' + 'a' * {n} + '!'; start = time.perf_counter(); "
+                f"re.match({LEGACY_PATTERN!r}, url); print(time.perf_counter() - start)")
+        try:
+            result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                    timeout=LEGACY_TIMEOUT)
+            print(f"  n={n:<4} {float(result.stdout) * 1000:>12.1f} ms")
+        except subprocess.TimeoutExpired:
+            print(f"  n={n:<4} {'> timeout':>12}")
+            break
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per input (the median counts)")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply the validator budget, e.g. for slow CI")
+    parser.add_argument("--legacy", action="store_true", help="Also time the old backtracking validator")
+    args = parser.parse_args(argv)
+
+    budget = BUDGET_MS * args.budget_scale / 1000
+    failures = 0
+    print(f"{'function':22} {'input':15} {'max ms':>9} {'at size':>9} {'ns/char':>9} {'growth':>7}")
+    for fn_name, (fn, bounded) in FUNCTIONS.items():
+        for input_name, make in ADVERSARIAL_INPUTS.items():
+            timings = {size: time_call(fn, make(size), args.repeat) for size in SIZES}
+            slowest = max(timings, key=timings.get)
+            per_char = {size: seconds / size for size, seconds in timings.items()}
+            growth = per_char[SIZES[-1]] / per_char[GROWTH_BASE_SIZE]
+            ok = (timings[slowest] <= budget or not bounded) and growth <= GROWTH_LIMIT
+            failures += not ok
+            print(f"{fn_name:22} {input_name:15} {timings[slowest] * 1000:>9.3f} {slowest:>9} "
+                  f"{per_char[SIZES[-1]] * 1e9:>9.2f} {growth:>7.2f}{'' if ok else '  FAIL'}")
+
+    if args.legacy:
+        run_legacy()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,18 @@
-from crewai import Agent
-from crewai_tools import RagTool, PDFSearchTool, DOCXSearchTool
+import os
+from html import escape
+from hr_buddy.utils.pdf_renderer import render_pdf, write_pdf, unique_output_path
+from hr_buddy.utils.tool_cache import cache_tool, get_tool_cache
+
+# Set to 1 to have the agent's LLM write questions for required skills the question bank lacks
+QUESTION_LLM_ENV = "HR_BUDDY_QUESTION_LLM"
 
 class InterviewPreparerAgent:
     def __init__(self):
-        self.rag_tool = RagTool()
+        # Heavy dependencies are imported on first construction, not at module import
+        from crewai import Agent
+        from crewai_tools import RagTool
+
+        self.rag_tool = cache_tool(RagTool(), "rag")
         self.agent = Agent(
             role="Interview Preparer",
             goal=(
@@ -18,9 +27,48 @@ class InterviewPreparerAgent:
             verbose=True
         )
     
-    def generate_questions(self, job_details):
-        return [
-            "Tell me about yourself.",
-            "What are your strengths?",
-            "Why should we hire you for this role?"
-        ]
+    def generate_questions(self, job_details, resume_data=None, count=None):
+        """
+        Returns interview questions tailored to the job and resume, picked from the question bank.
+
+        Required skills the bank has no questions for are covered by template questions, or by
+        the agent's LLM when $HR_BUDDY_QUESTION_LLM is set.
+        """
+        from hr_buddy.utils.question_bank import get_question_bank, DEFAULT_QUESTION_COUNT
+
+        questions = get_question_bank().for_job(job_details, resume_data, count=count or DEFAULT_QUESTION_COUNT,
+                                                fill_gaps=self._llm_gap_questions if self._llm_enabled() else None)
+        return [question.text for question in questions]
+
+    def _llm_enabled(self):
+        return os.getenv(QUESTION_LLM_ENV, "").lower() in ("1", "true", "yes") and \
+            getattr(getattr(self, "agent", None), "llm", None) is not None
+
+    def _llm_gap_questions(self, skills, seniority):
+        """Asks the agent's LLM for one question per skill; results are cached and shared like tool calls."""
+        llm = self.agent.llm
+        level = f"{seniority}-level " if seniority else ""
+        prompt = (f"Write one interview question for a {level}candidate about each of these skills: "
+                  f"{', '.join(skills)}. Reply with exactly one question per line, in the same order, "
+                  "without numbering.")
+        reply = get_tool_cache().call("question_gaps", llm.call, (prompt,),
+                                      config={"llm": getattr(llm, "model", type(llm).__name__)})
+        questions = [line.strip().lstrip("-*0123456789.) ").strip() for line in str(reply).splitlines()]
+        return [question for question in questions if question]
+
+    def _questions_text(self, questions):
+        lines = ["<b>Interview Questions</b>"]
+        lines += [f"{i}. {escape(question, quote=False)}" for i, question in enumerate(questions, 1)]
+        return "\n\n".join(lines)
+
+    def generate_questions_pdf(self, questions, filename=None, output_dir=None):
+        """Writes the questions to a PDF and returns its path (a unique file name is used if none is given)."""
+        if filename:
+            file_path = os.path.join(output_dir or os.getcwd(), filename)
+        else:
+            file_path = unique_output_path("interview_questions", output_dir)
+        return write_pdf(self._questions_text(questions), file_path)
+
+    def render_questions_pdf(self, questions, stream=None):
+        """Builds the questions PDF in memory and returns it as a BytesIO."""
+        return render_pdf(self._questions_text(questions), stream)
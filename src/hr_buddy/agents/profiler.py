@@ -1,11 +1,16 @@
-from crewai import Agent
-from crewai_tools import GithubSearchTool
-from crewai_tools.tools.website_search.website_search_tool import WebsiteSearchTool
-from embedchain.embedder.ollama import OllamaEmbedder
+from hr_buddy.utils.enrichment import get_profile_enricher
+from hr_buddy.utils.tool_cache import cache_tool
+
 
 class SocialMediaProfilerAgent:
     def __init__(self):
-        self.linkedin_tool = WebsiteSearchTool(embedding_model=OllamaEmbedder())
+        # Heavy dependencies are imported on first construction, not at module import
+        from crewai import Agent
+        from crewai_tools.tools.website_search.website_search_tool import WebsiteSearchTool
+        from embedchain.embedder.ollama import OllamaEmbedder
+
+        self.linkedin_tool = cache_tool(WebsiteSearchTool(embedding_model=OllamaEmbedder()), "website_search",
+                                        embedder="ollama")
 
         self.agent = Agent(
             role="Social Media Profiler",
@@ -17,14 +22,16 @@ class SocialMediaProfilerAgent:
                 "You are an expert in professional networking analysis. You analyze LinkedIn profiles to extract "
                 "job history, education, and skills. You also scan GitHub profiles to assess coding contributions and technical proficiency."
             ),
-            tools=[self.linkedin_tool, self.github_tool],
+            tools=[self.linkedin_tool],
             verbose=True
         )
     
     def extract_profiles(self, linkedin_url, github_url):
-        data = {}
-        if linkedin_url:
-            data["linkedin"] = self.linkedin_tool.run(linkedin_url)
-        if github_url:
-            data["github"] = self.github_tool.run(github_url)
-        return data
+        """Fetches both profiles concurrently: {"linkedin": ..., "github": ...}, None for a missing URL."""
+        return get_profile_enricher().enrich(linkedin_url, github_url)
+
+    def fetch_linkedin_profile(self, url):
+        return get_profile_enricher().linkedin(url)
+
+    def fetch_github_profile(self, url):
+        return get_profile_enricher().github(url)
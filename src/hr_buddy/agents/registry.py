@@ -0,0 +1,137 @@
+import os
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AgentRegistry:
+    """
+    Process-wide pool of agent instances.
+
+    Agents (and the crewai tools, embedders and vector stores they build) are expensive to
+    construct, so instead of creating one per call the registry constructs them lazily and
+    hands them out with `checkout`. An instance is used by one thread at a time and goes back
+    to the pool afterwards; at most `max_instances` of each kind exist, and further checkouts
+    wait for one to be returned.
+    """
+
+    def __init__(self, max_instances: Optional[int] = None):
+        self.max_instances = max_instances or int(os.getenv("HR_BUDDY_MAX_AGENTS", "4"))
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._idle: Dict[str, List[Any]] = {}
+        self._created: Dict[str, int] = {}
+        self._condition = threading.Condition()
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        """Registers a zero-argument factory (usually the agent class) under `name`."""
+        with self._condition:
+            self._factories[name] = factory
+            self._idle.setdefault(name, [])
+            self._created.setdefault(name, 0)
+
+    def names(self) -> List[str]:
+        return list(self._factories)
+
+    def _acquire(self, name: str, timeout: Optional[float]):
+        if name not in self._factories:
+            raise KeyError(f"No agent registered under '{name}'")
+        with self._condition:
+            while not self._idle[name] and self._created[name] >= self.max_instances:
+                if not self._condition.wait(timeout):
+                    raise TimeoutError(f"Timed out waiting for a free '{name}' agent")
+            if self._idle[name]:
+                return self._idle[name].pop()
+            self._created[name] += 1
+
+        # Construct outside the lock so slow constructors don't block other agent types
+        try:
+            return self._factories[name]()
+        except Exception:
+            with self._condition:
+                self._created[name] -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, name: str, instance: Any) -> None:
+        with self._condition:
+            self._idle[name].append(instance)
+            self._condition.notify()
+
+    @contextmanager
+    def checkout(self, name: str, timeout: Optional[float] = None):
+        """Borrows an agent instance for the duration of the `with` block."""
+        instance = self._acquire(name, timeout)
+        try:
+            yield instance
+        finally:
+            self._release(name, instance)
+
+    def warm_up(self, names: Optional[Iterable[str]] = None, count: int = 1) -> None:
+        """
+        Constructs `count` instances of each named agent (default: all) ahead of time.
+
+        Servers can call this at boot so the first requests don't pay construction cost.
+        """
+        count = min(count, self.max_instances)
+        for name in names or self.names():
+            instances = []
+            try:
+                for _ in range(count):
+                    instances.append(self._acquire(name, timeout=None))
+            finally:
+                for instance in instances:
+                    self._release(name, instance)
+            logger.info(f"Warmed up {len(instances)} '{name}' agent(s)")
+
+    def clear(self) -> None:
+        """Drops all idle instances so they are rebuilt on next use."""
+        with self._condition:
+            for name in self._idle:
+                self._created[name] -= len(self._idle[name])
+                self._idle[name] = []
+            self._condition.notify_all()
+
+
+def _researcher():
+    from hr_buddy.agents.researcher import ResearcherAgent
+    return ResearcherAgent()
+
+
+def _profiler():
+    from hr_buddy.agents.profiler import SocialMediaProfilerAgent
+    return SocialMediaProfilerAgent()
+
+
+def _strategist():
+    from hr_buddy.agents.strategist import ResumeStrategistAgent
+    return ResumeStrategistAgent()
+
+
+def _preparer():
+    from hr_buddy.agents.preparer import InterviewPreparerAgent
+    return InterviewPreparerAgent()
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_agent_registry() -> AgentRegistry:
+    """Returns the process-wide registry with HR Buddy's agents registered."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = AgentRegistry()
+            _registry.register("researcher", _researcher)
+            _registry.register("profiler", _profiler)
+            _registry.register("strategist", _strategist)
+            _registry.register("preparer", _preparer)
+        return _registry
+
+
+def warm_up_agents(names: Optional[Iterable[str]] = None, count: int = 1) -> None:
+    """Boot-time hook: pre-builds agents in the process-wide registry."""
+    get_agent_registry().warm_up(names, count)
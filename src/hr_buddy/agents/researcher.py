@@ -1,23 +1,15 @@
-from crewai import Agent
-from crewai_tools import ScrapeWebsiteTool
+from hr_buddy.utils.fetcher import get_fetcher
+from hr_buddy.utils.job_parser import parse_job_page
 
 class ResearcherAgent:
-    def __init__(self):
-        self.tool = ScrapeWebsiteTool()
-        self.agent = Agent(
-            role="Job Researcher",
-            goal=(
-                "Extract detailed job requirements, qualifications, and expectations from a given job posting URL. "
-                "Ensure all responsibilities, preferred skills, and necessary experience are captured accurately."
-            ),
-            backstory=(
-                "You are a highly skilled job researcher with deep expertise in web scraping. "
-                "Your job is to gather critical details from job postings and structure them in a way that helps candidates "
-                "optimize their resumes and prepare for interviews."
-            ),
-            tools=[self.tool],
-            verbose=True
-        )
-    
+    # Job postings are fetched and parsed directly; no crewai agent or scraping tool is involved,
+    # so constructing (and warming up) a researcher is cheap.
+
     def extract_job_details(self, url):
-        return self.tool.run(url)
+        """Returns the posting at `url` as a JobPosting, or None if it can't be fetched or has no content."""
+        # Goes through the shared fetcher so popular postings are served from its cache
+        response = get_fetcher().get(url)
+        if response.status_code != 200:
+            return None
+        posting = parse_job_page(response.text, url)
+        return None if posting.is_empty() else posting
@@ -1,10 +1,16 @@
-from crewai import Agent
-from crewai_tools import RagTool, PDFSearchTool, DOCXSearchTool
+from hr_buddy.utils.resume_generator import ResumeGenerator
+from hr_buddy.utils.tool_cache import cache_tool
 
 class ResumeStrategistAgent:
     def __init__(self):
-        self.pdf_tool = PDFSearchTool()
-        self.docx_tool = DOCXSearchTool()
+        # Heavy dependencies are imported on first construction, not at module import
+        from crewai import Agent
+        from crewai_tools import PDFSearchTool, DOCXSearchTool
+
+        # Tool calls are cached and coalesced across users, so a resume already searched isn't searched again
+        self.pdf_tool = cache_tool(PDFSearchTool(), "pdf_search")
+        self.docx_tool = cache_tool(DOCXSearchTool(), "docx_search")
+        self.generator_tool = ResumeGenerator()
         self.agent = Agent(
             role="Resume Strategist",
             goal=(
@@ -27,3 +33,13 @@ class ResumeStrategistAgent:
         elif resume_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
             resume_text = self.docx_tool.run(resume_file)
         return {"optimized_resume": resume_text + "\n[Optimized based on job requirements]"}
+
+    def generate_resume(self, job_details, resume_data, filename=None, output_dir=None):
+        """Writes a tailored resume PDF and returns its path (a unique file name is used if none is given)."""
+        job_description = str(job_details) if job_details else None
+        return self.generator_tool._run(resume_data, job_description, filename=filename, output_dir=output_dir)
+
+    def render_resume(self, job_details, resume_data, stream=None):
+        """Builds a tailored resume PDF in memory and returns it as a BytesIO."""
+        job_description = str(job_details) if job_details else None
+        return self.generator_tool.render_pdf(resume_data, job_description, stream=stream)
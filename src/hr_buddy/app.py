@@ -1,64 +1,119 @@
 import os
+import sys
+import time
+import hashlib
+from pathlib import Path
 import streamlit as st
-from agents.researcher import ResearcherAgent
-from agents.profiler import SocialMediaProfilerAgent
-from agents.strategist import ResumeStrategistAgent
-from agents.preparer import InterviewPreparerAgent
 
-# Initialize Agents
-researcher = ResearcherAgent()
-social_profiler = SocialMediaProfilerAgent()
-resume_strategist = ResumeStrategistAgent()
-interview_preparer = InterviewPreparerAgent()
+sys.path.append(str(Path(__file__).parent.parent))
+
+from hr_buddy.jobs import JobQueue, WorkerPool, SUCCEEDED, FINISHED_STATES
+from hr_buddy.utils.disk_cache import default_cache_dir
+from hr_buddy.utils.urls import is_valid_url, is_valid_linkedin_url, is_valid_github_url, normalize_url
+
+JOB_DEADLINE = 10 * 60  # seconds
+POLL_INTERVAL = 1.5  # seconds between status checks while a job runs
+
+
+@st.cache_resource
+def get_job_queue():
+    """One queue and worker pool per Streamlit server process, shared by all sessions."""
+    queue = JobQueue()
+    WorkerPool(queue, concurrency=int(os.getenv("HR_BUDDY_WORKERS", "2"))).start()
+    return queue
+
+
+def save_upload(uploaded_file) -> str:
+    """Stores an uploaded resume under its content hash so workers can read it from disk."""
+    data = uploaded_file.getvalue()
+    upload_dir = default_cache_dir("uploads")
+    os.makedirs(upload_dir, exist_ok=True)
+    ext = uploaded_file.name.split(".")[-1].lower()
+    path = os.path.join(upload_dir, f"{hashlib.sha256(data).hexdigest()}.{ext}")
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(data)
+    return path
+
 
 def main():
     st.set_page_config(page_title="AI Resume & Interview Prep", layout="centered")
     st.title("📄 AI-Powered Resume Enhancement & Interview Prep")
     st.write("Optimize your resume based on a job posting and get interview questions tailored to the role.")
-    
+    queue = get_job_queue()
+
     # User Inputs
     st.header("🔗 Job & Profile Links")
     job_url = st.text_input("Job Posting URL")
     linkedin_url = st.text_input("LinkedIn Profile URL (Optional)")
     github_url = st.text_input("GitHub Profile URL (Optional)")
-    
+
     # Resume Upload
     st.header("📄 Upload Your Resume")
     uploaded_resume = st.file_uploader("Upload your resume (PDF or DOCX)", type=["pdf", "docx"])
-    
+
     if st.button("Analyze & Optimize"):
         if not job_url or not uploaded_resume:
             st.error("Please provide a job posting URL and upload your resume.")
             return
-        
-        with st.spinner("Extracting job details..."):
-            job_details = researcher.extract_job_details(job_url)
-        
-        social_data = {}
-        if linkedin_url or github_url:
-            with st.spinner("Extracting social media insights..."):
-                social_data = social_profiler.extract_profiles(linkedin_url, github_url)
-        
-        with st.spinner("Analyzing your resume..."):
-            resume_analysis = resume_strategist.analyze_resume(uploaded_resume, job_details, social_data)
-        
-        with st.spinner("Generating interview questions..."):
-            interview_questions = interview_preparer.generate_questions(job_details)
-        
-        # Display Results
-        st.success("✅ Analysis Complete! Download your optimized resume and review interview questions.")
-        
-        if resume_analysis.get("optimized_resume"):
-            st.download_button(
-                label="📥 Download Optimized Resume",
-                data=resume_analysis["optimized_resume"],
-                file_name="optimized_resume.pdf",
-                mime="application/pdf"
-            )
-        
-        st.header("🎤 Suggested Interview Questions")
-        for idx, question in enumerate(interview_questions, 1):
-            st.write(f"{idx}. {question}")
-    
+        if not is_valid_url(job_url):
+            st.error("Please enter a valid job posting URL.")
+            return
+        if linkedin_url and not is_valid_linkedin_url(linkedin_url):
+            st.error("Please enter a LinkedIn profile URL like https://www.linkedin.com/in/your-name.")
+            return
+        if github_url and not is_valid_github_url(github_url):
+            st.error("Please enter a GitHub profile URL like https://github.com/your-name.")
+            return
+
+        params = {
+            "job_url": job_url.strip(),
+            "linkedin_url": linkedin_url.strip() or None,
+            "github_url": github_url.strip() or None,
+            "resume_file": save_upload(uploaded_resume),
+        }
+        # Double-clicks and reruns with the same inputs (or the same links spelled differently)
+        # attach to the job already in flight
+        key_params = {key: normalize_url(value) if key.endswith("_url") and value else value
+                      for key, value in params.items()}
+        idempotency_key = hashlib.sha256(repr(sorted(key_params.items())).encode()).hexdigest()
+        st.session_state["job_id"] = queue.submit(params, idempotency_key=idempotency_key, deadline=JOB_DEADLINE)
+
+    job_id = st.session_state.get("job_id")
+    if not job_id:
+        return
+
+    status = queue.status(job_id)
+    if status is None:
+        st.error("This result has expired. Please run the analysis again.")
+        del st.session_state["job_id"]
+        return
+
+    if status["status"] not in FINISHED_STATES:
+        st.info("⏳ Working on it..." if status["status"] == "running" else "🕒 Waiting for a free worker...")
+        time.sleep(POLL_INTERVAL)
+        st.rerun()
+
+    if status["status"] != SUCCEEDED:
+        st.error(f"Something went wrong: {status['error']}")
+        return
+
+    result = queue.result(job_id)
+
+    # Display Results
+    st.success("✅ Analysis Complete! Download your optimized resume and interview questions.")
+    st.download_button(
+        label="📥 Download Optimized Resume",
+        data=result["resume_pdf"],
+        file_name="optimized_resume.pdf",
+        mime="application/pdf"
+    )
+    st.download_button(
+        label="🎤 Download Interview Questions",
+        data=result["interview_pdf"],
+        file_name="interview_questions.pdf",
+        mime="application/pdf"
+    )
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,217 @@
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import logging
+import threading
+import traceback
+from collections import Counter
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Callable
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from hr_buddy.crew import HRBuddyCrew
+from hr_buddy.utils.urls import validate_urls
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FIELDS = ("id", "job_url", "resume_file", "linkedin_url", "github_url")
+MANIFEST_URL_KINDS = {"job_url": "url", "linkedin_url": "linkedin", "github_url": "github"}
+
+
+def load_manifest(path: str) -> List[Dict[str, Any]]:
+    """
+    Loads a batch manifest from a CSV or JSONL file.
+
+    Each row needs a `job_url` and a `resume_file`; `id` (unique, defaults to the row number),
+    `linkedin_url`, `github_url` and `missing_info` (a dict, or a JSON object string in CSV) are
+    optional. All URLs are validated up front, so a bad row fails the load rather than a worker
+    mid-batch.
+
+    Parameters:
+    - path (str): Path to a `.csv`, `.jsonl` or `.ndjson` manifest.
+
+    Returns:
+    - list: Manifest rows as dictionaries.
+    """
+    ext = path.split(".")[-1].lower()
+    rows = []
+
+    with open(path, newline="", encoding="utf-8") as f:
+        if ext == "csv":
+            for row in csv.DictReader(f):
+                row = {k: v for k, v in row.items() if v not in (None, "")}
+                if isinstance(row.get("missing_info"), str):
+                    row["missing_info"] = json.loads(row["missing_info"])
+                rows.append(row)
+        elif ext in ("jsonl", "ndjson"):
+            for line in f:
+                if line.strip():
+                    rows.append(json.loads(line))
+        else:
+            raise ValueError("Unsupported manifest format. Use a CSV or JSONL file.")
+
+    for index, row in enumerate(rows):
+        if not row.get("job_url") or not row.get("resume_file"):
+            raise ValueError(f"Manifest row {index} needs both 'job_url' and 'resume_file'.")
+        row.setdefault("id", str(index))
+
+    # Output files are named after the id, so rows sharing one would overwrite each other's PDFs
+    ids = Counter(str(row["id"]) for row in rows)
+    duplicates = sorted(row_id for row_id, count in ids.items() if count > 1)
+    if duplicates:
+        more = f" and {len(duplicates) - 5} more" if len(duplicates) > 5 else ""
+        raise ValueError(f"Duplicate manifest ids: {', '.join(duplicates[:5])}{more}.")
+
+    for column, kind in MANIFEST_URL_KINDS.items():
+        values = [row.get(column) for row in rows]
+        invalid = [str(row["id"]) for row, value, normalized in zip(rows, values, validate_urls(values, kind))
+                   if value and normalized is None]
+        if invalid:
+            more = f" and {len(invalid) - 5} more" if len(invalid) > 5 else ""
+            raise ValueError(f"Invalid '{column}' in manifest rows {', '.join(invalid[:5])}{more}.")
+
+    return rows
+
+
+class _SharedCalls:
+    """Runs each distinct key once and hands the same result (or error) to every caller."""
+
+    def __init__(self, fn: Callable[[Any], Any]):
+        self.fn = fn
+        self.lock = threading.Lock()
+        self.calls: Dict[Any, Future] = {}
+
+    def get(self, key):
+        with self.lock:
+            future = self.calls.get(key)
+            owner = future is None
+            if owner:
+                future = self.calls[key] = Future()
+
+        if owner:
+            try:
+                future.set_result(self.fn(key))
+            except BaseException as e:
+                # Also on KeyboardInterrupt/SystemExit, or the rows waiting on this key would hang
+                future.set_exception(e)
+                raise
+        return future.result()
+
+
+class BatchRunner:
+    """Runs the HR Buddy pipeline over many (resume, job posting) pairs."""
+
+    def __init__(self, crew: Optional[HRBuddyCrew] = None, max_workers: int = 4,
+                 output_dir: str = "batch_output"):
+        self.crew = crew or HRBuddyCrew()
+        self.max_workers = max_workers
+        self.output_dir = output_dir
+        self._jobs = _SharedCalls(self.crew.extract_job_details)
+        self._resumes = _SharedCalls(lambda resume_file: self.crew.parse_resume(resume_file, None))
+        self._profiles = _SharedCalls(lambda urls: self.crew.fetch_social_profiles(*urls))
+
+    def _social_profiles(self, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """The row's LinkedIn/GitHub profiles, or None if it has no links or fetching them failed."""
+        if not (row.get("linkedin_url") or row.get("github_url")):
+            return None
+        try:
+            return self._profiles.get((row.get("linkedin_url"), row.get("github_url")))
+        except Exception as e:
+            # The PDFs don't depend on the profiles, so the row still succeeds without them
+            logger.warning(f"Batch row {row['id']}: fetching social profiles failed: {e}")
+            return None
+
+    def _run_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        result = {"id": row["id"], "job_url": row["job_url"], "resume_file": row["resume_file"]}
+
+        try:
+            job_details = self._jobs.get(row["job_url"])
+            result["social_profiles"] = self._social_profiles(row)
+
+            # The parsed resume is shared between rows, so merge per-row overrides into a copy
+            resume_data = dict(self._resumes.get(row["resume_file"]))
+            for key, value in (row.get("missing_info") or {}).items():
+                if key not in resume_data or not resume_data[key]:
+                    resume_data[key] = value
+
+            # A batch's product is the PDFs in output_dir, so these are written straight to file
+            result["resume_pdf_path"] = self.crew.generate_resume(
+                job_details, resume_data, filename=os.path.join(self.output_dir, f"{row['id']}_resume.pdf"))
+            result["interview_pdf_path"] = self.crew.generate_interview_questions(
+                job_details, resume_data, filename=os.path.join(self.output_dir, f"{row['id']}_interview.pdf"))
+            result["status"] = "ok"
+        except Exception as e:
+            logger.error(f"Batch row {row['id']} failed: {e}")
+            logger.debug(traceback.format_exc())
+            result["status"] = "error"
+            result["error"] = str(e)
+
+        result["elapsed"] = round(time.perf_counter() - start, 3)
+        return result
+
+    def run(self, rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Processes manifest rows on a worker pool.
+
+        Each distinct resume is parsed once and each distinct job posting is scraped once,
+        no matter how many rows reference it. GitHub profiles are prefetched in bulk up front.
+
+        Parameters:
+        - rows (iterable): Manifest rows, as returned by `load_manifest`.
+
+        Returns:
+        - iterator: One result dict per row, yielded in completion order. Rows with profile links
+          carry the fetched profiles under "social_profiles".
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        rows = list(rows)
+        github_urls = [row["github_url"] for row in rows if row.get("github_url")]
+        if github_urls:
+            # One batched API round trip for all candidates instead of one per row
+            from hr_buddy.utils.enrichment import get_profile_enricher
+            get_profile_enricher().prefetch_github(github_urls)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hr-buddy-batch") as pool:
+            futures = [pool.submit(self._run_row, row) for row in rows]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def run_batch(rows: Iterable[Dict[str, Any]], max_workers: int = 4,
+              output_dir: str = "batch_output") -> Iterator[Dict[str, Any]]:
+    """Convenience wrapper around `BatchRunner.run`."""
+    return BatchRunner(max_workers=max_workers, output_dir=output_dir).run(rows)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run HR Buddy over a manifest of resumes and job postings.")
+    parser.add_argument("manifest", help="CSV or JSONL file with job_url and resume_file columns")
+    parser.add_argument("-o", "--output-dir", default="batch_output", help="Directory for generated PDFs")
+    parser.add_argument("-r", "--results", help="Write JSONL results here instead of stdout")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="Number of concurrent rows")
+    args = parser.parse_args(argv)
+
+    rows = load_manifest(args.manifest)
+    out = open(args.results, "w", encoding="utf-8") if args.results else sys.stdout
+    failures = 0
+    try:
+        for done, result in enumerate(run_batch(rows, args.workers, args.output_dir), 1):
+            failures += result["status"] != "ok"
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            logger.info(f"[{done}/{len(rows)}] {result['id']}: {result['status']}")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
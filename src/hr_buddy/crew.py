@@ -1,33 +1,127 @@
+import io
 import sys
+import time
 import traceback
+import contextvars
 from pathlib import Path
 import logging
-from typing import Optional, Dict, Any
-from crewai import Crew, Task
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Optional, Dict, Any, Callable, Iterable, Tuple
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-# Import agents
-from hr_buddy.agents.researcher import ResearcherAgent
-from hr_buddy.agents.profiler import SocialMediaProfilerAgent
-from hr_buddy.agents.strategist import ResumeStrategistAgent
-from hr_buddy.agents.preparer import InterviewPreparerAgent
+# Agents are constructed lazily, and reused, through the registry
+from hr_buddy.agents.registry import AgentRegistry, get_agent_registry
+from hr_buddy.utils.resume_parser import parse_resume as parse_resume_file
+from hr_buddy.utils.job_parser import JobPosting
+from hr_buddy.utils.tracing import span, traced, profiled
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Default per-stage timeouts (seconds) for the concurrent pipeline.
+DEFAULT_STAGE_TIMEOUTS = {
+    "job_details": 60.0,
+    "social_profiles": 30.0,
+    "resume_data": 60.0,
+    "resume_pdf": 120.0,
+    "interview_pdf": 120.0,
+}
+
+
+def _run_stage_graph(stages: Dict[str, Tuple[Callable[..., Any], Tuple[str, ...]]],
+                     timeouts: Dict[str, float], max_workers: int,
+                     optional: Iterable[str] = ()) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """
+    Runs a small DAG of stages on a thread pool.
+
+    A stage that raises or exceeds its timeout fails the whole run, unless it is optional: then
+    the error is logged and its result is None.
+
+    Parameters:
+    - stages (dict): Stage name -> (callable, names of the stages it depends on).
+      The callable receives the results of its dependencies as positional arguments.
+    - timeouts (dict): Stage name -> timeout in seconds, measured from the moment the stage starts.
+    - max_workers (int): Size of the thread pool.
+    - optional (iterable): Names of stages the run can do without.
+
+    Returns:
+    - tuple: (results by stage name, wall-clock seconds by stage name).
+    """
+    results: Dict[str, Any] = {}
+    timings: Dict[str, float] = {}
+    optional = set(optional)
+    pending = dict(stages)
+    running = {}
+    deadlines = {}
+
+    def timed(name, fn, args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            timings[name] = time.perf_counter() - start
+
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hr-buddy-stage")
+    try:
+        while pending or running:
+            for name, (fn, deps) in list(pending.items()):
+                if all(dep in results for dep in deps):
+                    # Run in a copy of the caller's context so stage spans nest under the run's span
+                    context = contextvars.copy_context()
+                    future = pool.submit(context.run, timed, name, fn, [results[dep] for dep in deps])
+                    running[future] = name
+                    deadlines[name] = time.monotonic() + timeouts.get(name, DEFAULT_STAGE_TIMEOUTS.get(name, 60.0))
+                    del pending[name]
+
+            if not running:
+                raise RuntimeError(f"Unresolvable stage dependencies: {sorted(pending)}")
+
+            next_deadline = min(deadlines[name] for name in running.values())
+            done, _ = wait(running, timeout=max(0.0, next_deadline - time.monotonic()),
+                           return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    if name not in optional:
+                        raise
+                    logger.warning(f"Optional stage '{name}' failed: {e}")
+                    results[name] = None
+
+            now = time.monotonic()
+            for future, name in list(running.items()):
+                if deadlines[name] <= now and not future.done():
+                    if name not in optional:
+                        raise TimeoutError(f"Stage '{name}' exceeded its {timeouts.get(name)}s timeout")
+                    logger.warning(f"Optional stage '{name}' exceeded its {timeouts.get(name)}s timeout")
+                    del running[future]
+                    results[name] = None
+    finally:
+        # Don't block on a stage that blew its deadline; its thread is abandoned.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return results, timings
+
 
 class HRBuddyCrew:
-    def __init__(self):
-        """Initialize HR Buddy Crew class (lazy agent instantiation)."""
-        pass  # Instantiate agents only when needed
+    def __init__(self, registry: Optional[AgentRegistry] = None):
+        """Initialize HR Buddy Crew class (agents are pooled and built lazily by the registry)."""
+        self.registry = registry or get_agent_registry()
 
-    def extract_job_details(self, job_url: str) -> Dict[str, Any]:
-        """Extract job details using the ResearcherAgent."""
+    def warm_up(self) -> None:
+        """Pre-builds every agent so the first run doesn't pay construction cost."""
+        self.registry.warm_up()
+
+    @traced("crew.extract_job_details")
+    def extract_job_details(self, job_url: str) -> JobPosting:
+        """Extract structured job details using the ResearcherAgent."""
         try:
-            researcher = ResearcherAgent()
-            job_details = researcher.extract_job_details(job_url)
+            with self.registry.checkout("researcher") as researcher:
+                job_details = researcher.extract_job_details(job_url)
             if not job_details:
                 raise ValueError("Job details extraction failed.")
             return job_details
@@ -36,19 +130,17 @@ class HRBuddyCrew:
             logger.debug(traceback.format_exc())
             raise
 
+    @traced("crew.fetch_social_profiles")
     def fetch_social_profiles(self, linkedin_url: Optional[str], github_url: Optional[str]) -> Dict[str, Any]:
-        """Fetch LinkedIn and GitHub profile data."""
-        profiler = SocialMediaProfilerAgent()
-        return {
-            "linkedin": profiler.fetch_linkedin_profile(linkedin_url) if linkedin_url else None,
-            "github": profiler.fetch_github_profile(github_url) if github_url else None
-        }
+        """Fetch LinkedIn and GitHub profile data (concurrently)."""
+        with self.registry.checkout("profiler") as profiler:
+            return profiler.extract_profiles(linkedin_url, github_url)
 
+    @traced("crew.parse_resume")
     def parse_resume(self, resume_file: str, missing_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Parse and update resume data."""
         try:
-            strategist = ResumeStrategistAgent()
-            resume_data = strategist.agent.tools["resume_parsing"].parse_resume(resume_file)
+            resume_data = parse_resume_file(resume_file)  # Cached by file content
 
             # Ensure missing_info is merged correctly
             if missing_info:
@@ -62,36 +154,77 @@ class HRBuddyCrew:
             logger.debug(traceback.format_exc())
             raise
 
-    def generate_resume(self, job_details: Dict[str, Any], resume_data: Dict[str, Any]) -> str:
-        """Generate a tailored resume."""
-        strategist = ResumeStrategistAgent()
-        resume_pdf_path = strategist.generate_resume(job_details, resume_data, filename="tailored_resume.pdf")
+    @traced("crew.generate_resume")
+    def generate_resume(self, job_details: JobPosting, resume_data: Dict[str, Any],
+                        filename: Optional[str] = None) -> str:
+        """Generate a tailored resume PDF file (uniquely named unless `filename` is given)."""
+        with self.registry.checkout("strategist") as strategist:
+            resume_pdf_path = strategist.generate_resume(job_details, resume_data, filename=filename)
         return resume_pdf_path
 
-    def generate_interview_questions(self, job_details: Dict[str, Any], resume_data: Dict[str, Any]) -> str:
-        """Generate interview questions and save as a PDF."""
-        preparer = InterviewPreparerAgent()
-        interview_questions = preparer.generate_questions(job_details, resume_data)
-        interview_pdf_path = preparer.generate_questions_pdf(interview_questions, filename="interview_questions.pdf")
+    @traced("crew.generate_interview_questions")
+    def generate_interview_questions(self, job_details: JobPosting, resume_data: Dict[str, Any],
+                                     filename: Optional[str] = None) -> str:
+        """Generate interview questions and save as a PDF (uniquely named unless `filename` is given)."""
+        with self.registry.checkout("preparer") as preparer:
+            interview_questions = preparer.generate_questions(job_details, resume_data)
+            interview_pdf_path = preparer.generate_questions_pdf(interview_questions, filename=filename)
         return interview_pdf_path
 
+    @traced("crew.render_resume")
+    def render_resume(self, job_details: JobPosting, resume_data: Dict[str, Any]) -> io.BytesIO:
+        """Generate a tailored resume PDF in memory."""
+        with self.registry.checkout("strategist") as strategist:
+            return strategist.render_resume(job_details, resume_data)
+
+    @traced("crew.render_interview_questions")
+    def render_interview_questions(self, job_details: JobPosting, resume_data: Dict[str, Any]) -> io.BytesIO:
+        """Generate interview questions as an in-memory PDF."""
+        with self.registry.checkout("preparer") as preparer:
+            interview_questions = preparer.generate_questions(job_details, resume_data)
+            return preparer.render_questions_pdf(interview_questions)
+
+    @profiled("run_crew")
+    @traced("crew.run")
     def run_crew(self, job_url: str, linkedin_url: Optional[str] = None, github_url: Optional[str] = None,
-                 resume_file: Optional[str] = None, missing_info: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+                 resume_file: Optional[str] = None, missing_info: Optional[Dict[str, Any]] = None,
+                 in_memory: bool = False) -> Dict[str, Any]:
         """
         Orchestrate the multi-agent process to generate a tailored resume and interview questions.
+
+        By default both PDFs are written to uniquely named files and their paths are returned under
+        "resume_pdf_path" and "interview_pdf_path". With `in_memory=True` nothing is written; the
+        PDFs are returned as BytesIO under "resume_pdf" and "interview_pdf" (the app's job queue
+        runs this way). The fetched profiles are returned under "social_profiles", or None if
+        fetching them failed.
         """
         try:
             logger.info("🔍 Extracting job details...")
             job_details = self.extract_job_details(job_url)
 
             logger.info("📢 Fetching social media profiles...")
-            social_profiles = self.fetch_social_profiles(linkedin_url, github_url)
+            try:
+                social_profiles = self.fetch_social_profiles(linkedin_url, github_url)
+            except Exception as e:
+                # Nothing downstream needs the profiles, so they don't fail the run
+                logger.warning(f"Fetching social profiles failed: {e}")
+                social_profiles = None
 
             resume_data = {}
             if resume_file:
                 logger.info("📄 Parsing resume...")
                 resume_data = self.parse_resume(resume_file, missing_info)
 
+            if in_memory:
+                logger.info("✍️ Generating tailored resume...")
+                resume_pdf = self.render_resume(job_details, resume_data)
+
+                logger.info("🎤 Generating interview questions...")
+                interview_pdf = self.render_interview_questions(job_details, resume_data)
+
+                logger.info("✅ HR Buddy Crew execution completed successfully.")
+                return {"resume_pdf": resume_pdf, "interview_pdf": interview_pdf, "social_profiles": social_profiles}
+
             logger.info("✍️ Generating tailored resume...")
             resume_pdf_path = self.generate_resume(job_details, resume_data)
 
@@ -99,7 +232,56 @@ class HRBuddyCrew:
             interview_pdf_path = self.generate_interview_questions(job_details, resume_data)
 
             logger.info("✅ HR Buddy Crew execution completed successfully.")
-            return {"resume_pdf_path": resume_pdf_path, "interview_pdf_path": interview_pdf_path}
+            return {"resume_pdf_path": resume_pdf_path, "interview_pdf_path": interview_pdf_path,
+                    "social_profiles": social_profiles}
+
+        except Exception as e:
+            logger.error(f"🚨 Crew execution failed: {e}")
+            logger.debug(traceback.format_exc())
+            raise
+
+    @profiled("run_crew_concurrent")
+    @traced("crew.run_concurrent")
+    def run_crew_concurrent(self, job_url: str, linkedin_url: Optional[str] = None, github_url: Optional[str] = None,
+                            resume_file: Optional[str] = None, missing_info: Optional[Dict[str, Any]] = None,
+                            stage_timeouts: Optional[Dict[str, float]] = None,
+                            max_workers: int = 3, in_memory: bool = False) -> Dict[str, Any]:
+        """
+        Same pipeline as `run_crew`, but independent stages run concurrently.
+
+        Job extraction, social profile fetching and resume parsing start together; resume and
+        interview question generation start as soon as the job details and resume data are ready.
+        The result additionally carries the fetched profiles under "social_profiles" (None if
+        fetching them failed or timed out, which doesn't fail the run) and per-stage wall-clock
+        timings under "timings".
+        """
+        render_resume = self.render_resume if in_memory else self.generate_resume
+        render_questions = self.render_interview_questions if in_memory else self.generate_interview_questions
+        timeouts = dict(DEFAULT_STAGE_TIMEOUTS)
+        timeouts.update(stage_timeouts or {})
+
+        stages = {
+            "job_details": (lambda: self.extract_job_details(job_url), ()),
+            "social_profiles": (lambda: self.fetch_social_profiles(linkedin_url, github_url), ()),
+            "resume_data": (lambda: self.parse_resume(resume_file, missing_info) if resume_file else {}, ()),
+            "resume_pdf": (render_resume, ("job_details", "resume_data")),
+            "interview_pdf": (render_questions, ("job_details", "resume_data")),
+        }
+
+        try:
+            logger.info("🚀 Running HR Buddy Crew stages concurrently...")
+            start = time.perf_counter()
+            results, timings = _run_stage_graph(stages, timeouts, max_workers, optional=("social_profiles",))
+            timings["total"] = time.perf_counter() - start
+
+            logger.info("✅ HR Buddy Crew execution completed successfully.")
+            suffix = "" if in_memory else "_path"
+            return {
+                f"resume_pdf{suffix}": results["resume_pdf"],
+                f"interview_pdf{suffix}": results["interview_pdf"],
+                "social_profiles": results["social_profiles"],
+                "timings": timings,
+            }
 
         except Exception as e:
             logger.error(f"🚨 Crew execution failed: {e}")
@@ -117,7 +299,7 @@ if __name__ == "__main__":
             linkedin_url="https://linkedin.com/in/username",
             github_url="https://github.com/username",
             resume_file="path/to/resume.pdf",
-            missing_info={"skills": "Python, Machine Learning", "education": "BSc in Computer Science"},
+            missing_info={"skills": ["Python", "Machine Learning"], "education": "BSc in Computer Science"},
         )
 
         print("Resume PDF Path:", results["resume_pdf_path"])
@@ -0,0 +1,209 @@
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import logging
+from collections import deque
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any, List, Iterator
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from hr_buddy.utils.resume_parser import parse_resume_document
+
+logger = logging.getLogger(__name__)
+
+RESUME_EXTENSIONS = (".pdf", ".docx")
+INDEX_BATCH_SIZE = 256  # resumes embedded per vector index write
+
+
+class ParseTimeout(Exception):
+    """Raised inside a worker when a single file takes longer than its time budget."""
+
+
+def _on_alarm(signum, frame):
+    raise ParseTimeout()
+
+
+def find_resumes(root: str) -> List[str]:
+    """Returns every PDF/DOCX file under `root` (or `root` itself if it is a file), sorted."""
+    if os.path.isfile(root):
+        return [root]
+    return sorted(
+        os.path.join(dirpath, name)
+        for dirpath, _, names in os.walk(root)
+        for name in names
+        if name.lower().endswith(RESUME_EXTENSIONS)
+    )
+
+
+def _parse_one(file_path: str, timeout: Optional[float], use_cache: bool, include_text: bool = False) -> Dict[str, Any]:
+    """Parses a single file, turning any failure (corrupt, encrypted, too slow) into an error record."""
+    start = time.perf_counter()
+    record = {"file": file_path}
+    # SIGALRM interrupts pdfplumber even mid-page; it is only available on Unix main threads,
+    # which is what pool worker processes run on.
+    use_alarm = timeout and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        document = parse_resume_document(file_path, use_cache=use_cache)
+        record["data"] = document["data"]
+        if include_text:
+            record["text"] = document["text"]
+        record["status"] = "ok"
+    except ParseTimeout:
+        record["status"] = "timeout"
+        record["error"] = f"Parsing took longer than {timeout}s"
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    record["elapsed"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+def _parse_chunk(file_paths: List[str], timeout: Optional[float], use_cache: bool,
+                 include_text: bool = False) -> List[Dict[str, Any]]:
+    return [_parse_one(file_path, timeout, use_cache, include_text) for file_path in file_paths]
+
+
+def ingest(file_paths: List[str], workers: Optional[int] = None, chunk_size: int = 8,
+           timeout: Optional[float] = 60.0, use_cache: bool = True,
+           include_text: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Parses many resumes across a process pool.
+
+    Files are submitted in chunks of `chunk_size` to keep per-task overhead low, and at most
+    two chunks per worker are in flight so huge folders don't queue everything up front.
+    A failing or slow file only produces an error record for that file. A native crash takes
+    down the whole pool, so the files that were in flight are retried alone, one at a time, on a
+    fresh pool; only the file that crashes it again is reported as "Worker crashed".
+
+    Parameters:
+    - file_paths (list): Resume files to parse.
+    - workers (int): Number of worker processes (default: CPU count).
+    - chunk_size (int): Files per submitted task.
+    - timeout (float): Per-file time budget in seconds (None disables it).
+    - use_cache (bool): Whether to use the parsed-resume cache.
+    - include_text (bool): Also return each resume's raw text under "text".
+
+    Returns:
+    - iterator: One record per file ({"file", "status", "data" | "error", "elapsed"}), in completion order.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = iter([file_paths[i:i + chunk_size] for i in range(0, len(file_paths), chunk_size)])
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    in_flight = {}  # future -> (chunk, the pool it runs on, whether it ran alone)
+    suspects = deque()  # files that were in flight when a pool broke
+
+    def restart(broken):
+        nonlocal pool
+        # A native crash in a worker poisons the whole pool; start a fresh one (once per crash)
+        if pool is broken:
+            pool.shutdown(wait=False)
+            pool = ProcessPoolExecutor(max_workers=workers)
+
+    def submit(chunk, alone):
+        try:
+            future = pool.submit(_parse_chunk, chunk, timeout, use_cache, include_text)
+        except BrokenProcessPool:
+            restart(pool)
+            future = pool.submit(_parse_chunk, chunk, timeout, use_cache, include_text)
+        in_flight[future] = (chunk, pool, alone)
+
+    def fill():
+        while len(in_flight) < workers * 2:
+            if suspects:
+                # Suspects run alone so a crash can only be blamed on the file that caused it
+                if in_flight:
+                    return
+                submit([suspects.popleft()], alone=True)
+            else:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                submit(chunk, alone=False)
+
+    try:
+        fill()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk, owner, alone = in_flight.pop(future)
+                try:
+                    records = future.result()
+                except BrokenProcessPool as e:
+                    restart(owner)
+                    if alone:
+                        records = [{"file": chunk[0], "status": "error", "error": f"Worker crashed: {e!r}"}]
+                    else:
+                        suspects.extend(chunk)
+                        records = []
+                except Exception as e:
+                    records = [{"file": path, "status": "error", "error": f"Worker crashed: {e!r}"} for path in chunk]
+                yield from records
+            fill()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk-parse a folder of PDF/DOCX resumes into JSONL.")
+    parser.add_argument("path", help="Resume file or folder (searched recursively)")
+    parser.add_argument("-o", "--output", help="Write JSONL here instead of stdout")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=8, help="Files per submitted task")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-file timeout in seconds (0 disables)")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the parsed-resume cache")
+    parser.add_argument("--index", nargs="?", const="", metavar="DIR",
+                        help="Also add resumes to the vector index (default: the shared index)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    file_paths = find_resumes(args.path)
+    logger.info(f"Found {len(file_paths)} resumes under {args.path}")
+
+    index = None
+    if args.index is not None:
+        from hr_buddy.utils.vector_index import VectorIndex, RESUME
+        index = VectorIndex(args.index or None)
+    pending = []
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failures = 0
+    start = time.perf_counter()
+    try:
+        records = ingest(file_paths, args.workers, args.chunk_size, args.timeout or None, not args.no_cache,
+                         include_text=index is not None)
+        for done, record in enumerate(records, 1):
+            failures += record["status"] != "ok"
+            if index is not None and record["status"] == "ok":
+                pending.append((os.path.abspath(record["file"]), record.pop("text"), {"name": record["data"].get("name")}))
+                if len(pending) >= INDEX_BATCH_SIZE:
+                    index.add_many(pending, RESUME)
+                    pending = []
+            out.write(json.dumps(record) + "\n")
+            if done % 100 == 0 or done == len(file_paths):
+                rate = done / (time.perf_counter() - start)
+                logger.info(f"[{done}/{len(file_paths)}] {failures} failed, {rate:.1f} files/s")
+    finally:
+        if pending:
+            index.add_many(pending, RESUME)
+        if out is not sys.stdout:
+            out.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,421 @@
+import io
+import sys
+import json
+import time
+import uuid
+import sqlite3
+import argparse
+import logging
+import threading
+import traceback
+from contextlib import contextmanager
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional, Dict, Any, Callable, List, Set
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from hr_buddy.utils.disk_cache import default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESULT_TTL = 24 * 60 * 60  # seconds a finished job's result is kept
+DEFAULT_LEASE = 60.0  # seconds a claimed job stays owned by its worker without a heartbeat
+MAX_ATTEMPTS = 3  # claims of a job whose workers kept disappearing before it is failed
+
+# Job states. A job moves queued -> running -> succeeded | failed | timed_out, or straight from
+# queued to expired if its deadline passes before a worker picks it up. A running job whose
+# worker stops heartbeating (e.g. the process restarted) goes back to queued, or to failed after
+# MAX_ATTEMPTS claims; one still running at its deadline is timed_out.
+QUEUED, RUNNING, SUCCEEDED, FAILED, TIMED_OUT, EXPIRED = (
+    "queued", "running", "succeeded", "failed", "timed_out", "expired")
+FINISHED_STATES = (SUCCEEDED, FAILED, TIMED_OUT, EXPIRED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    idempotency_key TEXT UNIQUE,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    deadline_at REAL,
+    expires_at REAL,
+    lease_expires_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS artifacts (
+    job_id TEXT NOT NULL REFERENCES jobs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (job_id, name)
+);
+"""
+# Columns added after the first release, for databases created before them
+_MIGRATIONS = {
+    "lease_expires_at": "ALTER TABLE jobs ADD COLUMN lease_expires_at REAL",
+    "attempts": "ALTER TABLE jobs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0",
+}
+# Jobs with one of these states keep their idempotency key; resubmitting after anything else retries
+_REUSABLE_STATES = (QUEUED, RUNNING, SUCCEEDED)
+
+
+class JobQueue:
+    """
+    Durable job queue backed by a local SQLite file; no broker needed.
+
+    Several processes (e.g. Streamlit sessions and a standalone worker) can share one database.
+    A claimed job is leased to its worker for `lease` seconds and the worker renews the lease
+    with `heartbeat` while the handler runs, so jobs held by a worker that died are reclaimed
+    by the next `claim`. Handler results are stored as JSON; any bytes/BytesIO values in them (generated PDFs) are
+    stored as binary artifacts alongside and returned as bytes by `result`.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, result_ttl: float = DEFAULT_RESULT_TTL,
+                 lease: float = DEFAULT_LEASE):
+        self.db_path = db_path or default_cache_dir("jobs.sqlite3")
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.result_ttl = result_ttl
+        self.lease = lease
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for column, statement in _MIGRATIONS.items():
+                if column not in columns:
+                    try:
+                        conn.execute(statement)
+                    except sqlite3.OperationalError:
+                        pass  # Another process added it first
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys=ON")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def submit(self, params: Dict[str, Any], idempotency_key: Optional[str] = None,
+               deadline: Optional[float] = None) -> str:
+        """
+        Enqueues a job.
+
+        Parameters:
+        - params (dict): JSON-serializable keyword arguments for the handler.
+        - idempotency_key (str): Submitting the same key again returns the existing job's id while
+          that job is queued, running or succeeded; after it failed, timed out or expired a new
+          job is created (optional).
+        - deadline (float): Seconds from now by which the job must finish (optional).
+
+        Returns:
+        - str: The job id.
+        """
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if idempotency_key is not None:
+                    row = conn.execute("SELECT id, status FROM jobs WHERE idempotency_key = ?",
+                                       (idempotency_key,)).fetchone()
+                    if row and row["status"] in _REUSABLE_STATES:
+                        conn.execute("COMMIT")
+                        return row["id"]
+                    if row:
+                        # Keep the old job (and its error) until it expires, but let this one retry
+                        conn.execute("UPDATE jobs SET idempotency_key = NULL WHERE id = ?", (row["id"],))
+                conn.execute(
+                    "INSERT INTO jobs (id, idempotency_key, status, params, created_at, deadline_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (job_id, idempotency_key, QUEUED, json.dumps(params), now,
+                     now + deadline if deadline is not None else None),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return job_id
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Returns the job's state and timestamps, or None if it doesn't exist (or was purged)."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id, status, error, created_at, started_at, finished_at, deadline_at, expires_at "
+                "FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Returns a succeeded job's result (artifacts as bytes), or None if not available."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT status, result FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if not row or row["status"] != SUCCEEDED:
+                return None
+            result = json.loads(row["result"])
+            for artifact in conn.execute("SELECT name, data FROM artifacts WHERE job_id = ?", (job_id,)):
+                result[artifact["name"]] = bytes(artifact["data"])
+        return result
+
+    def _reclaim(self, conn: sqlite3.Connection, now: float) -> None:
+        """Settles jobs nobody will finish: past their deadline, or held by a worker that stopped heartbeating."""
+        conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, expires_at = ?, error = ? "
+            "WHERE status = ? AND deadline_at IS NOT NULL AND deadline_at <= ?",
+            (EXPIRED, now, now + self.result_ttl, "Deadline passed before the job started", QUEUED, now),
+        )
+        conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, expires_at = ?, lease_expires_at = NULL, error = ? "
+            "WHERE status = ? AND deadline_at IS NOT NULL AND deadline_at <= ?",
+            (TIMED_OUT, now, now + self.result_ttl, "Job exceeded its deadline", RUNNING, now),
+        )
+        # Jobs from before leases existed have none; treat them as abandoned too
+        lost = "status = ? AND (lease_expires_at IS NULL OR lease_expires_at <= ?)"
+        conn.execute(
+            f"UPDATE jobs SET status = ?, finished_at = ?, expires_at = ?, lease_expires_at = NULL, error = ? "
+            f"WHERE {lost} AND attempts >= ?",
+            (FAILED, now, now + self.result_ttl, "The worker running this job stopped responding", RUNNING, now,
+             MAX_ATTEMPTS),
+        )
+        requeued = conn.execute(
+            f"UPDATE jobs SET status = ?, started_at = NULL, lease_expires_at = NULL WHERE {lost}",
+            (QUEUED, RUNNING, now)).rowcount
+        if requeued:
+            logger.warning(f"Requeued {requeued} job(s) whose worker stopped responding")
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """
+        Atomically moves the oldest runnable job to `running` and returns it
+        ({"id", "params", "deadline_at", "attempt"}). Jobs past their deadline or lease are settled first.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._reclaim(conn, now)
+                row = conn.execute(
+                    "SELECT id, params, deadline_at, attempts FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                    (QUEUED,)).fetchone()
+                if row:
+                    conn.execute("UPDATE jobs SET status = ?, started_at = ?, lease_expires_at = ?, attempts = ? "
+                                 "WHERE id = ?", (RUNNING, now, now + self.lease, row["attempts"] + 1, row["id"]))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        if not row:
+            return None
+        return {"id": row["id"], "params": json.loads(row["params"]), "deadline_at": row["deadline_at"],
+                "attempt": row["attempts"] + 1}
+
+    def heartbeat(self, job_id: str, attempt: Optional[int] = None) -> bool:
+        """Renews a running job's lease. Returns False if the job is no longer this worker's (it was reclaimed)."""
+        query = "UPDATE jobs SET lease_expires_at = ? WHERE id = ? AND status = ?"
+        args = [time.time() + self.lease, job_id, RUNNING]
+        if attempt is not None:
+            query += " AND attempts = ?"
+            args.append(attempt)
+        with self._connect() as conn:
+            return conn.execute(query, args).rowcount > 0
+
+    def _finish(self, job_id: str, status: str, result: Optional[Dict[str, Any]] = None,
+                error: Optional[str] = None, attempt: Optional[int] = None) -> None:
+        now = time.time()
+        artifacts = {}
+        if result is not None:
+            result = dict(result)
+            for name, value in list(result.items()):
+                if isinstance(value, io.BytesIO):
+                    value = value.getvalue()
+                if isinstance(value, (bytes, bytearray)):
+                    artifacts[name] = bytes(value)
+                    del result[name]
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # A worker whose job was reclaimed (and maybe claimed again) no longer owns it
+                query = ("UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, expires_at = ?, "
+                         "lease_expires_at = NULL WHERE id = ? AND status = ?")
+                args = [status, json.dumps(result) if result is not None else None, error, now,
+                        now + self.result_ttl, job_id, RUNNING]
+                if attempt is not None:
+                    query += " AND attempts = ?"
+                    args.append(attempt)
+                updated = conn.execute(query, args).rowcount
+                if updated:
+                    conn.executemany("INSERT OR REPLACE INTO artifacts (job_id, name, data) VALUES (?, ?, ?)",
+                                     [(job_id, name, data) for name, data in artifacts.items()])
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def complete(self, job_id: str, result: Dict[str, Any], attempt: Optional[int] = None) -> None:
+        self._finish(job_id, SUCCEEDED, result=result, attempt=attempt)
+
+    def fail(self, job_id: str, error: str, status: str = FAILED, attempt: Optional[int] = None) -> None:
+        self._finish(job_id, status, error=error, attempt=attempt)
+
+    def purge_expired(self) -> int:
+        """Deletes finished jobs (and their artifacts) whose results have expired. Returns the count."""
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM jobs WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                                (time.time(),)).rowcount
+
+
+def run_crew_job(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Default handler: runs the HR Buddy pipeline in memory and returns the PDFs as bytes."""
+    from hr_buddy.crew import HRBuddyCrew
+
+    results = HRBuddyCrew().run_crew_concurrent(**params, in_memory=True)
+    return {
+        "resume_pdf": results["resume_pdf"].getvalue(),
+        "interview_pdf": results["interview_pdf"].getvalue(),
+        "timings": results["timings"],
+    }
+
+
+class WorkerPool:
+    """
+    Background threads that claim jobs from a JobQueue and run them through `handler`.
+
+    Handlers run on an executor with exactly `concurrency` threads, and the worker renews the
+    job's lease while it waits. A job still running at its deadline is marked `timed_out` and
+    the worker moves on, but the abandoned handler call keeps its executor slot until it
+    actually returns, so workers stop claiming jobs while abandoned calls fill the pool instead
+    of queueing new jobs behind them. `abandoned()` reports how many are still running.
+    """
+
+    def __init__(self, queue: JobQueue, handler: Callable[[Dict[str, Any]], Dict[str, Any]] = run_crew_job,
+                 concurrency: int = 2, poll_interval: float = 0.5, purge_interval: float = 300.0):
+        self.queue = queue
+        self.handler = handler
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.purge_interval = purge_interval
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="hr-buddy-job")
+        # One slot per executor thread, held from claim until the handler call returns
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._abandoned_lock = threading.Lock()
+        self._abandoned: Set[Future] = set()
+
+    def start(self) -> "WorkerPool":
+        for index in range(self.concurrency):
+            thread = threading.Thread(target=self._work, name=f"hr-buddy-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, wait: bool = True) -> None:
+        self._stop.set()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def abandoned(self) -> int:
+        """Number of timed-out handler calls that are still running."""
+        with self._abandoned_lock:
+            return len(self._abandoned)
+
+    def _abandon(self, future: Future) -> None:
+        with self._abandoned_lock:
+            self._abandoned.add(future)
+        future.add_done_callback(self._forget)
+        logger.warning(f"{self.abandoned()} timed-out handler call(s) still running")
+
+    def _forget(self, future: Future) -> None:
+        with self._abandoned_lock:
+            self._abandoned.discard(future)
+
+    def run_one(self) -> bool:
+        """Claims and runs a single job. Returns False if the queue was empty or every slot is busy."""
+        if not self._slots.acquire(blocking=False):
+            return False
+        try:
+            job = self.queue.claim()
+            if job is None:
+                self._slots.release()
+                return False
+            future = self._executor.submit(self.handler, job["params"])
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            result = self._wait(job, future)
+            if result is None:
+                self.queue.fail(job["id"], "Job exceeded its deadline", status=TIMED_OUT, attempt=job["attempt"])
+                self._abandon(future)
+                logger.warning(f"Job {job['id']} timed out")
+            else:
+                self.queue.complete(job["id"], result, attempt=job["attempt"])
+                logger.info(f"Job {job['id']} succeeded")
+        except Exception as e:
+            self.queue.fail(job["id"], str(e), attempt=job["attempt"])
+            logger.error(f"Job {job['id']} failed: {e}")
+            logger.debug(traceback.format_exc())
+        return True
+
+    def _wait(self, job: Dict[str, Any], future: Future) -> Optional[Dict[str, Any]]:
+        """Waits for the handler, renewing the lease meanwhile. Returns None once the deadline passes."""
+        deadline = job["deadline_at"]
+        while True:
+            timeout = self.queue.lease / 3
+            if deadline is not None:
+                timeout = min(timeout, max(deadline - time.time(), 0))
+            try:
+                return future.result(timeout=timeout)
+            except FutureTimeoutError:
+                if deadline is not None and time.time() >= deadline:
+                    return None
+                if not self.queue.heartbeat(job["id"], job["attempt"]):
+                    logger.warning(f"Lost the lease on job {job['id']}; its result will be discarded")
+
+    def _work(self) -> None:
+        last_purge = 0.0
+        while not self._stop.is_set():
+            try:
+                if time.time() - last_purge > self.purge_interval:
+                    last_purge = time.time()
+                    self.queue.purge_expired()
+                if not self.run_one():
+                    self._stop.wait(self.poll_interval)
+            except Exception as e:
+                logger.error(f"Worker error: {e}")
+                self._stop.wait(self.poll_interval)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run HR Buddy job workers against the local job queue.")
+    parser.add_argument("--db", help="Path to the queue database (default: in the HR Buddy cache dir)")
+    parser.add_argument("-w", "--workers", type=int, default=2, help="Number of concurrent jobs")
+    parser.add_argument("--metrics-port", type=int, help="Serve Prometheus metrics on this port (optional)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    if args.metrics_port:
+        from hr_buddy.utils.tracing import serve_metrics
+        serve_metrics(args.metrics_port)
+        logger.info(f"Serving metrics on :{args.metrics_port}/metrics")
+    pool = WorkerPool(JobQueue(args.db), concurrency=args.workers).start()
+    logger.info(f"Started {args.workers} workers")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pool.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
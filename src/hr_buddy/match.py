@@ -0,0 +1,42 @@
+import sys
+import json
+import argparse
+import logging
+from pathlib import Path
+from typing import Optional, List
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from hr_buddy.utils.vector_index import VectorIndex, JOB, RESUME, content_hash
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Rank indexed resumes against a job description.")
+    parser.add_argument("job", help="Text file with the job description, or - for stdin")
+    parser.add_argument("-k", "--top-k", type=int, default=50, help="Number of candidates to return")
+    parser.add_argument("--index", help="Vector index directory (default: the shared index)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    if args.job == "-":
+        text = sys.stdin.read()
+    else:
+        with open(args.job, encoding="utf-8") as f:
+            text = f.read()
+
+    index = VectorIndex(args.index)
+    logger.info(f"Searching {len(index.documents(RESUME))} indexed resumes")
+
+    # Jobs are indexed too, so re-running the same posting skips embedding it
+    job_id = f"job:{content_hash(text)}"
+    index.add(job_id, text, kind=JOB, metadata={"source": args.job})
+    for rank, match in enumerate(index.similar(job_id, kind=RESUME, top_k=args.top_k), 1):
+        print(json.dumps({"rank": rank, **match}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+import os
+import re
+import json
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Any
+
+from hr_buddy.utils.stopwords import ENGLISH_STOPWORDS
+
+WORD_RE = re.compile(r'\b\w+\b')
+
+
+def get_stop_words() -> frozenset:
+    """Returns the English stopword set used for keyword extraction (bundled, no download needed)."""
+    return ENGLISH_STOPWORDS
+
+
+class ATSScorer:
+    """
+    Scores how well a resume covers a job posting's keywords.
+
+    Job keywords are deduplicated unigrams and bigrams weighted with BM25: term frequency in
+    the posting (saturated by `k1`, length-normalized by `b`) times an IDF learned from a
+    corpus of postings via `fit`. Without a corpus every term has IDF 1. A resume is reduced
+    to a set of terms once, so matching is a hash lookup per keyword.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, ngram_range: Tuple[int, int] = (1, 2),
+                 stop_words: Optional[Iterable[str]] = None):
+        self.k1 = k1
+        self.b = b
+        self.ngram_range = ngram_range
+        self.stop_words = frozenset(stop_words) if stop_words is not None else None
+        self.document_count = 0
+        self.average_length = 0.0
+        self.document_frequency: Dict[str, int] = {}
+
+    def terms(self, text: str) -> List[str]:
+        """Returns the text's keyword terms (stopwords and words under 3 characters removed), in order."""
+        stop_words = self.stop_words if self.stop_words is not None else get_stop_words()
+        words = [w for w in WORD_RE.findall(text.lower()) if w not in stop_words and len(w) > 2]
+        low, high = self.ngram_range
+        terms = list(words) if low == 1 else []
+        for n in range(max(low, 2), high + 1):
+            terms.extend(" ".join(words[i:i + n]) for i in range(len(words) - n + 1))
+        return terms
+
+    def fit(self, job_descriptions: Iterable[str]) -> "ATSScorer":
+        """Learns document frequencies (for IDF) and the average posting length from a corpus."""
+        document_frequency = Counter()
+        total_length = 0
+        count = 0
+        for description in job_descriptions:
+            terms = self.terms(description)
+            document_frequency.update(set(terms))
+            total_length += len(terms)
+            count += 1
+        self.document_count = count
+        self.average_length = total_length / count if count else 0.0
+        self.document_frequency = dict(document_frequency)
+        return self
+
+    def idf(self, term: str) -> float:
+        if not self.document_count:
+            return 1.0
+        df = self.document_frequency.get(term, 0)
+        return math.log(1 + (self.document_count - df + 0.5) / (df + 0.5))
+
+    def job_keywords(self, job_description: str, top_n: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Extracts deduplicated, weighted keywords from a job description.
+
+        Returns:
+        - list: (term, weight) pairs, highest weight first.
+        """
+        terms = self.terms(job_description)
+        counts = Counter(terms)
+        average_length = self.average_length or len(terms) or 1
+        length_norm = 1 - self.b + self.b * len(terms) / average_length
+
+        weights = {
+            term: self.idf(term) * tf * (self.k1 + 1) / (tf + self.k1 * length_norm)
+            for term, tf in counts.items()
+        }
+        # Ties keep first-occurrence order, so the ranking is stable
+        ranked = sorted(weights.items(), key=lambda item: -item[1])
+        return ranked[:top_n] if top_n else ranked
+
+    def score(self, resume_text: str, job_description: str,
+              keywords: Optional[Sequence[Tuple[str, float]]] = None) -> Dict[str, Any]:
+        """
+        Scores a resume against a job description.
+
+        Parameters:
+        - resume_text (str): Resume text.
+        - job_description (str): Job description text.
+        - keywords (list): Precomputed `job_keywords` output, to reuse across resumes (optional).
+
+        Returns:
+        - dict: {"score": 0-100, "matched": [terms], "missing": [(term, weight), ...] highest weight first}.
+        """
+        keywords = keywords if keywords is not None else self.job_keywords(job_description)
+        resume_terms = set(self.terms(resume_text))
+
+        matched, missing = [], []
+        matched_weight = total_weight = 0.0
+        for term, weight in keywords:
+            total_weight += weight
+            if term in resume_terms:
+                matched.append(term)
+                matched_weight += weight
+            else:
+                missing.append((term, weight))
+
+        score = 100.0 * matched_weight / total_weight if total_weight else 0.0
+        return {"score": round(score, 2), "matched": matched, "missing": missing}
+
+    def score_matrix(self, resume_texts: Sequence[str], job_descriptions: Sequence[str]):
+        """
+        Scores every resume against every job as one sparse matrix product.
+
+        Returns:
+        - numpy.ndarray: Shape (len(resume_texts), len(job_descriptions)); entry [i, j] equals
+          `score(resume_texts[i], job_descriptions[j])["score"]` before rounding.
+        """
+        import numpy as np
+        from scipy import sparse
+
+        vocabulary: Dict[str, int] = {}
+        rows, cols, values = [], [], []
+        for j, description in enumerate(job_descriptions):
+            keywords = self.job_keywords(description)
+            total = sum(weight for _, weight in keywords) or 1.0
+            for term, weight in keywords:
+                rows.append(j)
+                cols.append(vocabulary.setdefault(term, len(vocabulary)))
+                values.append(weight / total)
+        jobs = sparse.csr_matrix((values, (rows, cols)), shape=(len(job_descriptions), len(vocabulary)))
+
+        rows, cols = [], []
+        for i, text in enumerate(resume_texts):
+            for term in set(self.terms(text)):
+                column = vocabulary.get(term)
+                if column is not None:
+                    rows.append(i)
+                    cols.append(column)
+        resumes = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)),
+                                    shape=(len(resume_texts), len(vocabulary)))
+
+        return 100.0 * (resumes @ jobs.T).toarray()
+
+    def save(self, path: str) -> None:
+        """Saves the fitted corpus statistics as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"document_count": self.document_count, "average_length": self.average_length,
+                       "document_frequency": self.document_frequency}, f)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "ATSScorer":
+        """Creates a scorer from corpus statistics saved with `save`."""
+        with open(path, encoding="utf-8") as f:
+            stats = json.load(f)
+        scorer = cls(**kwargs)
+        scorer.document_count = stats["document_count"]
+        scorer.average_length = stats["average_length"]
+        scorer.document_frequency = stats["document_frequency"]
+        return scorer
+
+
+_default_scorer = None
+
+
+def get_ats_scorer() -> ATSScorer:
+    """Returns the shared scorer, with corpus statistics from $HR_BUDDY_ATS_STATS if set (else all IDFs are 1)."""
+    global _default_scorer
+    if _default_scorer is None:
+        stats_path = os.getenv("HR_BUDDY_ATS_STATS")
+        _default_scorer = ATSScorer.load(stats_path) if stats_path else ATSScorer()
+    return _default_scorer
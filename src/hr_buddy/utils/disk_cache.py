@@ -0,0 +1,130 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_dir(*parts: str) -> str:
+    """Returns HR Buddy's cache directory ($HR_BUDDY_CACHE_DIR, else ~/.cache/hr_buddy), joined with `parts`."""
+    root = os.getenv("HR_BUDDY_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "hr_buddy")
+    return os.path.join(root, *parts)
+
+
+def caching_disabled() -> bool:
+    """True when the HR_BUDDY_NO_CACHE environment variable opts out of all on-disk caches."""
+    return os.getenv("HR_BUDDY_NO_CACHE", "").lower() in ("1", "true", "yes")
+
+
+class DiskCache:
+    """
+    A small JSON-on-disk key/value cache.
+
+    Entries live in one file each, named by the SHA-256 of the key. Reads refresh the file's
+    mtime, so when the directory grows past `max_bytes` the least recently used entries are
+    evicted first. Entries older than `ttl` seconds are treated as missing.
+    """
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None, ttl: Optional[float] = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest + ".json")
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """Returns the cached value for `key`, or None if it is missing, expired or unreadable."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            self.delete(key)
+            return None
+
+        ttl = self.ttl if ttl is None else ttl
+        if ttl is not None and time.time() - entry.get("stored_at", 0) > ttl:
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """Stores a JSON-serializable `value` under `key`, evicting old entries if over budget."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "stored_at": time.time(), "value": value}, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if self.max_bytes is not None:
+            self.evict()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for path, _, _ in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _entries(self):
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((path, st.st_mtime, st.st_size))
+        return entries
+
+    def size(self) -> int:
+        """Total bytes used by cache entries."""
+        return sum(size for _, _, size in self._entries())
+
+    def evict(self) -> None:
+        """Removes least recently used entries until the cache fits in `max_bytes`."""
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, _, size in entries)
+            for path, _, size in sorted(entries, key=lambda entry: entry[1]):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except FileNotFoundError:
+                    pass
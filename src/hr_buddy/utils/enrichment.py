@@ -0,0 +1,384 @@
+import os
+import re
+import time
+import logging
+import threading
+import contextvars
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from hr_buddy.utils.disk_cache import DiskCache, default_cache_dir, caching_disabled
+from hr_buddy.utils.fetcher import DEFAULT_USER_AGENT, get_fetcher
+from hr_buddy.utils.tracing import span, record
+from hr_buddy.utils.urls import GITHUB_LOGIN_RE, normalize_url
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+DEFAULT_ENRICHMENT_TTL = 6 * 60 * 60  # seconds a fetched profile is reused
+ENRICHMENT_CACHE_MAX_BYTES = 128 * 1024 * 1024
+MAX_REPOS = 100  # repositories summarized per user
+TOP_REPOS = 10
+GRAPHQL_BATCH_SIZE = 10  # users per batched GraphQL query
+
+LINK_NEXT_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+_REPO_FIELDS = """
+    totalCount
+    pageInfo { hasNextPage endCursor }
+    nodes { name description url stargazerCount forkCount pushedAt primaryLanguage { name } }
+"""
+_USER_FIELDS = f"""
+    login name bio company location websiteUrl url
+    followers {{ totalCount }}
+    repositories(first: $first, ownerAffiliations: OWNER, isFork: false,
+                 orderBy: {{field: STARGAZERS, direction: DESC}}) {{ {_REPO_FIELDS} }}
+"""
+_REPOS_PAGE_QUERY = f"""
+query($login: String!, $first: Int!, $after: String) {{
+  user(login: $login) {{
+    repositories(first: $first, after: $after, ownerAffiliations: OWNER, isFork: false,
+                 orderBy: {{field: STARGAZERS, direction: DESC}}) {{ {_REPO_FIELDS} }}
+  }}
+}}
+"""
+
+
+class EnrichmentError(Exception):
+    """Raised when a profile source cannot be fetched (after retries) or returns an error."""
+
+
+class RateLimitError(EnrichmentError):
+    """Raised when the GitHub rate limit resets later than the client is willing to wait."""
+
+
+def github_login(url: str) -> str:
+    """Returns the user name from a GitHub profile URL (or a bare login)."""
+    parts = urlsplit(url if "//" in url else f"https://github.com/{url}")
+    login = parts.path.strip("/").split("/")[0]
+    if not GITHUB_LOGIN_RE.match(login):
+        raise ValueError(f"Not a GitHub profile URL: {url}")
+    return login
+
+
+class GitHubClient:
+    """
+    Fetches GitHub profiles through the API instead of scraping profile pages.
+
+    With a token ($GITHUB_TOKEN), one GraphQL query returns the profile and its top
+    repositories, and `fetch_profiles` batches several users into one query. Without a token
+    the REST API is used (profile plus paginated repository list). Rate-limit responses are
+    retried after the reset time GitHub reports, as long as that is within `max_wait` seconds;
+    server errors are retried with exponential backoff.
+    """
+
+    def __init__(self, token: Optional[str] = None, base_url: Optional[str] = None, timeout=(5, 20),
+                 max_retries: int = 3, backoff_factor: float = 0.5, max_wait: float = 60.0,
+                 max_repos: int = MAX_REPOS, session: Optional[requests.Session] = None):
+        self.token = token if token is not None else os.getenv("GITHUB_TOKEN")
+        self.base_url = (base_url or os.getenv("HR_BUDDY_GITHUB_API") or GITHUB_API_URL).rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_wait = max_wait
+        self.max_repos = max_repos
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        self.session.headers.update({"Accept": "application/vnd.github+json", "User-Agent": DEFAULT_USER_AGENT})
+        if self.token:
+            self.session.headers["Authorization"] = f"Bearer {self.token}"
+
+    def _wait_time(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying `response`, or None if it should not be retried."""
+        if response.status_code in (403, 429):
+            if response.headers.get("Retry-After"):
+                return float(response.headers["Retry-After"])
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                reset = float(response.headers.get("X-RateLimit-Reset", 0))
+                return max(reset - time.time(), 0) + 1
+            return None
+        if response.status_code >= 500:
+            return self.backoff_factor * (2 ** attempt)
+        return None
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        for attempt in range(self.max_retries + 1):
+            with span("github.request"):
+                response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+                record(bytes_fetched=len(response.content))
+            wait = self._wait_time(response, attempt)
+            if wait is None or attempt == self.max_retries:
+                break
+            if wait > self.max_wait:
+                raise RateLimitError(f"GitHub rate limit exceeded; resets in {wait:.0f}s")
+            logger.warning(f"GitHub returned {response.status_code}; retrying in {wait:.1f}s")
+            time.sleep(wait)
+
+        if response.status_code in (403, 429) and response.headers.get("X-RateLimit-Remaining") == "0":
+            raise RateLimitError("GitHub rate limit exceeded")
+        return response
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        response = self._request("POST", f"{self.base_url}/graphql", json={"query": query, "variables": variables})
+        if response.status_code != 200:
+            raise EnrichmentError(f"GitHub GraphQL request failed with status {response.status_code}")
+        payload = response.json()
+        errors = [error for error in payload.get("errors") or [] if error.get("type") != "NOT_FOUND"]
+        if errors:
+            if any(error.get("type") == "RATE_LIMITED" for error in errors):
+                raise RateLimitError("GitHub GraphQL rate limit exceeded")
+            raise EnrichmentError(f"GitHub GraphQL error: {errors[0].get('message')}")
+        return payload.get("data") or {}
+
+    def _more_repos(self, login: str, connection: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Follows a repository connection's cursor until `max_repos` repositories are collected."""
+        repos = list(connection["nodes"])
+        page_info = connection["pageInfo"]
+        while page_info["hasNextPage"] and len(repos) < self.max_repos:
+            data = self._graphql(_REPOS_PAGE_QUERY, {"login": login, "first": min(100, self.max_repos - len(repos)),
+                                                     "after": page_info["endCursor"]})
+            connection = data["user"]["repositories"]
+            repos.extend(connection["nodes"])
+            page_info = connection["pageInfo"]
+        return repos
+
+    def _fetch_graphql(self, logins: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        aliases = {f"u{i}": login for i, login in enumerate(logins)}
+        # Logins are passed as variables, never spliced into the query text
+        params = "".join(f", $l{alias[1:]}: String!" for alias in aliases)
+        fields = "\n".join(f"{alias}: user(login: $l{alias[1:]}) {{ {_USER_FIELDS} }}" for alias in aliases)
+        variables = {f"l{alias[1:]}": login for alias, login in aliases.items()}
+        variables["first"] = min(100, self.max_repos)
+        data = self._graphql(f"query($first: Int!{params}) {{ {fields} }}", variables)
+
+        profiles = {}
+        for alias, login in aliases.items():
+            user = data.get(alias)
+            if user is None:
+                profiles[login] = None
+                continue
+            repos = [{
+                "name": repo["name"],
+                "description": repo["description"],
+                "url": repo["url"],
+                "stars": repo["stargazerCount"],
+                "forks": repo["forkCount"],
+                "language": (repo["primaryLanguage"] or {}).get("name"),
+                "pushed_at": repo["pushedAt"],
+            } for repo in self._more_repos(login, user["repositories"])]
+            profiles[login] = _summarize(login, {
+                "name": user["name"], "bio": user["bio"], "company": user["company"],
+                "location": user["location"], "blog": user["websiteUrl"], "html_url": user["url"],
+                "followers": user["followers"]["totalCount"], "public_repos": user["repositories"]["totalCount"],
+            }, repos)
+        return profiles
+
+    def _fetch_rest(self, login: str) -> Optional[Dict[str, Any]]:
+        response = self._request("GET", f"{self.base_url}/users/{login}")
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            raise EnrichmentError(f"GitHub profile request failed with status {response.status_code}")
+        user = response.json()
+
+        repos = []
+        url = f"{self.base_url}/users/{login}/repos"
+        params = {"per_page": min(100, self.max_repos), "type": "owner", "sort": "pushed"}
+        while url and len(repos) < self.max_repos:
+            response = self._request("GET", url, params=params)
+            if response.status_code != 200:
+                raise EnrichmentError(f"GitHub repository request failed with status {response.status_code}")
+            repos.extend({
+                "name": repo["name"],
+                "description": repo.get("description"),
+                "url": repo.get("html_url"),
+                "stars": repo.get("stargazers_count", 0),
+                "forks": repo.get("forks_count", 0),
+                "language": repo.get("language"),
+                "pushed_at": repo.get("pushed_at"),
+            } for repo in response.json() if not repo.get("fork"))
+            # The next-page URL already carries the query string
+            match = LINK_NEXT_RE.search(response.headers.get("Link", ""))
+            url, params = (match.group(1), None) if match else (None, None)
+        return _summarize(login, user, repos[:self.max_repos])
+
+    def fetch_profiles(self, logins: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetches several users' profiles and repository summaries.
+
+        Returns:
+        - dict: {login: profile summary, or None if the user does not exist}.
+        """
+        logins = list(dict.fromkeys(logins))
+        profiles = {}
+        if self.token:
+            for i in range(0, len(logins), GRAPHQL_BATCH_SIZE):
+                profiles.update(self._fetch_graphql(logins[i:i + GRAPHQL_BATCH_SIZE]))
+        else:
+            for login in logins:
+                profiles[login] = self._fetch_rest(login)
+        return profiles
+
+    def fetch_profile(self, login: str) -> Optional[Dict[str, Any]]:
+        return self.fetch_profiles([login])[login]
+
+
+def _summarize(login: str, user: Dict[str, Any], repos: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Reduces a GitHub user and their repositories to what resume tailoring needs."""
+    languages = Counter(repo["language"] for repo in repos if repo["language"])
+    top_repos = sorted(repos, key=lambda repo: (-repo["stars"], repo["name"]))[:TOP_REPOS]
+    return {
+        "login": login,
+        "name": user.get("name"),
+        "bio": user.get("bio"),
+        "company": user.get("company"),
+        "location": user.get("location"),
+        "blog": user.get("blog"),
+        "followers": user.get("followers"),
+        "public_repos": user.get("public_repos"),
+        "profile_url": user.get("html_url") or f"https://github.com/{login}",
+        "languages": [language for language, _ in languages.most_common()],
+        "top_repos": top_repos,
+        "total_stars": sum(repo["stars"] for repo in repos),
+    }
+
+
+def _page_title(html: str) -> Optional[str]:
+    import lxml.etree
+    import lxml.html
+
+    try:
+        title = lxml.html.fromstring(html).findtext(".//title")
+    except (ValueError, lxml.etree.ParserError):  # Empty or unparseable body
+        return None
+    return title.strip() if title else None
+
+
+class ProfileEnricher:
+    """
+    Fetches a candidate's LinkedIn and GitHub data concurrently, caching each profile on disk.
+
+    Failures are reported per source as {"error": ...} so one unavailable profile does not
+    fail the whole request.
+    """
+
+    def __init__(self, github: Optional[GitHubClient] = None, cache: Optional[DiskCache] = None,
+                 ttl: float = DEFAULT_ENRICHMENT_TTL, max_workers: int = 8):
+        self.github_client = github or GitHubClient()
+        if cache is None and not caching_disabled():
+            cache = DiskCache(default_cache_dir("enrichment"), max_bytes=ENRICHMENT_CACHE_MAX_BYTES)
+        self.cache = cache
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hr-buddy-enrich")
+
+    def _cached(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.cache is None:
+            return None
+        value = self.cache.get(key, ttl=self.ttl)
+        record(**{"cache_hits" if value is not None else "cache_misses": 1})
+        return value
+
+    def _store(self, key: str, value: Dict[str, Any]) -> None:
+        if self.cache is not None:
+            self.cache.set(key, value)
+
+    def github(self, url: str) -> Dict[str, Any]:
+        """Returns a GitHub profile summary, or {"error": ...}."""
+        with span("enrich.github"):
+            try:
+                login = github_login(url)
+                key = f"github:{login.lower()}"
+                profile = self._cached(key)
+                if profile is None:
+                    profile = self.github_client.fetch_profile(login)
+                    if profile is None:
+                        return {"error": "GitHub profile not found", "profile_url": url}
+                    self._store(key, profile)
+                return profile
+            except (ValueError, EnrichmentError, requests.RequestException) as e:
+                logger.warning(f"GitHub enrichment failed for {url}: {e}")
+                return {"error": f"GitHub profile not accessible: {e}", "profile_url": url}
+
+    def prefetch_github(self, urls: Iterable[str]) -> None:
+        """Warms the cache for many GitHub profiles, batching API calls where possible (e.g. before a batch run)."""
+        logins = {}
+        for url in urls:
+            try:
+                login = github_login(url)
+            except ValueError:
+                continue
+            if self._cached(f"github:{login.lower()}") is None:
+                logins[login.lower()] = login
+        if not logins:
+            return
+        try:
+            profiles = self.github_client.fetch_profiles(logins.values())
+        except (EnrichmentError, requests.RequestException) as e:
+            logger.warning(f"GitHub prefetch failed: {e}")
+            return
+        for login, profile in profiles.items():
+            if profile is not None:
+                self._store(f"github:{login.lower()}", profile)
+
+    def linkedin(self, url: str) -> Dict[str, Any]:
+        """Returns the basic public LinkedIn profile info, or {"error": ...}."""
+        with span("enrich.linkedin"):
+            key = f"linkedin:{normalize_url(url)}"
+            profile = self._cached(key)
+            if profile is not None:
+                return profile
+            try:
+                response = get_fetcher().get(url)
+            except requests.RequestException:
+                return {"error": "LinkedIn profile not accessible", "profile_url": url}
+            if response.status_code != 200:
+                return {"error": "LinkedIn profile not accessible", "profile_url": url}
+            profile = {"name": _page_title(response.text), "profile_url": url}
+            self._store(key, profile)
+            return profile
+
+    def enrich(self, linkedin_url: Optional[str] = None, github_url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fetches both profiles at the same time.
+
+        Returns:
+        - dict: {"linkedin": profile | None, "github": profile | None}; None when no URL was given.
+        """
+        futures = {}
+        if linkedin_url:
+            futures["linkedin"] = self._executor.submit(_in_context(self.linkedin), linkedin_url)
+        if github_url:
+            futures["github"] = self._executor.submit(_in_context(self.github), github_url)
+        return {
+            "linkedin": futures["linkedin"].result() if "linkedin" in futures else None,
+            "github": futures["github"].result() if "github" in futures else None,
+        }
+
+
+def _in_context(fn):
+    """Wraps `fn` to run in a copy of the caller's context, so its spans nest under the caller's."""
+    context = contextvars.copy_context()
+    return lambda *args: context.run(fn, *args)
+
+
+_enricher = None
+_enricher_lock = threading.Lock()
+
+
+def get_profile_enricher() -> ProfileEnricher:
+    """Returns the process-wide profile enricher."""
+    global _enricher
+    with _enricher_lock:
+        if _enricher is None:
+            _enricher = ProfileEnricher()
+        return _enricher
@@ -0,0 +1,150 @@
+import os
+import json
+import logging
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from hr_buddy.utils.disk_cache import DiskCache, default_cache_dir, caching_disabled
+from hr_buddy.utils.tracing import traced, record
+from hr_buddy.utils.urls import normalize_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; HR-Buddy/1.0)"
+DEFAULT_TTL = 15 * 60  # seconds a cached page is served without revalidation
+FETCH_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Modes: "online" fetches normally; "offline" serves only cached entries (stale or not) and
+# never touches the network; "replay" serves any cached entry and only fetches (and records)
+# URLs it has never seen. Override with HR_BUDDY_FETCH_MODE.
+FETCH_MODES = ("online", "offline", "replay")
+
+
+class FetchError(requests.RequestException):
+    """Raised when a URL cannot be served, e.g. an uncached URL in offline mode."""
+
+
+class FetchResponse:
+    """The subset of a `requests.Response` HR Buddy needs, whether it came from the network or the cache."""
+
+    def __init__(self, url: str, status_code: int, text: str, headers: Dict[str, str], from_cache: bool = False):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers
+        self.from_cache = from_cache
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 400
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class Fetcher:
+    """
+    Shared HTTP GET layer: a pooled `requests.Session` with timeouts and bounded retries,
+    plus a TTL disk cache keyed by normalized URL with ETag/Last-Modified revalidation.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, timeout=(5, 20), retries: int = 3, backoff_factor: float = 0.5,
+                 pool_size: int = 20, cache: Optional[DiskCache] = None, mode: Optional[str] = None,
+                 user_agent: str = DEFAULT_USER_AGENT):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.mode = mode or os.getenv("HR_BUDDY_FETCH_MODE", "online")
+        if self.mode not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode '{self.mode}'. Use one of {FETCH_MODES}.")
+        if cache is None and not caching_disabled():
+            cache = DiskCache(default_cache_dir("http"), max_bytes=FETCH_CACHE_MAX_BYTES)
+        self.cache = cache
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = user_agent
+
+    @traced("http.get")
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, ttl: Optional[float] = None,
+            use_cache: bool = True) -> FetchResponse:
+        """
+        Fetches a URL, serving it from the cache while fresh and revalidating it once stale.
+
+        Parameters:
+        - url (str): URL to fetch.
+        - headers (dict): Extra request headers (optional).
+        - ttl (float): Overrides the fetcher's freshness window for this call (optional).
+        - use_cache (bool): Set False to bypass the cache entirely.
+
+        Returns:
+        - FetchResponse: The response. Non-2xx statuses are returned, not raised.
+        """
+        key = normalize_url(url)
+        cache = self.cache if use_cache else None
+        ttl = self.ttl if ttl is None else ttl
+
+        if cache is not None:
+            fresh = cache.get(key, ttl=None if self.mode != "online" else ttl)
+            if fresh is not None:
+                record(cache_hits=1)
+                return self._from_entry(fresh)
+        if self.mode == "offline":
+            raise FetchError(f"{url} is not cached and fetching is disabled (offline mode)")
+
+        stale = cache.get(key, ttl=float("inf")) if cache is not None else None
+        request_headers = dict(headers or {})
+        if stale:
+            if stale["headers"].get("etag"):
+                request_headers["If-None-Match"] = stale["headers"]["etag"]
+            if stale["headers"].get("last-modified"):
+                request_headers["If-Modified-Since"] = stale["headers"]["last-modified"]
+
+        response = self.session.get(url, headers=request_headers, timeout=self.timeout)
+        record(cache_misses=1, bytes_fetched=len(response.content))
+
+        if response.status_code == 304 and stale:
+            logger.debug(f"Revalidated cached copy of {url}")
+            cache.set(key, stale)  # Restart the TTL window
+            return self._from_entry(stale)
+
+        entry = {
+            "url": response.url,
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in ("etag", "last-modified", "content-type")
+                        if name in response.headers},
+            "text": response.text,
+        }
+        if cache is not None and response.status_code == 200:
+            cache.set(key, entry)
+        return FetchResponse(entry["url"], entry["status"], entry["text"], entry["headers"])
+
+    @staticmethod
+    def _from_entry(entry) -> FetchResponse:
+        return FetchResponse(entry["url"], entry["status"], entry["text"], entry["headers"], from_cache=True)
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_fetcher() -> Fetcher:
+    """Returns the process-wide shared Fetcher."""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = Fetcher()
+        return _fetcher
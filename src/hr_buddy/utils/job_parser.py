@@ -0,0 +1,361 @@
+import re
+import json
+import hashlib
+import logging
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from hr_buddy.utils.disk_cache import DiskCache, default_cache_dir, caching_disabled
+from hr_buddy.utils.resume_extractor import get_default_extractor
+from hr_buddy.utils.tracing import traced, record
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever parsing logic changes so stale cache entries are ignored.
+JOB_PARSER_VERSION = "2"
+JOB_CACHE_MAX_BYTES = 64 * 1024 * 1024
+MAX_DESCRIPTION_CHARS = 20000
+
+SKIP_TAGS = {"script", "style", "noscript", "nav", "footer", "header", "aside", "form", "svg", "iframe",
+             "template", "button", "select"}
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+LEAF_TAGS = {"p", "li", "dt", "dd", "td", "th", "pre", "blockquote"}
+BULLET_CHARS = "•·▪◦‣*-–—"
+
+# Checked in order: "Preferred qualifications" must count as preferred, not required
+SECTION_KEYWORDS = (
+    ("preferred", ("preferred", "nice to have", "nice-to-have", "bonus", "desired", "a plus", "pluses")),
+    ("responsibilities", ("responsibilit", "what you'll do", "what you will do", "what you’ll do", "duties",
+                          "the role", "your role", "day to day", "day-to-day", "your impact", "you will")),
+    ("requirements", ("requirement", "qualification", "what you bring", "what you'll bring", "must have",
+                      "must-have", "you have", "looking for", "skills", "about you", "who you are",
+                      "experience")),
+)
+
+SENIORITY_PATTERNS = (
+    ("intern", re.compile(r"\b(intern|internship|trainee|apprentice)\b", re.I)),
+    ("executive", re.compile(r"\b(director|vp|vice president|head of|chief|cto|ceo)\b", re.I)),
+    ("principal", re.compile(r"\b(principal|distinguished)\b", re.I)),
+    ("staff", re.compile(r"\bstaff\b", re.I)),
+    ("lead", re.compile(r"\b(lead|manager)\b", re.I)),
+    ("senior", re.compile(r"\b(senior|sr\.?)\b", re.I)),
+    ("junior", re.compile(r"\b(junior|jr\.?|entry[- ]level|graduate|associate)\b", re.I)),
+    ("mid", re.compile(r"\b(mid[- ]level|intermediate)\b", re.I)),
+)
+YEARS_RE = re.compile(r"(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?years?", re.I)
+LOCATION_RE = re.compile(r"^\s*location\s*[:\-]\s*(.+)$", re.I)
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class JobPosting:
+    """
+    A job posting reduced to the parts later stages use.
+
+    `str(posting)` is the compact text used for keyword extraction and prompting: title, skills,
+    requirements and responsibilities, falling back to the description when the posting has no
+    recognizable sections.
+    """
+
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    seniority: str = ""
+    required_skills: List[str] = field(default_factory=list)
+    preferred_skills: List[str] = field(default_factory=list)
+    requirements: List[str] = field(default_factory=list)
+    responsibilities: List[str] = field(default_factory=list)
+    description: str = ""
+    url: str = ""
+    source: str = ""  # "json-ld" or "html"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobPosting":
+        return cls(**{key: value for key, value in data.items() if key in cls.__dataclass_fields__})
+
+    def is_empty(self) -> bool:
+        return not (self.title or self.description or self.requirements or self.responsibilities)
+
+    def keyword_text(self) -> str:
+        parts = [self.title]
+        if self.required_skills or self.preferred_skills:
+            parts.append("Skills: " + ", ".join(self.required_skills + self.preferred_skills))
+        parts.extend(self.requirements)
+        parts.extend(self.responsibilities)
+        if not (self.requirements or self.responsibilities):
+            parts.append(self.description)
+        return "\n".join(part for part in parts if part)
+
+    def __str__(self) -> str:
+        return self.keyword_text()
+
+
+def _clean(text: str) -> str:
+    return WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _lines(text: str) -> List[str]:
+    """Splits a block's text on line breaks, dropping bullet characters and empty lines."""
+    lines = []
+    for line in text.split("\n"):
+        line = _clean(line).lstrip(BULLET_CHARS).strip()
+        if line:
+            lines.append(line)
+    return lines
+
+
+def _section_kind(heading: str) -> Optional[str]:
+    heading = heading.lower()
+    for kind, keywords in SECTION_KEYWORDS:
+        if any(keyword in heading for keyword in keywords):
+            return kind
+    return None
+
+
+class _PageScan:
+    """What a single walk over the document collects: JSON-LD blobs, title candidates and sections."""
+
+    def __init__(self):
+        self.json_ld: List[str] = []
+        self.meta: Dict[str, str] = {}
+        self.title_tag = ""
+        self.h1 = ""
+        self.sections: List[List[Any]] = [["", []]]  # [heading, lines]
+
+    def add_lines(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            # Short "Requirements:" style lines act as headings in many postings
+            if line.endswith(":") and len(line) < 80 and _section_kind(line):
+                self.sections.append([line.rstrip(":"), []])
+            else:
+                self.sections[-1][1].append(line)
+
+    def walk(self, element) -> None:
+        tag = element.tag if isinstance(element.tag, str) else None
+        if tag is None:  # Comments and processing instructions
+            return
+        tag = tag.lower()
+
+        if tag == "script":
+            if "ld+json" in (element.get("type") or "").lower() and element.text:
+                self.json_ld.append(element.text)
+            return
+        if tag == "meta":
+            key = (element.get("property") or element.get("name") or "").lower()
+            if key and element.get("content"):
+                self.meta.setdefault(key, element.get("content"))
+            return
+        if tag == "title":
+            self.title_tag = self.title_tag or _clean(element.text_content())
+            return
+        if tag in SKIP_TAGS:
+            return
+        if tag in HEADING_TAGS:
+            heading = _clean(element.text_content())
+            if tag == "h1" and not self.h1:
+                self.h1 = heading
+            if heading:
+                self.sections.append([heading, []])
+            return
+        if tag in LEAF_TAGS:
+            self.add_lines(_lines(element.text_content()))
+            return
+
+        # Containers: loose text plus each child (and the text following it)
+        if element.text:
+            self.add_lines(_lines(element.text))
+        for child in element:
+            self.walk(child)
+            if child.tail:
+                self.add_lines(_lines(child.tail))
+
+
+def _scan(html: str) -> _PageScan:
+    import lxml.etree
+    import lxml.html
+
+    try:
+        root = lxml.html.fromstring(html)
+    except lxml.etree.ParserError:  # Blank body, or nothing but comments: an empty posting
+        return _PageScan()
+    # Keep <br> line breaks in text_content() so "<p>a<br>b</p>" reads as two lines
+    for br in root.iter("br"):
+        br.tail = "\n" + (br.tail or "")
+    scan = _PageScan()
+    scan.walk(root)
+    return scan
+
+
+def _find_job_posting_ld(blobs: Iterable[str]) -> Optional[Dict[str, Any]]:
+    for blob in blobs:
+        try:
+            data = json.loads(blob)
+        except ValueError:
+            continue
+        stack = [data]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(item)
+            elif isinstance(item, dict):
+                types = item.get("@type")
+                if types == "JobPosting" or (isinstance(types, list) and "JobPosting" in types):
+                    return item
+                if "@graph" in item:
+                    stack.append(item["@graph"])
+    return None
+
+
+def _ld_text(value: Any) -> str:
+    if isinstance(value, list):
+        return "\n".join(_ld_text(item) for item in value)
+    if isinstance(value, dict):
+        return _ld_text(value.get("name") or value.get("description") or "")
+    return str(value) if value is not None else ""
+
+
+def _ld_location(data: Dict[str, Any]) -> str:
+    locations = data.get("jobLocation") or []
+    if isinstance(locations, dict):
+        locations = [locations]
+    names = []
+    for location in locations:
+        address = location.get("address", {}) if isinstance(location, dict) else {}
+        if isinstance(address, str):
+            names.append(address)
+            continue
+        country = address.get("addressCountry")
+        if isinstance(country, dict):
+            country = country.get("name")
+        parts = [address.get("addressLocality"), address.get("addressRegion"), country]
+        names.append(", ".join(part for part in parts if part))
+    if "TELECOMMUTE" in str(data.get("jobLocationType", "")).upper():
+        names.append("Remote")
+    return "; ".join(dict.fromkeys(name for name in names if name))
+
+
+def _html_lines(value: Any) -> List[str]:
+    """Lines of a JSON-LD field, which may hold plain text or an HTML fragment."""
+    text = _ld_text(value)
+    if "<" in text:
+        scan = _scan(f"<div>{text}</div>")
+        return [line for heading, lines in scan.sections for line in ([heading] if heading else []) + lines]
+    return _lines(text)
+
+
+def _seniority(title: str, requirements: Iterable[str]) -> str:
+    for level, pattern in SENIORITY_PATTERNS:
+        if pattern.search(title):
+            return level
+    years = [int(match.group(1)) for line in requirements for match in YEARS_RE.finditer(line)]
+    if not years:
+        return ""
+    years = min(years)
+    return "junior" if years < 2 else "mid" if years < 5 else "senior" if years < 8 else "staff"
+
+
+def _split_sections(scan: _PageScan) -> Dict[str, List[str]]:
+    grouped = {"requirements": [], "preferred": [], "responsibilities": [], "all": []}
+    for heading, lines in scan.sections:
+        kind = _section_kind(heading) if heading else None
+        if kind:
+            grouped[kind].extend(lines)
+        grouped["all"].extend(lines)
+    return grouped
+
+
+@traced("job.parse")
+def parse_job_posting(html: str, url: str = "") -> JobPosting:
+    """
+    Parses a job posting page into a JobPosting.
+
+    The document is walked once with lxml. If it embeds schema.org `JobPosting` JSON-LD (most
+    job boards do), the structured fields come from there and only the description fragment is
+    parsed further; otherwise title, company and sections are inferred from the page itself.
+
+    Parameters:
+    - html (str): The page's HTML.
+    - url (str): The page's URL, stored on the result (optional).
+
+    Returns:
+    - JobPosting: The structured posting.
+    """
+    scan = _scan(html)
+    extractor = get_default_extractor()
+    ld = _find_job_posting_ld(scan.json_ld)
+
+    if ld is not None:
+        description_scan = _scan(f"<div>{_ld_text(ld.get('description'))}</div>")
+        sections = _split_sections(description_scan)
+        sections["requirements"] += _html_lines(ld.get("qualifications")) + _html_lines(ld.get("experienceRequirements"))
+        sections["responsibilities"] += _html_lines(ld.get("responsibilities"))
+        ld_skills = [_clean(skill) for skill in re.split(r"[,\n;]", _ld_text(ld.get("skills"))) if _clean(skill)]
+        if extractor.taxonomy is not None:
+            ld_skills = [extractor.taxonomy.canonical(skill) or skill for skill in ld_skills]
+        posting = JobPosting(
+            title=_clean(_ld_text(ld.get("title"))),
+            company=_clean(_ld_text(ld.get("hiringOrganization"))),
+            location=_ld_location(ld),
+            source="json-ld",
+        )
+    else:
+        sections = _split_sections(scan)
+        ld_skills = []
+        location = next((match.group(1) for line in sections["all"] for match in [LOCATION_RE.match(line)] if match), "")
+        posting = JobPosting(
+            title=scan.meta.get("og:title") or scan.h1 or scan.title_tag,
+            company=scan.meta.get("og:site_name", ""),
+            location=_clean(location),
+            source="html",
+        )
+
+    posting.url = url
+    posting.requirements = list(dict.fromkeys(sections["requirements"]))
+    posting.responsibilities = list(dict.fromkeys(sections["responsibilities"]))
+    posting.description = "\n".join(sections["all"])[:MAX_DESCRIPTION_CHARS]
+
+    required_text = "\n".join(posting.requirements) if posting.requirements else posting.description
+    required = extractor.find_skills(required_text) + ld_skills
+    posting.required_skills = list(dict.fromkeys(required))
+    posting.preferred_skills = [skill for skill in extractor.find_skills("\n".join(sections["preferred"]))
+                                if skill not in posting.required_skills]
+    posting.seniority = _seniority(posting.title, posting.requirements or [posting.description])
+    return posting
+
+
+_job_cache = None
+
+
+def get_job_cache() -> DiskCache:
+    """Returns the process-wide parsed-posting cache."""
+    global _job_cache
+    if _job_cache is None:
+        _job_cache = DiskCache(default_cache_dir("jobs"), max_bytes=JOB_CACHE_MAX_BYTES)
+    return _job_cache
+
+
+def parse_job_page(html: str, url: str = "", use_cache: bool = True) -> JobPosting:
+    """
+    Like `parse_job_posting`, but cached on disk by URL + SHA-256 of the HTML + skills taxonomy +
+    JOB_PARSER_VERSION.
+
+    A page that has not changed since it was last parsed is never parsed again; a changed page
+    gets a new key. Pass `use_cache=False` (or set HR_BUDDY_NO_CACHE=1) to always parse.
+    """
+    use_cache = use_cache and not caching_disabled()
+    if use_cache:
+        digest = hashlib.sha256(html.encode('utf-8')).hexdigest()
+        cache_key = f"{url}:{digest}:{get_default_extractor().vocabulary_key}:{JOB_PARSER_VERSION}"
+        cached = get_job_cache().get(cache_key)
+        if cached is not None:
+            record(cache_hits=1)
+            return JobPosting.from_dict(cached)
+        record(cache_misses=1)
+
+    posting = parse_job_posting(html, url)
+    if use_cache:
+        get_job_cache().set(cache_key, posting.to_dict())
+    return posting
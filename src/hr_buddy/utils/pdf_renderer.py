@@ -0,0 +1,55 @@
+import io
+import os
+import uuid
+from typing import BinaryIO, Optional
+
+from hr_buddy.utils.templates import get_stylesheet
+from hr_buddy.utils.tracing import traced
+
+
+def unique_output_path(prefix: str, output_dir: Optional[str] = None, suffix: str = ".pdf") -> str:
+    """Returns a fresh path like `<output_dir>/<prefix>-<random hex>.pdf` (output_dir defaults to the CWD)."""
+    output_dir = output_dir or os.getcwd()
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, f"{prefix}-{uuid.uuid4().hex}{suffix}")
+
+
+@traced("pdf.render")
+def render_pdf(text: str, stream: Optional[BinaryIO] = None) -> io.BytesIO:
+    """
+    Renders text with HTML-like tags into a PDF held in memory.
+
+    Sections are separated by blank lines; each becomes a paragraph.
+
+    Parameters:
+    - text (str): Text formatted using ReportLab's paragraph markup.
+    - stream (file-like): If given, the finished PDF is also written to it (optional).
+
+    Returns:
+    - BytesIO: The PDF, positioned at the start.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = get_stylesheet()
+    content = []
+
+    for section in text.split("\n\n"):
+        content.append(Paragraph(section.strip(), styles["Normal"]))
+        content.append(Spacer(1, 12))
+
+    doc.build(content)
+    if stream is not None:
+        stream.write(buffer.getbuffer())
+    buffer.seek(0)
+    return buffer
+
+
+def write_pdf(text: str, file_path: str) -> str:
+    """Renders text to a PDF file at `file_path` and returns the path."""
+    buffer = render_pdf(text)
+    with open(file_path, "wb") as f:
+        f.write(buffer.getbuffer())
+    return file_path
@@ -0,0 +1,443 @@
+import os
+import re
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hr_buddy.utils.disk_cache import default_cache_dir
+from hr_buddy.utils.skills_taxonomy import SkillsTaxonomy, get_skills_taxonomy
+
+logger = logging.getLogger(__name__)
+
+QUESTION_BANK_VERSION = "1"
+DEFAULT_QUESTIONS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data",
+                                      "questions.txt")
+DEFAULT_QUESTION_COUNT = 10
+
+# Ordered lowest first, as `job_parser` reports them; "senior+" in the corpus means senior and above
+LEVELS = ("intern", "junior", "mid", "senior", "lead", "staff", "principal", "executive")
+ALL_LEVELS = (1 << len(LEVELS)) - 1
+# Questions are presented in this order, best match first within each category
+CATEGORIES = ("general", "technical", "system-design", "behavioral", "situational", "leadership")
+SKILL_PLACEHOLDER = "{skill}"
+
+# How much each kind of skill overlap adds to a question's score
+REQUIRED_WEIGHT = 3.0
+PREFERRED_WEIGHT = 1.5
+CANDIDATE_WEIGHT = 1.0
+# Score multiplier for a question written for a different seniority than the job's
+OFF_LEVEL_FACTOR = 0.25
+
+_DEDUPE_RE = re.compile(r"\W+")
+
+
+class Question(NamedTuple):
+    text: str
+    category: str
+    skills: Tuple[str, ...] = ()
+    source: str = "bank"  # "bank", "template" or "llm"
+
+
+def parse_levels(spec: str) -> int:
+    """Parses a level spec ("*", "senior", "junior-mid", "senior+", or a comma-separated list) into a bit mask."""
+    mask = 0
+    for part in (part.strip().lower() for part in spec.split(",")):
+        if part in ("*", ""):
+            return ALL_LEVELS
+        try:
+            if part.endswith("+"):
+                low, high = LEVELS.index(part[:-1]), len(LEVELS) - 1
+            elif "-" in part:
+                low, high = (LEVELS.index(level.strip()) for level in part.split("-", 1))
+            else:
+                low = high = LEVELS.index(part)
+        except ValueError:
+            raise ValueError(f"Unknown seniority level in '{spec}'. Use {', '.join(LEVELS)}.")
+        for index in range(low, high + 1):
+            mask |= 1 << index
+    return mask
+
+
+def load_questions_file(path: str) -> List[Tuple[str, int, List[str], str]]:
+    """
+    Loads a question bank file.
+
+    Each line is `category | levels | skills | question`; see the bundled questions.txt for the
+    details. Blank lines and `#` comments are ignored.
+
+    Returns:
+    - list: (category, level mask, skill names, question) tuples in file order.
+    """
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            fields = [field.strip() for field in line.split("|", 3)]
+            if len(fields) != 4 or not fields[3]:
+                raise ValueError(f"{path}:{number}: expected 'category | levels | skills | question'")
+            category, levels, skills, text = fields
+            if category not in CATEGORIES:
+                raise ValueError(f"{path}:{number}: unknown category '{category}'. Use one of {', '.join(CATEGORIES)}.")
+            entries.append((category, parse_levels(levels), [skill.strip() for skill in skills.split(",") if skill.strip()],
+                            text))
+    return entries
+
+
+class QuestionBank:
+    """
+    Interview questions tagged by skill, seniority and category, with an inverted index from
+    skill IDs to questions, backed by memory-mapped arrays.
+
+    Skills are the IDs of the skills taxonomy, so a posting's "k8s" and a question tagged
+    "Kubernetes" meet. The question texts are one UTF-8 blob with an offsets array; each
+    question's category and level mask are small integer arrays; the skill -> question and
+    question -> skill maps are CSR arrays (an offsets array indexed by ID into a flat array of
+    IDs). All of it is compiled once and memory-mapped read-only, like the taxonomy.
+
+    Selecting questions for a job sums weighted postings with `np.bincount` (required skills
+    count most, then preferred ones, then skills on the resume), scales down questions written
+    for another seniority, and picks the best scoring ones greedily, at most `per_skill` per
+    skill so one skill cannot crowd out the rest. A share of the slots goes to questions that
+    fit any job. Required skills the bank has no questions for are gaps: an optional
+    `fill_gaps` callable (e.g. an LLM) writes questions for them, and template questions cover
+    whatever it does not.
+    """
+
+    def __init__(self, directory: str, taxonomy: Optional[SkillsTaxonomy] = None):
+        self.directory = directory
+        self.taxonomy = taxonomy or get_skills_taxonomy()
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        self.templates = [(category, mask, text) for category, mask, text in meta["templates"]]
+
+        def load(name):
+            return np.asarray(np.load(os.path.join(directory, name), mmap_mode="r"))
+
+        self._text_offsets = load("text_offsets.npy")
+        self._texts = np.asarray(np.memmap(os.path.join(directory, "texts.bin"), dtype=np.uint8, mode="r")) \
+            if self._text_offsets[-1] else np.zeros(0, dtype=np.uint8)
+        self._categories = load("categories.npy")
+        self._levels = load("levels.npy")
+        self._skill_offsets = load("skill_offsets.npy")
+        self._postings = load("postings.npy")
+        self._question_skill_offsets = load("question_skill_offsets.npy")
+        self._question_skills = load("question_skills.npy")
+        self._general = load("general.npy")
+        self._name_ids: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, int, List[str], str]], directory: str,
+              taxonomy: Optional[SkillsTaxonomy] = None) -> "QuestionBank":
+        """
+        Compiles question bank entries into `directory` and opens the result.
+
+        Parameters:
+        - entries (iterable): (category, level mask, skill names, question) tuples, as returned by
+          `load_questions_file`. Skill names are resolved through the taxonomy; unknown ones are
+          logged and dropped. Repeated questions (ignoring case and punctuation) keep the first.
+        - directory (str): Output directory; replaced if it exists.
+        - taxonomy (SkillsTaxonomy): Defaults to the process-wide taxonomy.
+        """
+        taxonomy = taxonomy or get_skills_taxonomy()
+        texts: List[str] = []
+        categories: List[int] = []
+        levels: List[int] = []
+        skill_lists: List[List[int]] = []
+        templates = []
+        seen = set()
+        for category, mask, skills, text in entries:
+            if SKILL_PLACEHOLDER in skills:
+                templates.append((category, mask, text))
+                continue
+            key = _DEDUPE_RE.sub(" ", text.lower()).strip()
+            if key in seen:
+                logger.debug(f"Duplicate question ignored: {text}")
+                continue
+            seen.add(key)
+            skill_ids = []
+            for skill, skill_id in zip(skills, taxonomy.lookup_many(skills)):
+                if skill_id is None:
+                    logger.warning(f"Unknown skill '{skill}' in question bank; ignored for: {text}")
+                elif skill_id not in skill_ids:
+                    skill_ids.append(skill_id)
+            if skills and not skill_ids:
+                continue  # Its skills are not in this taxonomy, so it would only match as a general question
+            texts.append(text)
+            categories.append(CATEGORIES.index(category))
+            levels.append(mask)
+            skill_lists.append(skill_ids)
+
+        encoded = [text.encode("utf-8") for text in texts]
+        text_offsets = np.zeros(len(texts) + 1, dtype=np.uint64)
+        np.cumsum([len(blob) for blob in encoded], out=text_offsets[1:])
+        question_skill_offsets = np.zeros(len(texts) + 1, dtype=np.uint32)
+        np.cumsum([len(skill_ids) for skill_ids in skill_lists], out=question_skill_offsets[1:])
+        question_skills = np.array([skill_id for skill_ids in skill_lists for skill_id in skill_ids], dtype=np.uint32)
+        owners = np.repeat(np.arange(len(texts), dtype=np.uint32), np.diff(question_skill_offsets).astype(np.int64))
+        # Postings grouped by skill ID, in question order within a skill
+        order = np.lexsort((owners, question_skills))
+        skill_offsets = np.zeros(len(taxonomy) + 1, dtype=np.uint32)
+        np.cumsum(np.bincount(question_skills, minlength=len(taxonomy)), out=skill_offsets[1:])
+        general = np.array([index for index, skill_ids in enumerate(skill_lists) if not skill_ids], dtype=np.uint32)
+
+        parent = os.path.dirname(os.path.abspath(directory))
+        os.makedirs(parent, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=parent, suffix=".tmp")
+        try:
+            np.save(os.path.join(tmp_dir, "text_offsets.npy"), text_offsets)
+            with open(os.path.join(tmp_dir, "texts.bin"), "wb") as f:
+                f.write(b"".join(encoded))
+            np.save(os.path.join(tmp_dir, "categories.npy"), np.array(categories, dtype=np.uint8))
+            np.save(os.path.join(tmp_dir, "levels.npy"), np.array(levels, dtype=np.uint16))
+            np.save(os.path.join(tmp_dir, "skill_offsets.npy"), skill_offsets)
+            np.save(os.path.join(tmp_dir, "postings.npy"), owners[order])
+            np.save(os.path.join(tmp_dir, "question_skill_offsets.npy"), question_skill_offsets)
+            np.save(os.path.join(tmp_dir, "question_skills.npy"), question_skills)
+            np.save(os.path.join(tmp_dir, "general.npy"), general)
+            with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({"version": QUESTION_BANK_VERSION, "questions": len(texts), "skills": len(taxonomy),
+                           "templates": templates}, f)
+            if os.path.isdir(directory):
+                shutil.rmtree(directory)
+            try:
+                os.replace(tmp_dir, directory)
+            except OSError:
+                # Another process compiled the same bank first; theirs is identical
+                if not os.path.isdir(directory):
+                    raise
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        logger.info(f"Compiled {len(texts)} interview questions ({len(templates)} templates) into {directory}")
+        return cls(directory, taxonomy)
+
+    @classmethod
+    def from_file(cls, path: str, taxonomy: Optional[SkillsTaxonomy] = None,
+                  cache_dir: Optional[str] = None) -> "QuestionBank":
+        """
+        Opens the compiled form of a question bank file, compiling it on first use.
+
+        Compiled banks are kept under `cache_dir` (default: HR Buddy's cache directory), keyed by
+        the SHA-256 of the file, the compiled taxonomy it indexes and QUESTION_BANK_VERSION, so
+        editing either file recompiles it.
+        """
+        taxonomy = taxonomy or get_skills_taxonomy()
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        name = f"{digest[:32]}-{os.path.basename(os.path.normpath(taxonomy.directory))}-v{QUESTION_BANK_VERSION}"
+        directory = os.path.join(cache_dir or default_cache_dir("questions"), name)
+        try:
+            return cls(directory, taxonomy)
+        except (OSError, ValueError, KeyError):
+            return cls.build(load_questions_file(path), directory, taxonomy)
+
+    def __len__(self) -> int:
+        return len(self._text_offsets) - 1
+
+    def question(self, index: int) -> Question:
+        """Returns the question at `index`, with its canonical skill names."""
+        start, end = int(self._text_offsets[index]), int(self._text_offsets[index + 1])
+        skills = self._question_skills[self._question_skill_offsets[index]:self._question_skill_offsets[index + 1]]
+        return Question(self._texts[start:end].tobytes().decode("utf-8"), CATEGORIES[self._categories[index]],
+                        tuple(self.taxonomy.name(int(skill_id)) for skill_id in skills))
+
+    def _postings_for(self, skill_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (question indexes, the skill each posting came from) for every posting of `skill_ids`."""
+        starts, ends = self._skill_offsets[skill_ids], self._skill_offsets[skill_ids + 1]
+        lengths = (ends - starts).astype(np.int64)
+        if not lengths.sum():
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        positions = np.concatenate([np.arange(start, end) for start, end in zip(starts.tolist(), ends.tolist())])
+        return self._postings[positions].astype(np.int64), np.repeat(skill_ids, lengths)
+
+    def _level_factor(self, seniority: str) -> np.ndarray:
+        if seniority not in LEVELS:
+            return np.ones(len(self), dtype=np.float64)
+        fits = (self._levels & (1 << LEVELS.index(seniority))) != 0
+        return np.where(fits, 1.0, OFF_LEVEL_FACTOR)
+
+    def select(self, required: Sequence[int] = (), preferred: Sequence[int] = (), candidate: Sequence[int] = (),
+               seniority: str = "", count: int = DEFAULT_QUESTION_COUNT, per_skill: int = 2,
+               general_share: float = 0.3,
+               fill_gaps: Optional[Callable[[List[str], str], List[str]]] = None) -> List[Question]:
+        """
+        Picks the `count` questions that best fit a job and candidate.
+
+        Parameters:
+        - required, preferred (sequence): Skill IDs the job requires or prefers.
+        - candidate (sequence): Skill IDs on the candidate's resume.
+        - seniority (str): The job's level (one of LEVELS); empty if unknown.
+        - count (int): Number of questions.
+        - per_skill (int): Most questions picked for any one skill.
+        - general_share (float): Fraction of the slots (at least one) reserved for questions that
+          fit any job; slots the skill questions leave unused go to them too. These are taken
+          round-robin across categories.
+        - fill_gaps (callable): Optional `fill_gaps(skill_names, seniority)` returning questions
+          for required skills the bank has none for. Templates cover whatever it doesn't.
+
+        Returns:
+        - list: Up to `count` questions (fewer if the bank runs out), grouped by category in
+          CATEGORIES order, best match first within each.
+        """
+        if count <= 0:
+            return []
+        required = np.unique(np.asarray(required, dtype=np.int64))
+        preferred = np.setdiff1d(np.asarray(preferred, dtype=np.int64), required)
+        candidate = np.unique(np.asarray(candidate, dtype=np.int64))
+        level = self._level_factor(seniority)
+
+        # Required skills the bank has nothing for get template (or filled-in) questions
+        gaps = required[self._skill_offsets[required] == self._skill_offsets[required + 1]]
+        gap_questions = self._gap_questions(gaps, seniority, max(count // 3, 1) if len(gaps) else 0, fill_gaps)
+
+        weights = {}
+        for skill_ids, weight in ((required, REQUIRED_WEIGHT), (preferred, PREFERRED_WEIGHT),
+                                  (candidate, CANDIDATE_WEIGHT)):
+            for skill_id in skill_ids.tolist():
+                weights[skill_id] = weights.get(skill_id, 0.0) + weight
+        questions, sources = self._postings_for(np.array(sorted(weights), dtype=np.int64))
+        scores = np.bincount(questions, weights=np.array([weights[int(s)] for s in sources.tolist()]),
+                             minlength=len(self)) * level
+
+        general_slots = min(max(int(count * general_share), 1), count - len(gap_questions))
+        picked = self._pick(scores, weights, count - general_slots - len(gap_questions), per_skill)
+        general = self._pick_general(level, count - len(picked) - len(gap_questions))
+
+        selected = [(self.question(int(index)), float(scores[index])) for index in picked]
+        selected += [(self.question(index), 0.0) for index in general]
+        selected += [(question, 0.0) for question in gap_questions]
+        selected.sort(key=lambda item: (CATEGORIES.index(item[0].category), -item[1]))
+        return [question for question, _ in selected]
+
+    def _pick(self, scores: np.ndarray, weights: Dict[int, float], slots: int, per_skill: int) -> List[int]:
+        """
+        Greedy best-first pick over the scored questions, capping how many each relevant skill
+        gets: a first pass takes one question per skill, a second tops skills up to `per_skill`.
+        """
+        if slots <= 0:
+            return []
+        scored = np.flatnonzero(scores > 0)
+        order = scored[np.argsort(-scores[scored], kind="stable")].tolist()
+        picked, taken, per_skill_count = [], set(), {}
+        for cap in sorted({1, max(per_skill, 1)}):
+            for index in order:
+                if index in taken:
+                    continue
+                skills = [skill_id for skill_id in self._question_skills[
+                    self._question_skill_offsets[index]:self._question_skill_offsets[index + 1]].tolist()
+                          if skill_id in weights]
+                if all(per_skill_count.get(skill_id, 0) >= cap for skill_id in skills):
+                    continue
+                for skill_id in skills:
+                    per_skill_count[skill_id] = per_skill_count.get(skill_id, 0) + 1
+                picked.append(index)
+                taken.add(index)
+                if len(picked) == slots:
+                    return picked
+        return picked
+
+    def _pick_general(self, level: np.ndarray, slots: int) -> List[int]:
+        """
+        Takes questions that fit any job round-robin across categories, in file order; questions
+        written for another seniority only once every fitting one is taken.
+        """
+        if slots <= 0:
+            return []
+        fits = level[self._general]
+        picked = []
+        for tier in sorted(set(fits.tolist()), reverse=True):
+            by_category: Dict[int, List[int]] = {}
+            for index in self._general[fits == tier].tolist():
+                by_category.setdefault(int(self._categories[index]), []).append(index)
+            queues = [by_category[category] for category in sorted(by_category)]
+            for rank in range(max(len(queue) for queue in queues)):
+                picked.extend(queue[rank] for queue in queues if rank < len(queue))
+                if len(picked) >= slots:
+                    return picked[:slots]
+        return picked
+
+    def _gap_questions(self, gaps: np.ndarray, seniority: str, slots: int,
+                       fill_gaps: Optional[Callable[[List[str], str], List[str]]]) -> List[Question]:
+        names = [self.taxonomy.name(int(skill_id)) for skill_id in gaps[:slots]]
+        if not names:
+            return []
+        questions = []
+        if fill_gaps is not None:
+            try:
+                filled = [text.strip() for text in fill_gaps(names, seniority) or [] if text and text.strip()]
+            except Exception as e:
+                logger.warning(f"Filling question bank gaps failed, using templates: {e}")
+                filled = []
+            questions = [Question(text, "technical", (name,), "llm") for text, name in zip(filled, names)]
+        level_bit = 1 << LEVELS.index(seniority) if seniority in LEVELS else ALL_LEVELS
+        templates = [template for template in self.templates if template[1] & level_bit] or self.templates
+        for name in names[len(questions):]:
+            if not templates:
+                break
+            category, _, text = templates[len(questions) % len(templates)]
+            questions.append(Question(text.replace(SKILL_PLACEHOLDER, name), category, (name,), "template"))
+        return questions
+
+    def _skill_ids(self, skills: Any) -> np.ndarray:
+        """IDs of skill names or aliases; canonical names match too, including display-only ones like "Go"."""
+        if not skills or skills == "Not Found":
+            return np.zeros(0, dtype=np.int64)
+        if isinstance(skills, str):
+            skills = [skill.strip() for skill in skills.split(",")]
+        if self._name_ids is None:
+            self._name_ids = {self.taxonomy.name(skill_id).lower(): skill_id for skill_id in range(len(self.taxonomy))}
+        skills = list(skills)
+        ids = [skill_id if skill_id is not None else self._name_ids.get(skill.lower())
+               for skill, skill_id in zip(skills, self.taxonomy.lookup_many(skills))]
+        return np.array([skill_id for skill_id in ids if skill_id is not None], dtype=np.int64)
+
+    def for_job(self, job_details: Any, resume_data: Optional[Dict[str, Any]] = None,
+                count: int = DEFAULT_QUESTION_COUNT,
+                fill_gaps: Optional[Callable[[List[str], str], List[str]]] = None) -> List[Question]:
+        """
+        Picks questions for a job posting and (optionally) a parsed resume.
+
+        Parameters:
+        - job_details: A JobPosting (or its dict form); plain text is scanned for skills.
+          None picks general questions only.
+        - resume_data (dict): Parsed resume; its "skills" (a list or comma-separated string) are used.
+        - count (int): Number of questions.
+        - fill_gaps (callable): See `select`.
+
+        Returns:
+        - list: Questions, as returned by `select`.
+        """
+        if isinstance(job_details, dict):
+            job = job_details
+        else:
+            job = {"required_skills": getattr(job_details, "required_skills", None),
+                   "preferred_skills": getattr(job_details, "preferred_skills", None),
+                   "seniority": getattr(job_details, "seniority", "")}
+        required = self._skill_ids(job.get("required_skills"))
+        preferred = self._skill_ids(job.get("preferred_skills"))
+        if not len(required) and not len(preferred) and job_details:
+            required = self.taxonomy.ids(str(job_details)).astype(np.int64)
+        candidate = self._skill_ids((resume_data or {}).get("skills"))
+        return self.select(required, preferred, candidate, seniority=job.get("seniority") or "", count=count,
+                           fill_gaps=fill_gaps)
+
+
+_bank = None
+_bank_lock = threading.Lock()
+
+
+def get_question_bank() -> QuestionBank:
+    """Returns the process-wide question bank, from $HR_BUDDY_QUESTIONS_FILE if set, else the bundled one."""
+    global _bank
+    with _bank_lock:
+        if _bank is None:
+            _bank = QuestionBank.from_file(os.getenv("HR_BUDDY_QUESTIONS_FILE") or DEFAULT_QUESTIONS_FILE)
+        return _bank
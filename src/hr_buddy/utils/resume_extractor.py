@@ -0,0 +1,181 @@
+import os
+import re
+import hashlib
+from typing import Dict, Iterable, List, Optional, Any
+
+EDUCATION_KEYWORDS = ["BSc", "MSc", "PhD", "Bachelor", "Master", "Doctorate"]
+FIELDS = ("name", "email", "phone", "skills", "work_experience", "education")
+
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_RE = re.compile(r'\b\d{10,15}\b')
+TOKEN_RE = re.compile(r'\w+|[^\w\s]')
+# Matched from the start of a line, the greedy `.*` backtracks once from the end, so m.end()
+# is the end of the line's last four-digit run (typically a year) in linear time.
+LAST_YEAR_RE = re.compile(r'.*\d{4}')
+# The lookbehind means a word is only tried from its first letter, which keeps the scan linear.
+FIRST_WORD_RE = re.compile(r'(?<![A-Za-z])[A-Za-z]+ ')
+
+_END = None  # Trie key marking the end of a skill
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits lowercased text into word and punctuation tokens ("C++" -> ["c", "+", "+"])."""
+    return TOKEN_RE.findall(text.lower())
+
+
+def load_skills_vocabulary(path: str) -> List[str]:
+    """Loads the canonical skill names from a skills file (see `skills_taxonomy.load_taxonomy_file`)."""
+    from hr_buddy.utils.skills_taxonomy import load_taxonomy_file
+
+    return [name for name, _, _ in load_taxonomy_file(path)]
+
+
+class ResumeExtractor:
+    """
+    Extracts every resume field in a single sweep over the text's lines.
+
+    Skills come from a `SkillsTaxonomy` (aliases resolve to canonical names: "k8s" ->
+    "Kubernetes"), or, when an explicit `skills` list is given, from a token trie built once
+    from that list. Either way matching cost grows with the text length rather than with text
+    length x vocabulary size. Skills only match on whole tokens: "AI" matches "AI-driven" but
+    not "said".
+    """
+
+    def __init__(self, skills: Optional[Iterable[str]] = None, education_keywords: Optional[Iterable[str]] = None,
+                 taxonomy=None):
+        if skills is None and taxonomy is None:
+            # numpy-backed, so imported on first construction rather than with this module
+            from hr_buddy.utils.skills_taxonomy import get_skills_taxonomy
+
+            taxonomy = get_skills_taxonomy()
+        self.taxonomy = taxonomy if skills is None else None
+        self.skills = list(dict.fromkeys(skills)) if skills is not None else []
+        self.education_keywords = list(education_keywords if education_keywords is not None else EDUCATION_KEYWORDS)
+        self._education_re = re.compile("|".join(re.escape(k) for k in self.education_keywords), re.IGNORECASE)
+        self._education_rank = {k.lower(): i for i, k in enumerate(self.education_keywords)}
+
+        self._trie: Dict[Any, Any] = {}
+        for index, skill in enumerate(self.skills):
+            tokens = tokenize(skill)
+            if not tokens:
+                continue
+            node = self._trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node.setdefault(_END, index)
+
+    @property
+    def vocabulary_key(self) -> str:
+        """
+        Identifies the skills vocabulary, for cache keys of anything derived from extracted skills.
+
+        For a taxonomy this is its compiled directory's name (the taxonomy file's digest and
+        TAXONOMY_VERSION), as in `QuestionBank.from_file`; for a skills list, a digest of the list.
+        """
+        if self.taxonomy is not None:
+            return os.path.basename(os.path.normpath(self.taxonomy.directory))
+        return hashlib.sha256("\n".join(self.skills).encode("utf-8")).hexdigest()[:32]
+
+    def _match_skills(self, tokens: List[str], found: set) -> None:
+        trie = self._trie
+        for start in range(len(tokens)):
+            node = trie.get(tokens[start])
+            position = start + 1
+            while node is not None:
+                if _END in node:
+                    found.add(node[_END])
+                if position == len(tokens):
+                    break
+                node = node.get(tokens[position])
+                position += 1
+
+    def find_skills(self, text: str) -> List[str]:
+        """Returns the vocabulary skills mentioned anywhere in `text`, in vocabulary order."""
+        if self.taxonomy is not None:
+            return self.taxonomy.find(text)
+        found = set()
+        for line in text.split("\n"):
+            self._match_skills(tokenize(line), found)
+        return [self.skills[i] for i in sorted(found)]
+
+    def extract(self, text: str, fields: Iterable[str] = FIELDS) -> Dict[str, Any]:
+        """
+        Extracts structured fields from raw resume text.
+
+        Parameters:
+        - text (str): Resume text.
+        - fields (iterable): Subset of FIELDS to extract (default: all).
+
+        Returns:
+        - dict: Same shape as `parse_resume`: skills as a list of canonical names, work
+          experience as a list of lines, "Not Found" for any other missing field.
+        """
+        fields = set(fields)
+        want_email, want_phone = "email" in fields, "phone" in fields
+        want_skills = "skills" in fields
+        # The taxonomy normalizes the whole text at once; the trie is fed line by line below
+        match_lines = want_skills and self.taxonomy is None
+        want_experience, want_education = "work_experience" in fields, "education" in fields
+
+        lines = text.split("\n")
+        email = phone = None
+        skills = set()
+        experience = []
+        education = {}
+
+        for line in lines:
+            if want_email and email is None and "@" in line:
+                match = EMAIL_RE.search(line)
+                if match:
+                    email = match.group(0)
+            if want_phone and phone is None:
+                match = PHONE_RE.search(line)
+                if match:
+                    phone = match.group(0)
+            if match_lines:
+                self._match_skills(tokenize(line), skills)
+
+            if want_experience or want_education:
+                year = LAST_YEAR_RE.match(line)
+                if year is None:
+                    continue
+                year_start = year.end() - 4
+
+                if want_experience:
+                    word = FIRST_WORD_RE.search(line, 0, year_start + 1)
+                    if word and word.end() <= year_start:
+                        experience.append(line[word.start():year.end()])
+
+                if want_education and len(education) < len(self.education_keywords):
+                    for match in self._education_re.finditer(line, 0, year_start):
+                        keyword = match.group(0).lower()
+                        if keyword not in education and match.end() <= year_start:
+                            education[keyword] = line[match.start():year.end()]
+
+        result = {}
+        if "name" in fields:
+            result["name"] = lines[0]  # Assume first line is the name (improve logic as needed)
+        if want_email:
+            result["email"] = email or "Not Found"
+        if want_phone:
+            result["phone"] = phone or "Not Found"
+        if want_skills:
+            result["skills"] = self.find_skills(text) if self.taxonomy is not None else \
+                [self.skills[i] for i in sorted(skills)]
+        if want_experience:
+            result["work_experience"] = experience if experience else "Not Found"
+        if want_education:
+            ranked = sorted(education, key=self._education_rank.get)
+            result["education"] = education[ranked[0]] if ranked else "Not Found"
+        return result
+
+
+_default_extractor = None
+
+
+def get_default_extractor() -> ResumeExtractor:
+    """Returns the shared extractor, backed by the shared skills taxonomy (see `get_skills_taxonomy`)."""
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = ResumeExtractor()
+    return _default_extractor
@@ -1,89 +1,45 @@
+import io
 import os
-import re
-import nltk
-from nltk.corpus import stopwords
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from jinja2 import Template
-from crewai.tools import BaseTool
-
-nltk.download("stopwords")
-
-class ResumeGeneratorTool(BaseTool):
-    name: str = "ResumeGenerator"
-    description: str = "Generates a tailored, ATS-optimized resume."
-    llm: str = os.getenv("OPENAI_API_KEY")  # Placeholder for LLM integration (optional)
-
-    def _run(self, data: dict, job_description: str = None, filename: str = "tailored_resume.pdf") -> str:
+from typing import BinaryIO, Optional
+from hr_buddy.utils.ats_scorer import get_ats_scorer, WORD_RE
+from hr_buddy.utils.templates import get_template_registry, DEFAULT_LAYOUT
+from hr_buddy.utils.pdf_renderer import render_pdf, write_pdf, unique_output_path
+
+def _skills_taxonomy():
+    # numpy-backed, so imported on first use rather than with this module
+    from hr_buddy.utils.skills_taxonomy import get_skills_taxonomy
+
+    return get_skills_taxonomy()
+
+
+class ResumeGenerator:
+    """
+    Resume generation logic, usable without crewai.
+
+    `ResumeGeneratorTool` wraps it as a crewai tool; that class is only built (and crewai only
+    imported) the first time it is accessed.
+    """
+
+    def _run(self, data: dict, job_description: str = None, filename: Optional[str] = None,
+             layout: str = DEFAULT_LAYOUT, output_dir: Optional[str] = None) -> str:
         """
         Generates an ATS-optimized resume based on user data and job description.
 
         Parameters:
         - data (dict): User profile data (name, work experience, skills, etc.).
         - job_description (str): Job description for keyword extraction (optional).
-        - filename (str): Name of the output PDF file.
+        - filename (str): Name of the output PDF file (optional; a unique name is used if omitted).
+        - layout (str): Name of a resume layout in the templates directory.
+        - output_dir (str): Directory for the file (optional; defaults to the CWD).
 
         Returns:
         - str: Path to the generated PDF file.
         """
         try:
-            # Extract Job-Specific Keywords
-            keywords = self._extract_keywords(job_description) if job_description else []
-
-            # Resume Template
-            resume_template = """
-                <b>{{ name }}</b><br/>
-                {{ email }} | {{ phone }} | 
-                {% if linkedin %} <a href="{{ linkedin }}">LinkedIn</a> {% endif %}
-                {% if github %} | <a href="{{ github }}">GitHub</a> {% endif %}
-                <br/><br/>
-
-                <b>Summary</b><br/>
-                {{ summary }}<br/><br/>
-
-                <b>Skills</b><br/>
-                {{ skills|join(', ') }}<br/><br/>
-
-                <b>Work Experience</b><br/>
-                {% for experience in work_experience %}
-                <b>{{ experience['title'] }}</b> - {{ experience['company'] }}<br/>
-                {{ experience['start_date'] }} - {{ experience['end_date'] }}<br/>
-                {{ experience['description'] }}<br/><br/>
-                {% endfor %}
-
-                <b>Education</b><br/>
-                {% for education in education %}
-                <b>{{ education['degree'] }}</b> in {{ education['field'] }}<br/>
-                {{ education['institution'] }} | Graduated: {{ education['year'] }}<br/><br/>
-                {% endfor %}
-
-                <b>Certifications</b><br/>
-                {% for certification in certifications %}
-                - {{ certification }}<br/>
-                {% endfor %}
-            """
-
-            # Render Template with User Data
-            template = Template(resume_template)
-            resume_text = template.render(
-                name=data.get("name", "Name Not Provided"),
-                email=data.get("email", "Email Not Provided"),
-                phone=data.get("phone", "Phone Not Provided"),
-                linkedin=data.get("linkedin"),
-                github=data.get("github"),
-                summary=data.get("summary", "Dynamic professional with proven expertise."),
-                skills=data.get("skills", []),
-                work_experience=data.get("work_experience", []),
-                education=data.get("education", []),
-                certifications=data.get("certifications", []),
-            )
-
-            # Optimize for ATS
-            ats_optimized_text = self._optimize_for_ats(resume_text, keywords)
+            ats_optimized_text = self.render_resume_text(data, job_description, layout)
 
             # Generate PDF
-            file_path = self._generate_pdf(ats_optimized_text, filename)
+            file_path = self._generate_pdf(ats_optimized_text, filename, output_dir)
 
             return file_path
         except Exception as e:
@@ -93,15 +49,34 @@ class ResumeGeneratorTool(BaseTool):
         """
         Extracts important keywords from a job description.
 
+        Skills are reported once under their canonical name, however the posting spells them
+        ("k8s" -> "Kubernetes"), and their words are not repeated as separate keywords.
+
         Parameters:
         - job_description (str): The job description text.
 
         Returns:
-        - list: Extracted job-relevant keywords.
+        - list: Deduplicated job-relevant keywords, most important first.
         """
-        stop_words = set(stopwords.words("english"))
-        words = re.findall(r'\b\w+\b', job_description.lower())
-        return [word for word in words if word not in stop_words and len(word) > 2]
+        taxonomy = _skills_taxonomy()
+        # Scoring terms are space-joined lowercase words, so they key straight into the spellings found
+        job_phrases = taxonomy.phrases(job_description)
+        job_skills = sorted(set(job_phrases.values()))
+        skill_words = {word for name in taxonomy.names(job_skills) for word in WORD_RE.findall(name.lower())}
+
+        keywords, seen = [], set()
+        for term, _ in get_ats_scorer().job_keywords(job_description):
+            skill_id = job_phrases.get(term)
+            if skill_id is not None:
+                if skill_id not in seen:
+                    seen.add(skill_id)
+                    keywords.append(taxonomy.name(skill_id))
+            # Other phrases are only used for scoring; the resume's keyword line lists single words
+            elif " " not in term and term not in skill_words:
+                keywords.append(term)
+        # Skills too short to be scoring terms ("JS", "C++") come last
+        keywords.extend(taxonomy.name(skill_id) for skill_id in job_skills if skill_id not in seen)
+        return keywords
 
     def _optimize_for_ats(self, text: str, keywords: list) -> str:
         """
@@ -114,30 +89,109 @@ class ResumeGeneratorTool(BaseTool):
         Returns:
         - str: Enhanced resume text with ATS optimization.
         """
-        missing_keywords = [kw.capitalize() for kw in keywords if kw not in text.lower()]
+        taxonomy = _skills_taxonomy()
+        resume_skills = set(taxonomy.ids(text).tolist())
+        resume_terms = set(get_ats_scorer().terms(text))
+        missing_keywords = []
+        for kw, skill_id in zip(keywords, taxonomy.lookup_many(keywords)):
+            if skill_id is not None:
+                # A skill is covered by any of its spellings
+                if skill_id not in resume_skills:
+                    missing_keywords.append(taxonomy.name(skill_id))
+            elif kw.lower() not in resume_terms:
+                missing_keywords.append(kw.capitalize())
         if missing_keywords:
-            text += f"\n\n<b>ATS Keywords:</b> {', '.join(missing_keywords)}"
+            text += f"\n\n<b>ATS Keywords:</b> {', '.join(dict.fromkeys(missing_keywords))}"
         return text
 
-    def _generate_pdf(self, text: str, filename: str) -> str:
+    def render_resume_text(self, data: dict, job_description: str = None, layout: str = DEFAULT_LAYOUT) -> str:
+        """
+        Renders the ATS-optimized resume markup that `_run` and `render_pdf` turn into a PDF.
+        """
+        # Extract Job-Specific Keywords
+        keywords = self._extract_keywords(job_description) if job_description else []
+
+        # Render Template with User Data
+        resume_text = get_template_registry().render(
+            layout,
+            name=data.get("name", "Name Not Provided"),
+            email=data.get("email", "Email Not Provided"),
+            phone=data.get("phone", "Phone Not Provided"),
+            linkedin=data.get("linkedin"),
+            github=data.get("github"),
+            summary=data.get("summary", "Dynamic professional with proven expertise."),
+            skills=self._skill_list(data.get("skills", [])),
+            work_experience=data.get("work_experience", []),
+            education=data.get("education", []),
+            certifications=data.get("certifications", []),
+        )
+
+        # Optimize for ATS
+        return self._optimize_for_ats(resume_text, keywords)
+
+    def _skill_list(self, skills) -> list:
+        """Returns skills as a deduplicated list of canonical names; accepts a list or a comma-separated string."""
+        if isinstance(skills, str):
+            skills = skills.split(",")
+        names = [name for name in (str(skill).strip() for skill in skills) if name and name != "Not Found"]
+        taxonomy = _skills_taxonomy()
+        return list(dict.fromkeys(name if skill_id is None else taxonomy.name(skill_id)
+                                  for name, skill_id in zip(names, taxonomy.lookup_many(names))))
+
+    def render_pdf(self, data: dict, job_description: str = None, layout: str = DEFAULT_LAYOUT,
+                   stream: Optional[BinaryIO] = None) -> io.BytesIO:
+        """
+        Generates the resume PDF in memory, without touching the filesystem.
+
+        Parameters:
+        - data (dict): User profile data (name, work experience, skills, etc.).
+        - job_description (str): Job description for keyword extraction (optional).
+        - layout (str): Name of a resume layout in the templates directory.
+        - stream (file-like): If given, the PDF is also written to it (optional).
+
+        Returns:
+        - BytesIO: The PDF, positioned at the start.
+        """
+        return render_pdf(self.render_resume_text(data, job_description, layout), stream)
+
+    def _generate_pdf(self, text: str, filename: Optional[str] = None, output_dir: Optional[str] = None) -> str:
         """
         Generates a formatted PDF from resume text.
 
         Parameters:
         - text (str): Resume text formatted using HTML-like tags.
-        - filename (str): Output PDF file name.
+        - filename (str): Output PDF file name (optional; a unique name is used if omitted).
+        - output_dir (str): Directory for the file (optional; defaults to the CWD).
 
         Returns:
         - str: Path to the generated PDF.
         """
-        file_path = os.path.join(os.getcwd(), filename)
-        doc = SimpleDocTemplate(file_path, pagesize=letter)
-        styles = getSampleStyleSheet()
-        content = []
+        if filename:
+            file_path = os.path.join(output_dir or os.getcwd(), filename)
+        else:
+            file_path = unique_output_path("tailored_resume", output_dir)
+        return write_pdf(text, file_path)
+
+
+_tool_class = None
+
+
+def _build_tool_class():
+    from crewai.tools import BaseTool
+
+    class ResumeGeneratorTool(ResumeGenerator, BaseTool):
+        name: str = "ResumeGenerator"
+        description: str = "Generates a tailored, ATS-optimized resume."
+        llm: str = os.getenv("OPENAI_API_KEY")  # Placeholder for LLM integration (optional)
+
+    return ResumeGeneratorTool
 
-        for section in text.split("\n\n"):
-            content.append(Paragraph(section.strip(), styles["Normal"]))
-            content.append(Spacer(1, 12))
 
-        doc.build(content)
-        return file_path
+def __getattr__(name):
+    # PEP 562: build the crewai-backed tool class on first access instead of at import
+    global _tool_class
+    if name == "ResumeGeneratorTool":
+        if _tool_class is None:
+            _tool_class = _build_tool_class()
+        return _tool_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,85 +1,260 @@
-import pdfplumber
-import docx
-import re
+import hashlib
+from hr_buddy.utils.resume_extractor import get_default_extractor
+from hr_buddy.utils.disk_cache import DiskCache, default_cache_dir, caching_disabled
+from hr_buddy.utils.tracing import span, record
+
+# Bump whenever extraction logic changes so stale cache entries are ignored.
+PARSER_VERSION = "4"
+RESUME_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# DOCX text is handed to `extract_contact_info` in blocks of this many lines
+DOCX_CHUNK_LINES = 64
+
+DOCX_DOCUMENT_PART = "word/document.xml"
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_W_BODY, _W_PARAGRAPH, _W_TEXT, _W_TABS = _W + "body", _W + "p", _W + "t", _W + "tabs"
+_W_ROW, _W_CELL, _W_TEXTBOX = _W + "tr", _W + "tc", _W + "txbxContent"
+_W_BREAK, _W_TYPE = _W + "br", _W + "type"
+_DOCX_FRAMES = frozenset((_W_PARAGRAPH, _W_CELL, _W_ROW, _W_TEXTBOX))
+_DOCX_RUN_CHARS = {_W + "tab": "\t", _W_BREAK: "\n", _W + "cr": "\n", _W + "noBreakHyphen": "-"}
+
+_resume_cache = None
+
+def get_resume_cache():
+    """Returns the process-wide parsed-resume cache."""
+    global _resume_cache
+    if _resume_cache is None:
+        _resume_cache = DiskCache(default_cache_dir("resumes"), max_bytes=RESUME_CACHE_MAX_BYTES)
+    return _resume_cache
+
+def file_sha256(file_path):
+    """Returns the SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def iter_pdf_pages(pdf_path, max_pages=None):
+    """
+    Yields the text of each PDF page lazily.
+
+    Each page's parsed objects are released as soon as its text has been read, so memory
+    stays bounded by one page rather than the whole document. Pages without extractable
+    text (e.g. scans) yield an empty string.
+    """
+    import pdfplumber
 
-def extract_text_from_pdf(pdf_path):
-    """Extracts text from a PDF resume."""
-    text = ""
     with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text += page.extract_text() + "\n"
-    return text
+        for index, page in enumerate(pdf.pages):
+            if max_pages is not None and index >= max_pages:
+                break
+            try:
+                yield page.extract_text() or ""
+            finally:
+                release = getattr(page, "close", None) or page.flush_cache
+                release()
+
+def extract_text_from_pdf(pdf_path, max_pages=None):
+    """Extracts text from a PDF resume."""
+    return "".join(page_text + "\n" for page_text in iter_pdf_pages(pdf_path, max_pages))
+
+def iter_docx_lines(docx_path):
+    """
+    Yields a DOCX resume's text one paragraph (or table row) at a time, in reading order.
+
+    `word/document.xml` is streamed straight out of the zip and parsed incrementally, and each
+    body-level element is discarded once its text has been read, so memory stays bounded by
+    the largest paragraph or table rather than the document; images and other parts are never
+    decompressed. Table rows come out as one line with cells separated by tabs. Text boxes are
+    read where they are anchored; their legacy VML copies (`mc:Fallback`) and deleted revisions
+    are skipped.
+    """
+    import zipfile
+    from xml.etree.ElementTree import iterparse, ParseError
+
+    try:
+        archive = zipfile.ZipFile(docx_path)
+        document = archive.open(DOCX_DOCUMENT_PART)
+    except (zipfile.BadZipFile, KeyError) as e:
+        raise ValueError(f"Not a valid DOCX file: {docx_path} ({e})")
+
+    with archive, document:
+        # Open paragraphs, table cells and rows, and text boxes, innermost last
+        frames = []
+        depth = fallback_depth = tab_stops = 0
+        body = None
+        try:
+            for event, element in iterparse(document, events=("start", "end")):
+                tag = element.tag
+                if event == "start":
+                    depth += 1
+                    if tag == _MC_FALLBACK:
+                        fallback_depth += 1
+                    elif fallback_depth:
+                        continue
+                    elif tag == _W_BODY:
+                        body = element
+                    elif tag == _W_TABS:
+                        tab_stops += 1
+                    elif tag in _DOCX_FRAMES:
+                        frames.append((tag, []))
+                    continue
+
+                depth -= 1
+                if tag == _MC_FALLBACK:
+                    fallback_depth -= 1
+                elif fallback_depth:
+                    continue
+                elif tag == _W_TABS:
+                    tab_stops -= 1
+                elif tag == _W_TEXT:
+                    if frames and frames[-1][0] == _W_PARAGRAPH and element.text:
+                        frames[-1][1].append(element.text)
+                elif not tab_stops and tag in _DOCX_RUN_CHARS and frames and frames[-1][0] == _W_PARAGRAPH:
+                    if tag != _W_BREAK or element.get(_W_TYPE, "textWrapping") == "textWrapping":
+                        frames[-1][1].append(_DOCX_RUN_CHARS[tag])
+                elif tag in _DOCX_FRAMES:
+                    _, parts = frames.pop()
+                    if tag == _W_CELL:
+                        text = " ".join(part for part in parts if part)
+                    elif tag == _W_ROW:
+                        text = "\t".join(parts)
+                    else:
+                        text = "".join(parts)
+                    parent = frames[-1][0] if frames else None
+                    if tag != _W_TEXTBOX:
+                        # Paragraphs fill cells, cells fill rows; anything else is a line of its own
+                        if parent == _W_CELL or (tag == _W_CELL and parent == _W_ROW):
+                            frames[-1][1].append(text)
+                        else:
+                            yield text
+
+                if depth == 2 and body is not None:
+                    body.clear()
+        except (ParseError, zipfile.BadZipFile) as e:
+            # Truncated or malformed document.xml, or a corrupt deflate stream behind it
+            raise ValueError(f"Not a valid DOCX file: {docx_path} ({e})") from e
 
 def extract_text_from_docx(docx_path):
-    """Extracts text from a DOCX resume."""
-    doc = docx.Document(docx_path)
-    return "\n".join([para.text for para in doc.paragraphs])
+    """Extracts text from a DOCX resume, including tables and text boxes."""
+    return "\n".join(iter_docx_lines(docx_path))
+
+def iter_resume_text(file_path, max_pages=None):
+    """Yields a resume's text in chunks: one per page for PDFs, DOCX_CHUNK_LINES lines for DOCX."""
+    ext = file_path.split(".")[-1].lower()
 
-def parse_resume(file_path):
-    """Parses resume and extracts structured information."""
+    if ext == "pdf":
+        for page_text in iter_pdf_pages(file_path, max_pages):
+            yield page_text + "\n"
+    elif ext == "docx":
+        block = []
+        for line in iter_docx_lines(file_path):
+            block.append(line)
+            if len(block) == DOCX_CHUNK_LINES:
+                yield "\n".join(block) + "\n"
+                block = []
+        if block:
+            yield "\n".join(block)
+    else:
+        raise ValueError("Unsupported file format. Upload a PDF or DOCX file.")
+
+def extract_contact_info(file_path, max_pages=None):
+    """
+    Extracts only the header fields (name, email, phone) from a resume.
+
+    Pages are read one at a time and reading stops as soon as all three fields are found,
+    so long CVs usually cost a page or two instead of a full extraction.
+    """
+    extractor = get_default_extractor()
+    contact = {"name": None, "email": "Not Found", "phone": "Not Found"}
+
+    for chunk in iter_resume_text(file_path, max_pages):
+        if contact["name"] is None:
+            contact["name"] = extractor.extract(chunk, fields=("name",))["name"]
+        missing = [field for field in ("email", "phone") if contact[field] == "Not Found"]
+        contact.update(extractor.extract(chunk, fields=missing))
+        if contact["email"] != "Not Found" and contact["phone"] != "Not Found":
+            break
+
+    if contact["name"] is None:
+        contact["name"] = ""
+    return contact
+
+def extract_resume_text(file_path):
+    """Extracts raw text from a PDF or DOCX resume."""
     ext = file_path.split(".")[-1].lower()
-    text = ""
-    
+
     if ext == "pdf":
-        text = extract_text_from_pdf(file_path)
+        return extract_text_from_pdf(file_path)
     elif ext == "docx":
-        text = extract_text_from_docx(file_path)
+        return extract_text_from_docx(file_path)
     else:
         raise ValueError("Unsupported file format. Upload a PDF or DOCX file.")
-    
-    # Extract key details
-    name = extract_name(text)
-    email = extract_email(text)
-    phone = extract_phone(text)
-    skills = extract_skills(text)
-    experience = extract_experience(text)
-    education = extract_education(text)
-    
-    return {
-        "name": name,
-        "email": email,
-        "phone": phone,
-        "skills": skills,
-        "work_experience": experience,
-        "education": education
-    }
+
+def parse_resume(file_path, use_cache=True):
+    """
+    Parses resume and extracts structured information.
+
+    Results are cached on disk by the SHA-256 of the file bytes, the skills taxonomy in use and
+    PARSER_VERSION, so re-parsing an unchanged resume skips text extraction entirely. Pass `use_cache=False`
+    (or set HR_BUDDY_NO_CACHE=1) to always parse from scratch.
+    """
+    return parse_resume_document(file_path, use_cache)["data"]
+
+def parse_resume_document(file_path, use_cache=True):
+    """Like `parse_resume`, but returns {"text": raw text, "data": structured fields}."""
+    if file_path.split(".")[-1].lower() not in ("pdf", "docx"):
+        raise ValueError("Unsupported file format. Upload a PDF or DOCX file.")
+
+    use_cache = use_cache and not caching_disabled()
+    if use_cache:
+        # Editing the skills file changes the extracted skills, so it must change the key too
+        cache_key = f"{file_sha256(file_path)}:{get_default_extractor().vocabulary_key}:{PARSER_VERSION}"
+        cached = get_resume_cache().get(cache_key)
+        if cached is not None:
+            record(cache_hits=1)
+            return cached
+        record(cache_misses=1)
+
+    with span("resume.extract_text"):
+        text = extract_resume_text(file_path)
+    record(bytes_extracted=len(text))
+    with span("resume.extract_fields"):
+        data = parse_resume_text(text)
+
+    document = {"text": text, "data": data}
+    if use_cache:
+        get_resume_cache().set(cache_key, document)
+    return document
+
+def parse_resume_text(text):
+    """Extracts structured information from raw resume text in a single pass."""
+    return get_default_extractor().extract(text)
 
 def extract_name(text):
     """Extracts name from resume (basic heuristic)."""
-    lines = text.split("\n")
-    if len(lines) > 0:
-        return lines[0]  # Assume first line is the name (improve logic as needed)
-    return "Unknown"
+    return get_default_extractor().extract(text, fields=("name",))["name"]
 
 def extract_email(text):
     """Extracts email from resume."""
-    match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-    return match.group(0) if match else "Not Found"
+    return get_default_extractor().extract(text, fields=("email",))["email"]
 
 def extract_phone(text):
     """Extracts phone number from resume."""
-    match = re.search(r'\b\d{10,15}\b', text)
-    return match.group(0) if match else "Not Found"
+    return get_default_extractor().extract(text, fields=("phone",))["phone"]
 
 def extract_skills(text):
     """Extracts skills from resume."""
-    keywords = ["Python", "Machine Learning", "Data Science", "SQL", "Java", "AI", "Deep Learning", "Excel", "TensorFlow"]
-    found_skills = [skill for skill in keywords if skill.lower() in text.lower()]
-    return ", ".join(found_skills) if found_skills else "Not Found"
+    return get_default_extractor().extract(text, fields=("skills",))["skills"]
 
 def extract_experience(text):
     """Extracts work experience (basic logic)."""
-    experiences = re.findall(r'([A-Za-z]+ .*\d{4})', text)  # Looks for patterns like "Software Engineer at XYZ 2021"
-    return experiences if experiences else "Not Found"
+    return get_default_extractor().extract(text, fields=("work_experience",))["work_experience"]
 
 def extract_education(text):
     """Extracts education details (basic logic)."""
-    education_patterns = ["BSc", "MSc", "PhD", "Bachelor", "Master", "Doctorate"]
-    for pattern in education_patterns:
-        match = re.search(pattern + r'.*\d{4}', text, re.IGNORECASE)
-        if match:
-            return match.group(0)
-    return "Not Found"
+    return get_default_extractor().extract(text, fields=("education",))["education"]
 
 # Example Usage
 if __name__ == "__main__":
@@ -0,0 +1,338 @@
+import os
+import re
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hr_buddy.utils.disk_cache import default_cache_dir
+from hr_buddy.utils.resume_extractor import tokenize
+
+logger = logging.getLogger(__name__)
+
+TAXONOMY_VERSION = "1"
+DEFAULT_SKILLS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "skills.txt")
+MAX_ALIAS_TOKENS = 8
+DISPLAY_ONLY = "~"
+MAX_CACHED_TOKENS = 200_000
+
+# `resume_extractor.tokenize`, plus line breaks as tokens so no alias matches across lines
+SCAN_RE = re.compile(r'\w+|[^\w\s]|\n')
+# Phrase hashes are a polynomial over 64-bit token hashes, wrapping modulo 2**64
+_MULTIPLIER = np.uint64(0x100000001B3)
+
+
+def load_taxonomy_file(path: str) -> List[Tuple[str, List[str], bool]]:
+    """
+    Loads a skills taxonomy file.
+
+    Each line is a canonical skill name followed by its aliases, separated by "|". A leading "~"
+    marks a name that is only displayed, never matched (for skills like "Go" that are also common
+    words). A plain one-skill-per-line vocabulary is a valid taxonomy without aliases. Blank lines
+    and `#` comments are ignored.
+
+    Returns:
+    - list: (name, aliases, match_name) tuples in file order.
+    """
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            name, *aliases = [field.strip() for field in line.split("|")]
+            match_name = not name.startswith(DISPLAY_ONLY)
+            entries.append((name.lstrip(DISPLAY_ONLY).strip(), [alias for alias in aliases if alias], match_name))
+    return entries
+
+
+class SkillsTaxonomy:
+    """
+    Canonical skills with interned integer IDs, backed by memory-mapped arrays.
+
+    A skill's ID is its position in the taxonomy. Every spelling (the canonical name and its
+    aliases) is tokenized like resume text and reduced to a 64-bit phrase hash; the sorted
+    hashes and the ID each maps to are stored as .npy files, next to the canonical names as one
+    UTF-8 blob with an offsets array. All of it is memory-mapped read-only, so worker processes
+    share one copy through the page cache instead of each building a dict of strings.
+
+    Normalizing text tokenizes and hashes it once, then grows n-grams from every position one
+    token at a time: each length is looked up in the spellings with one `searchsorted`, and only
+    n-grams that are a prefix of some longer spelling (a second sorted array) are extended. A
+    match inside a longer one is dropped. The cost is independent of the vocabulary size. The result is a sorted array of skill IDs;
+    comparing resumes and jobs is then integer set operations (`np.intersect1d`, `np.isin`,
+    Python sets). A 64-bit collision between a text phrase and a spelling is possible in
+    principle and negligible in practice.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        self.max_tokens = meta["max_tokens"]
+        # Plain ndarray views of the maps: same pages, without np.memmap's per-index overhead
+        self._hashes = np.asarray(np.load(os.path.join(directory, "hashes.npy"), mmap_mode="r"))
+        self._ids = np.asarray(np.load(os.path.join(directory, "ids.npy"), mmap_mode="r"))
+        self._prefixes = np.asarray(np.load(os.path.join(directory, "prefixes.npy"), mmap_mode="r"))
+        self._offsets = np.asarray(np.load(os.path.join(directory, "offsets.npy"), mmap_mode="r"))
+        self._names = np.asarray(np.memmap(os.path.join(directory, "names.bin"), dtype=np.uint8, mode="r")) \
+            if self._offsets[-1] else np.zeros(0, dtype=np.uint8)
+        self._token_hashes: Dict[str, int] = {}
+        self._decoded: Dict[int, str] = {}
+        self._term_ids: Dict[str, Optional[int]] = {}
+        self._break_hash = _TokenHasher.token("\n")
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple], directory: str) -> "SkillsTaxonomy":
+        """
+        Compiles taxonomy entries into `directory` and opens the result.
+
+        Parameters:
+        - entries (iterable): (name, aliases) or (name, aliases, match_name) tuples, as returned
+          by `load_taxonomy_file`. Repeated names are merged; a spelling claimed by two skills
+          keeps the first.
+        - directory (str): Output directory; replaced if it exists.
+        """
+        names: List[str] = []
+        name_ids: Dict[str, int] = {}
+        phrases: Dict[Tuple[str, ...], int] = {}
+        for name, aliases, *rest in entries:
+            match_name = rest[0] if rest else True
+            skill_id = name_ids.setdefault(name.lower(), len(names))
+            if skill_id == len(names):
+                names.append(name)
+            for spelling in ([name] if match_name else []) + list(aliases):
+                tokens = tuple(tokenize(spelling))
+                if not tokens or len(tokens) > MAX_ALIAS_TOKENS:
+                    continue
+                owner = phrases.setdefault(tokens, skill_id)
+                if owner != skill_id:
+                    logger.debug(f"'{spelling}' already names {names[owner]}; ignored for {name}")
+
+        hasher = _TokenHasher()
+        hashes = np.array([hasher.phrase(tokens) for tokens in phrases], dtype=np.uint64)
+        # Every proper prefix of a spelling, so matching can stop extending a phrase early
+        prefixes = np.unique(np.array([hasher.phrase(tokens[:n]) for tokens in phrases for n in range(1, len(tokens))],
+                                      dtype=np.uint64))
+        ids = np.array(list(phrases.values()), dtype=np.uint32)
+        order = np.argsort(hashes, kind="stable")
+        encoded = [name.encode("utf-8") for name in names]
+        offsets = np.zeros(len(names) + 1, dtype=np.uint64)
+        np.cumsum([len(blob) for blob in encoded], out=offsets[1:])
+
+        parent = os.path.dirname(os.path.abspath(directory))
+        os.makedirs(parent, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=parent, suffix=".tmp")
+        try:
+            np.save(os.path.join(tmp_dir, "hashes.npy"), hashes[order])
+            np.save(os.path.join(tmp_dir, "ids.npy"), ids[order])
+            np.save(os.path.join(tmp_dir, "prefixes.npy"), prefixes)
+            np.save(os.path.join(tmp_dir, "offsets.npy"), offsets)
+            with open(os.path.join(tmp_dir, "names.bin"), "wb") as f:
+                f.write(b"".join(encoded))
+            with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({"version": TAXONOMY_VERSION, "skills": len(names), "spellings": len(phrases),
+                           "max_tokens": max((len(tokens) for tokens in phrases), default=1)}, f)
+            if os.path.isdir(directory):
+                shutil.rmtree(directory)
+            try:
+                os.replace(tmp_dir, directory)
+            except OSError:
+                # Another process compiled the same taxonomy first; theirs is identical
+                if not os.path.isdir(directory):
+                    raise
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        logger.info(f"Compiled {len(names)} skills ({len(phrases)} spellings) into {directory}")
+        return cls(directory)
+
+    @classmethod
+    def from_file(cls, path: str, cache_dir: Optional[str] = None) -> "SkillsTaxonomy":
+        """
+        Opens the compiled form of a taxonomy file, compiling it on first use.
+
+        Compiled taxonomies are kept under `cache_dir` (default: HR Buddy's cache directory),
+        keyed by the SHA-256 of the file and TAXONOMY_VERSION, so editing the file recompiles it.
+        """
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        directory = os.path.join(cache_dir or default_cache_dir("skills"), f"{digest[:32]}-v{TAXONOMY_VERSION}")
+        try:
+            return cls(directory)
+        except (OSError, ValueError, KeyError):
+            return cls.build(load_taxonomy_file(path), directory)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def name(self, skill_id: int) -> str:
+        """Returns the canonical name of a skill ID."""
+        name = self._decoded.get(skill_id)
+        if name is None:
+            start, end = int(self._offsets[skill_id]), int(self._offsets[skill_id + 1])
+            name = self._decoded[skill_id] = self._names[start:end].tobytes().decode("utf-8")
+        return name
+
+    def names(self, ids: Iterable[int]) -> List[str]:
+        """Returns the canonical names of skill IDs, in ID (taxonomy) order."""
+        return [self.name(skill_id) for skill_id in sorted(set(int(i) for i in ids))]
+
+    def _hash_tokens(self, tokens: List[str]) -> np.ndarray:
+        cache = self._token_hashes
+        new = [token for token in set(tokens) if token not in cache]
+        if len(cache) + len(new) > MAX_CACHED_TOKENS:
+            # Swapped rather than cleared, so concurrent readers keep a complete dict
+            self._token_hashes = cache = {}
+            new = set(tokens)
+        for token in new:
+            cache[token] = _TokenHasher.token(token)
+        return np.fromiter(map(cache.__getitem__, tokens), dtype=np.uint64, count=len(tokens))
+
+    @staticmethod
+    def _member(table: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (mask of `values` present in the sorted `table`, their positions in it)."""
+        if not len(table):
+            return np.zeros(len(values), dtype=bool), np.zeros(0, dtype=np.int64)
+        positions = np.searchsorted(table, values)
+        np.minimum(positions, len(table) - 1, out=positions)
+        found = table[positions] == values
+        return found, positions[found]
+
+    def _match(self, text: str) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Returns (tokens, start, length, phrase hash, skill ID) for every skill spelling in `text`."""
+        tokens = SCAN_RE.findall(text.lower())
+        if not tokens or not len(self._hashes):
+            empty = np.zeros(0, dtype=np.int64)
+            return tokens, empty, empty, np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.uint32)
+
+        # Line breaks pad the end, so every start can be extended to `max_tokens` tokens
+        padded = self._hash_tokens(tokens + ["\n"] * self.max_tokens)
+        starts = np.arange(len(tokens))
+        phrase = np.zeros(len(tokens), dtype=np.uint64)
+        found_starts, found_lengths, found_hashes, found_ids = [], [], [], []
+        for n in range(1, self.max_tokens + 1):
+            # phrase[i] is the hash of tokens[starts[i]:starts[i] + n]
+            phrase = phrase * _MULTIPLIER + padded[starts + n - 1]
+            found, positions = self._member(self._hashes, phrase)
+            if len(positions):
+                found_starts.append(starts[found])
+                found_lengths.append(np.full(len(positions), n, dtype=np.int64))
+                found_hashes.append(phrase[found])
+                found_ids.append(self._ids[positions])
+            extend, _ = self._member(self._prefixes, phrase)
+            starts, phrase = starts[extend], phrase[extend]
+            if not len(starts):
+                break
+        if not found_ids:
+            empty = np.zeros(0, dtype=np.int64)
+            return tokens, empty, empty, np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.uint32)
+
+        # Longest match wins: "React Native" is not also "React", nor "Node.js" "JavaScript"
+        starts, lengths = np.concatenate(found_starts), np.concatenate(found_lengths)
+        hashes, ids = np.concatenate(found_hashes), np.concatenate(found_ids)
+        order = np.lexsort((-lengths, starts))
+        ends = (starts + lengths)[order]
+        covered = np.zeros(len(ends), dtype=bool)
+        covered[1:] = ends[1:] <= np.maximum.accumulate(ends)[:-1]
+        keep = order[~covered]
+        return tokens, starts[keep], lengths[keep], hashes[keep], ids[keep]
+
+    def ids(self, text: str) -> np.ndarray:
+        """Returns the sorted, unique uint32 IDs of every skill mentioned in `text`."""
+        return np.unique(self._match(text)[4])
+
+    def phrases(self, text: str) -> Dict[str, int]:
+        """
+        Returns every skill spelling found in `text`, as its space-joined lowercase tokens, mapped
+        to the skill's ID: "Worked with K8s and Node.js" -> {"k8s": ..., "node . js": ...}.
+        """
+        tokens, starts, lengths, hashes, ids = self._match(text)
+        _, first = np.unique(hashes, return_index=True)
+        return {" ".join(tokens[start:start + length]): skill_id
+                for start, length, skill_id in zip(starts[first].tolist(), lengths[first].tolist(), ids[first].tolist())}
+
+    def lookup_many(self, terms: Sequence[str]) -> List[Optional[int]]:
+        """Returns the skill ID each term names (canonically or by alias), or None, in one batch."""
+        cache = self._term_ids
+        new = [term for term in dict.fromkeys(terms) if term not in cache]
+        if not new:
+            return [cache[term] for term in terms]
+
+        resolved = dict(zip(new, self._lookup_terms(new)))
+        if len(cache) + len(new) > MAX_CACHED_TOKENS:
+            self._term_ids = {}
+        else:
+            cache.update(resolved)
+        return [resolved[term] if term in resolved else cache[term] for term in terms]
+
+    def _lookup_terms(self, terms: List[str]) -> List[Optional[int]]:
+        if not len(self._hashes):
+            return [None] * len(terms)
+        token_lists = [SCAN_RE.findall(term.lower()) for term in terms]
+        hashes = self._hash_tokens([token for tokens in token_lists for token in tokens]).tolist()
+        values, position = [], 0
+        for tokens in token_lists:
+            values.append(_TokenHasher.fold(hashes[position:position + len(tokens)])
+                          if 0 < len(tokens) <= self.max_tokens and "\n" not in tokens else 0)
+            position += len(tokens)
+        found, positions = self._member(self._hashes, np.array(values, dtype=np.uint64))
+        skill_ids = iter(self._ids[positions].tolist())
+        return [next(skill_ids) if hit else None for hit in found.tolist()]
+
+    def lookup(self, term: str) -> Optional[int]:
+        """Returns the ID of the skill `term` names (canonically or by alias), or None."""
+        return self.lookup_many([term])[0]
+
+    def canonical(self, term: str) -> Optional[str]:
+        """Returns the canonical spelling of a skill name or alias ("k8s" -> "Kubernetes"), or None."""
+        skill_id = self.lookup(term)
+        return None if skill_id is None else self.name(skill_id)
+
+    def find(self, text: str) -> List[str]:
+        """Returns the canonical names of the skills mentioned in `text`, in taxonomy order."""
+        return [self.name(skill_id) for skill_id in self.ids(text)]
+
+    @staticmethod
+    def coverage(candidate_ids: Sequence[int], required_ids: Sequence[int]) -> float:
+        """Returns the fraction (0-1) of `required_ids` found in `candidate_ids`; 0 if none are required."""
+        required = np.asarray(required_ids)
+        if not len(required):
+            return 0.0
+        return float(np.isin(required, np.asarray(candidate_ids)).mean())
+
+
+class _TokenHasher:
+    """Stable (cross-process) 64-bit token hashes, folded into phrase hashes the way `ids` does."""
+
+    @staticmethod
+    def token(token: str) -> int:
+        return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+
+    @staticmethod
+    def fold(token_hashes: Sequence[int]) -> int:
+        value = 0
+        for token_hash in token_hashes:
+            value = (value * int(_MULTIPLIER) + token_hash) & 0xFFFFFFFFFFFFFFFF
+        return value
+
+    def phrase(self, tokens: Sequence[str]) -> int:
+        return self.fold([self.token(token) for token in tokens])
+
+
+_taxonomy = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_skills_taxonomy() -> SkillsTaxonomy:
+    """Returns the process-wide taxonomy, from $HR_BUDDY_SKILLS_FILE if set, else the bundled vocabulary."""
+    global _taxonomy
+    with _taxonomy_lock:
+        if _taxonomy is None:
+            _taxonomy = SkillsTaxonomy.from_file(os.getenv("HR_BUDDY_SKILLS_FILE") or DEFAULT_SKILLS_FILE)
+        return _taxonomy
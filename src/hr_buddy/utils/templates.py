@@ -0,0 +1,91 @@
+import os
+import threading
+from functools import lru_cache
+from typing import List, Optional
+
+from hr_buddy.utils.disk_cache import default_cache_dir
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+RESUME_TEMPLATE_SUFFIX = ".html.j2"
+DEFAULT_LAYOUT = "default"
+
+
+class TemplateRegistry:
+    """
+    Named resume layouts loaded from `<templates_dir>/resume/<layout>.html.j2`.
+
+    Each template is compiled once per process and kept by the Jinja environment; the compiled
+    bytecode is also cached on disk so new processes skip parsing. Templates are not re-checked
+    for changes once loaded.
+    """
+
+    def __init__(self, templates_dir: Optional[str] = None, bytecode_cache_dir: Optional[str] = None):
+        from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
+        self.templates_dir = templates_dir or os.getenv("HR_BUDDY_TEMPLATES_DIR") or TEMPLATES_DIR
+        bytecode_cache_dir = bytecode_cache_dir or default_cache_dir("jinja")
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        self.env = Environment(
+            loader=FileSystemLoader(self.templates_dir),
+            bytecode_cache=FileSystemBytecodeCache(bytecode_cache_dir),
+            auto_reload=False,
+            cache_size=-1,
+        )
+        self._layouts = None
+
+    def layouts(self) -> List[str]:
+        """Names of the available resume layouts (scanned once)."""
+        if self._layouts is None:
+            resume_dir = os.path.join(self.templates_dir, "resume")
+            names = os.listdir(resume_dir) if os.path.isdir(resume_dir) else []
+            self._layouts = sorted(name[:-len(RESUME_TEMPLATE_SUFFIX)] for name in names
+                                   if name.endswith(RESUME_TEMPLATE_SUFFIX))
+        return self._layouts
+
+    def get(self, layout: str = DEFAULT_LAYOUT):
+        """Returns the compiled template for a resume layout."""
+        if layout not in self.layouts():
+            raise ValueError(f"Unknown resume layout '{layout}'. Available: {', '.join(self.layouts())}")
+        return self.env.get_template(f"resume/{layout}{RESUME_TEMPLATE_SUFFIX}")
+
+    def render(self, layout: str = DEFAULT_LAYOUT, **context) -> str:
+        return self.get(layout).render(**context)
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_template_registry() -> TemplateRegistry:
+    """Returns the process-wide template registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = TemplateRegistry()
+        return _registry
+
+
+def register_font(name: str, path: str) -> str:
+    """Registers a TrueType font with ReportLab once per process and returns its name."""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    if name not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(TTFont(name, path))
+    return name
+
+
+@lru_cache(maxsize=None)
+def get_stylesheet(font_name: Optional[str] = None):
+    """
+    Returns ReportLab's sample stylesheet, built once per font.
+
+    The returned styles are shared; copy a style before modifying it.
+    """
+    from reportlab.lib.styles import getSampleStyleSheet
+
+    styles = getSampleStyleSheet()
+    if font_name:
+        for style in styles.byName.values():
+            style.fontName = font_name
+    return styles
@@ -0,0 +1,255 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from hr_buddy.utils.disk_cache import DiskCache, default_cache_dir, caching_disabled
+from hr_buddy.utils.tracing import span, record
+from hr_buddy.utils.urls import normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever key normalization changes so stale entries are ignored.
+TOOL_CACHE_VERSION = "1"
+DEFAULT_TOOL_TTL = 24 * 60 * 60  # seconds; override with HR_BUDDY_TOOL_CACHE_TTL
+TOOL_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Keyword arguments holding URLs, normalized so equivalent links share an entry
+URL_ARGUMENTS = {"url", "website", "website_url"}
+
+
+def _file_digest(f) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def normalize_argument(name: Optional[str], value: Any) -> Any:
+    """
+    Canonical, JSON-serializable form of one tool argument for the cache key.
+
+    Files (uploaded file objects, bytes and paths to existing files) are keyed by the SHA-256
+    of their content, so the same resume uploaded twice shares an entry. URL arguments are
+    normalized and other strings have their whitespace collapsed.
+    """
+    if hasattr(value, "getvalue"):  # Uploaded files and in-memory streams
+        return "sha256:" + hashlib.sha256(value.getvalue()).hexdigest()
+    if isinstance(value, (bytes, bytearray)):
+        return "sha256:" + hashlib.sha256(value).hexdigest()
+    if isinstance(value, os.PathLike) or (isinstance(value, str) and len(value) < 4096 and os.path.isfile(value)):
+        with open(value, "rb") as f:
+            return "sha256:" + _file_digest(f)
+    if isinstance(value, str):
+        if name is not None and (name in URL_ARGUMENTS or name.endswith("_url")):
+            return normalize_url(value)
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {str(key): normalize_argument(str(key), item) for key, item in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [normalize_argument(None, item) for item in value]
+    if value is None or isinstance(value, (int, float, bool)):
+        return value
+    return repr(value)
+
+
+def normalize_arguments(args, kwargs) -> Dict[str, Any]:
+    """Canonical form of a call's positional and keyword arguments (see normalize_argument)."""
+    return {
+        "args": [normalize_argument(None, value) for value in args],
+        "kwargs": {key: normalize_argument(key, value) for key, value in sorted(kwargs.items())},
+    }
+
+
+def config_fingerprint(config: Optional[Dict[str, Any]]) -> str:
+    """Short digest of a tool's model/config settings; tools configured differently never share entries."""
+    encoded = json.dumps(config or {}, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+class ToolCache:
+    """
+    Shared result cache for agent tool calls.
+
+    Results are persisted in a DiskCache keyed by tool name, config fingerprint and normalized
+    input, with a TTL and LRU size eviction. Identical calls that arrive while one is still
+    running wait for it and share its result (or error) instead of executing again. Errors
+    are never cached.
+
+    Each call records `tool_cache_hits`, `tool_cache_misses`, `tool_cache_coalesced` and
+    `tool_cache_saved_seconds` (the execution time a hit or coalesced call did not spend)
+    on the current span; `stats()` has the process-wide totals and hit rate.
+    """
+
+    def __init__(self, cache: Optional[DiskCache] = None, ttl: Optional[float] = None):
+        if cache is None and not caching_disabled():
+            cache = DiskCache(default_cache_dir("tools"), max_bytes=TOOL_CACHE_MAX_BYTES)
+        self.cache = cache
+        self.ttl = ttl if ttl is not None else float(os.getenv("HR_BUDDY_TOOL_CACHE_TTL", DEFAULT_TOOL_TTL))
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "saved_seconds": 0.0}
+
+    @staticmethod
+    def key(name: str, args, kwargs, config: Optional[Dict[str, Any]] = None) -> str:
+        digest = hashlib.sha256(json.dumps(normalize_arguments(args, kwargs), sort_keys=True).encode("utf-8")).hexdigest()
+        return f"tool:{TOOL_CACHE_VERSION}:{name}:{config_fingerprint(config)}:{digest}"
+
+    def _count(self, outcome: str, saved: float = 0.0) -> None:
+        with self._lock:
+            self._stats[outcome] += 1
+            self._stats["saved_seconds"] += saved
+        record(**{f"tool_cache_{outcome}": 1, "tool_cache_saved_seconds": saved})
+
+    def call(self, name: str, fn: Callable[..., Any], args=(), kwargs=None,
+             config: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Returns `fn(*args, **kwargs)`, from the cache or a concurrent identical call when possible.
+
+        Parameters:
+        - name (str): The tool's name, part of the key.
+        - fn (callable): Executes the tool.
+        - args, kwargs: The tool's input.
+        - config (dict): Model/config settings that change the tool's output (embedder, LLM, ...).
+
+        Returns:
+        - The tool's result.
+        """
+        kwargs = kwargs or {}
+        key = self.key(name, args, kwargs, config)
+        start = time.perf_counter()
+
+        with self._lock:
+            future = self._calls.get(key)
+            owner = future is None
+            if owner:
+                future = self._calls[key] = Future()
+
+        if not owner:
+            result, elapsed = future.result()
+            self._count("coalesced", max(elapsed - (time.perf_counter() - start), 0.0))
+            return result
+
+        try:
+            entry = self.cache.get(key, ttl=self.ttl) if self.cache is not None else None
+            if entry is not None:
+                future.set_result((entry["result"], entry["elapsed"]))
+                self._count("hits", max(entry["elapsed"] - (time.perf_counter() - start), 0.0))
+                return entry["result"]
+
+            result = fn(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            future.set_result((result, elapsed))
+            self._count("misses")
+        except BaseException as e:
+            # Also on KeyboardInterrupt/SystemExit, or coalesced callers would wait forever
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        if self.cache is not None:
+            try:
+                self.cache.set(key, {"result": result, "elapsed": elapsed})
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Not caching {name} result: {e}")
+        return result
+
+    def stats(self) -> Dict[str, float]:
+        """Process-wide totals: hits, misses, coalesced, saved_seconds and hit_rate (hits and coalesced over all calls)."""
+        with self._lock:
+            stats = dict(self._stats)
+        calls = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_rate"] = (stats["hits"] + stats["coalesced"]) / calls if calls else 0.0
+        return stats
+
+
+class KnowledgeSources:
+    """
+    A RAG tool's `add`, recording a fingerprint of every source added to its knowledge base.
+
+    The same query against a different knowledge base gives a different answer, so the
+    fingerprint is part of the tool's cache key. Sources are keyed like tool arguments (files
+    by content, URLs normalized); the order they were added in doesn't matter.
+    """
+
+    def __init__(self, add: Callable[..., Any]):
+        self.add = add
+        self._lock = threading.Lock()
+        self._sources = set()
+
+    def __call__(self, *args, **kwargs):
+        result = self.add(*args, **kwargs)
+        source = json.dumps(normalize_arguments(args, kwargs), sort_keys=True)
+        with self._lock:
+            self._sources.add(hashlib.sha256(source.encode("utf-8")).hexdigest())
+        return result
+
+    def fingerprint(self) -> str:
+        with self._lock:
+            sources = sorted(self._sources)
+        return hashlib.sha256(",".join(sources).encode("utf-8")).hexdigest()[:16]
+
+
+class CachedTool:
+    """A tool's `_run` routed through a ToolCache, inside a `tool.<name>` span."""
+
+    def __init__(self, name: str, fn: Callable[..., Any], config: Optional[Dict[str, Any]] = None,
+                 cache: Optional[ToolCache] = None, sources: Optional[KnowledgeSources] = None):
+        self.name = name
+        self.fn = fn
+        self.config = config
+        self.cache = cache
+        self.sources = sources
+
+    def __call__(self, *args, **kwargs):
+        config = self.config
+        if self.sources is not None:
+            config = dict(config or {}, knowledge_base=self.sources.fingerprint())
+        with span(f"tool.{self.name}"):
+            return (self.cache or get_tool_cache()).call(self.name, self.fn, args, kwargs, config)
+
+
+def cache_tool(tool, name: str, cache: Optional[ToolCache] = None, **config):
+    """
+    Routes every execution of a crewai tool through the shared tool cache and returns the tool.
+
+    The instance's `_run` is replaced, so both direct `tool.run(...)` calls and the calls an
+    agent makes on its own are cached. `config` should name everything besides the input that
+    changes the tool's output, e.g. the embedding model; the tool's class and any `config`
+    attribute it has are included automatically. For RAG tools (RagTool, WebsiteSearchTool,
+    PDFSearchTool, ...) `add` is wrapped too, and the key includes a fingerprint of the sources
+    added since, so queries are only shared between identical knowledge bases. Wrap the tool
+    before adding sources to it.
+
+    Parameters:
+    - tool: A crewai tool instance.
+    - name (str): Short name for the cache key and the span.
+    - cache (ToolCache): Defaults to the process-wide cache.
+    - config: Model/config settings that affect the result.
+    """
+    config = {"tool": f"{type(tool).__module__}.{type(tool).__qualname__}",
+              "tool_config": getattr(tool, "config", None), **config}
+    sources = KnowledgeSources(tool.add) if callable(getattr(tool, "add", None)) else None
+    # Pydantic models reject unknown attributes through __setattr__, so bypass it
+    if sources is not None:
+        object.__setattr__(tool, "add", sources)
+    object.__setattr__(tool, "_run", CachedTool(name, tool._run, config, cache, sources))
+    return tool
+
+
+_tool_cache = None
+_tool_cache_lock = threading.Lock()
+
+
+def get_tool_cache() -> ToolCache:
+    """Returns the process-wide tool cache."""
+    global _tool_cache
+    with _tool_cache_lock:
+        if _tool_cache is None:
+            _tool_cache = ToolCache()
+        return _tool_cache
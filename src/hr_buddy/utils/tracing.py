@@ -0,0 +1,246 @@
+import os
+import sys
+import json
+import time
+import uuid
+import cProfile
+import logging
+import threading
+import contextvars
+from functools import wraps
+from contextlib import contextmanager
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the span latency histogram buckets, for p95 via histogram_quantile()
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("hr_buddy_span", default=None)
+
+
+def _peak_rss_kb() -> Optional[int]:
+    # ru_maxrss is the process's high-water mark: KB on Linux, bytes on macOS
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class Span:
+    """One timed unit of work. Counters recorded inside a span also roll up into its parents."""
+
+    def __init__(self, name: str, attrs: Dict[str, Any], parent: Optional["Span"]):
+        self.name = name
+        self.attrs = attrs
+        self.parent = parent
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.counters: Dict[str, float] = defaultdict(float)
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+        self.start_time = time.time()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+        self._rss_start = _peak_rss_kb()
+        self.wall_time = self.cpu_time = 0.0
+        self.peak_rss_delta_kb: Optional[int] = None
+
+    def add(self, **counters: float) -> None:
+        span = self
+        while span is not None:
+            with span._lock:
+                for key, value in counters.items():
+                    span.counters[key] += value
+            span = span.parent
+
+    def finish(self) -> None:
+        self.wall_time = time.perf_counter() - self._wall_start
+        self.cpu_time = time.thread_time() - self._cpu_start
+        rss_end = _peak_rss_kb()
+        if rss_end is not None and self._rss_start is not None:
+            self.peak_rss_delta_kb = rss_end - self._rss_start
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent.span_id if self.parent else None,
+            "start_time": self.start_time,
+            "wall_time": round(self.wall_time, 6),
+            "cpu_time": round(self.cpu_time, 6),
+            "peak_rss_delta_kb": self.peak_rss_delta_kb,
+            "counters": dict(self.counters),
+            "attrs": self.attrs,
+            "error": self.error,
+        }
+
+
+class Tracer:
+    """
+    Collects finished spans: aggregates them for Prometheus and optionally appends each one
+    to a JSONL trace file ($HR_BUDDY_TRACE_FILE).
+    """
+
+    def __init__(self, trace_file: Optional[str] = None):
+        self.trace_file = trace_file or os.getenv("HR_BUDDY_TRACE_FILE")
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._buckets: Dict[str, List[int]] = defaultdict(lambda: [0] * len(LATENCY_BUCKETS))
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            stats = self._stats[span.name]
+            stats["count"] += 1
+            stats["errors"] += span.error is not None
+            stats["wall_seconds"] += span.wall_time
+            stats["cpu_seconds"] += span.cpu_time
+            stats["wall_seconds_max"] = max(stats["wall_seconds_max"], span.wall_time)
+            for key, value in span.counters.items():
+                stats[key] += value
+            buckets = self._buckets[span.name]  # Cumulative, as Prometheus expects
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if span.wall_time <= bound:
+                    buckets[index] += 1
+
+            if self.trace_file:
+                with open(self.trace_file, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(span.to_dict(), default=str) + "\n")
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {name: dict(values) for name, values in self._stats.items()}
+
+    def render_prometheus(self) -> str:
+        """Renders aggregated span metrics in the Prometheus text exposition format."""
+        lines = []
+        metrics = {
+            "count": ("hr_buddy_span_total", "counter", "Completed spans"),
+            "errors": ("hr_buddy_span_errors_total", "counter", "Spans that raised"),
+            "wall_seconds": ("hr_buddy_span_wall_seconds_total", "counter", "Wall-clock time in spans"),
+            "cpu_seconds": ("hr_buddy_span_cpu_seconds_total", "counter", "Thread CPU time in spans"),
+            "wall_seconds_max": ("hr_buddy_span_wall_seconds_max", "gauge", "Slowest span so far"),
+        }
+        # One snapshot of both, so a histogram's +Inf bucket and count always agree with its buckets
+        with self._lock:
+            stats = {name: dict(values) for name, values in self._stats.items()}
+            buckets = {name: list(counts) for name, counts in self._buckets.items()}
+        counter_keys = sorted({key for values in stats.values() for key in values} - set(metrics))
+        for key in counter_keys:
+            metrics[key] = (f"hr_buddy_{key}_total", "counter", f"Sum of '{key}' recorded in spans")
+
+        for key, (metric, kind, help_text) in metrics.items():
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, values in sorted(stats.items()):
+                if key in values:
+                    lines.append(f'{metric}{{span="{name}"}} {values[key]:g}')
+
+        lines.append("# HELP hr_buddy_span_duration_seconds Span wall-clock latency")
+        lines.append("# TYPE hr_buddy_span_duration_seconds histogram")
+        for name, counts in sorted(buckets.items()):
+            for bound, count in zip(LATENCY_BUCKETS, counts):
+                lines.append(f'hr_buddy_span_duration_seconds_bucket{{span="{name}",le="{bound:g}"}} {count}')
+            lines.append(f'hr_buddy_span_duration_seconds_bucket{{span="{name}",le="+Inf"}} {stats[name]["count"]:g}')
+            lines.append(f'hr_buddy_span_duration_seconds_sum{{span="{name}"}} {stats[name]["wall_seconds"]:g}')
+            lines.append(f'hr_buddy_span_duration_seconds_count{{span="{name}"}} {stats[name]["count"]:g}')
+        return "\n".join(lines) + "\n"
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """Times the enclosed block as a span named `name`, nested under the current span if any."""
+    current = Span(name, attrs, _current_span.get())
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        current.finish()
+        _tracer.export(current)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator form of `span`; the span name defaults to the function's qualified name."""
+    def decorator(fn):
+        span_name = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record(**counters: float) -> None:
+    """Adds to counters (e.g. bytes_fetched, cache_hits, cache_misses) on the current span and its parents."""
+    current = _current_span.get()
+    if current is not None:
+        current.add(**counters)
+
+
+@contextmanager
+def profiled(name: str, profile_dir: Optional[str] = None):
+    """
+    Captures a cProfile of the enclosed block into `<profile_dir>/<name>-<timestamp>.prof`.
+
+    Does nothing unless `profile_dir` or $HR_BUDDY_PROFILE_DIR is set. Only the calling
+    thread is profiled. Also usable as a decorator.
+    """
+    profile_dir = profile_dir or os.getenv("HR_BUDDY_PROFILE_DIR")
+    if not profile_dir:
+        yield None
+        return
+
+    os.makedirs(profile_dir, exist_ok=True)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        path = os.path.join(profile_dir, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}.prof")
+        profiler.dump_stats(path)
+        logger.info(f"Saved profile to {path}")
+
+
+def serve_metrics(port: int = 9464, host: str = "0.0.0.0"):
+    """Serves `/metrics` in Prometheus text format from a daemon thread. Returns the server."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = _tracer.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="hr-buddy-metrics", daemon=True).start()
+    return server
@@ -0,0 +1,149 @@
+import re
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import SplitResult, urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Longer inputs are rejected before any parsing, which bounds the work per URL outright
+MAX_URL_LENGTH = 2048
+MAX_HOST_LENGTH = 253
+
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "trk", "trackingid", "refid"}
+LINKEDIN_HOSTS = {"linkedin.com", "www.linkedin.com"}
+GITHUB_HOSTS = {"github.com", "www.github.com"}
+
+# Every pattern below is a single character class or a bounded run anchored at both ends, with
+# no nested or overlapping quantifiers, so a match attempt is linear in the input length.
+# Whitespace and control characters (never valid in a URL).
+UNSAFE_CHARS_RE = re.compile(r"[\x00-\x20\x7f]")
+HOST_LABEL_RE = re.compile(r"[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\Z")
+TLD_RE = re.compile(r"(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59})\Z")
+LINKEDIN_SLUG_RE = re.compile(r"[A-Za-z0-9_%-]{1,100}\Z")
+GITHUB_LOGIN_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9-]{0,38}\Z")
+
+
+def _valid_host(host: str) -> bool:
+    if not host.isascii():
+        try:
+            host = host.encode("idna").decode("ascii")
+        except UnicodeError:
+            return False
+    if len(host) > MAX_HOST_LENGTH:
+        return False
+    labels = host.split(".")
+    # A dotted name with an alphabetic TLD: bare hosts and IP addresses are not accepted
+    return len(labels) >= 2 and all(HOST_LABEL_RE.match(label) for label in labels) and bool(TLD_RE.match(labels[-1]))
+
+
+def parse_url(url: str, schemes: Iterable[str] = ("http", "https")) -> Optional[SplitResult]:
+    """
+    Parses and validates a public web URL.
+
+    A missing scheme defaults to https ("example.com/jobs/1" is accepted). URLs longer than
+    MAX_URL_LENGTH, containing whitespace or control characters, carrying credentials, or whose
+    host is not a dotted domain name are rejected.
+
+    Parameters:
+    - url (str): The URL.
+    - schemes (iterable): Accepted schemes.
+
+    Returns:
+    - SplitResult: The parsed URL (scheme and host lowercased), or None if it is not valid.
+    """
+    if not isinstance(url, str):
+        return None
+    url = url.strip()
+    if not url or len(url) > MAX_URL_LENGTH or UNSAFE_CHARS_RE.search(url):
+        return None
+    if "://" not in url:
+        url = "https://" + url
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+    host = parts.hostname or ""
+    if parts.scheme.lower() not in schemes or parts.username is not None or not _valid_host(host):
+        return None
+    netloc = f"{host}:{port}" if port else host
+    return parts._replace(scheme=parts.scheme.lower(), netloc=netloc)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for use as a cache key.
+
+    The scheme and host are lowercased (https if missing), default ports, the fragment, a
+    trailing slash and tracking parameters (utm_*, fbclid, ...) are dropped, and the remaining
+    query parameters are sorted. Equivalent links to the same page get the same key.
+    """
+    url = url.strip()
+    parts = urlsplit(url if "//" in url else f"https://{url}")
+    scheme = (parts.scheme or "https").lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/") or "/"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def _path_segments(parts: SplitResult) -> List[str]:
+    return parts.path.strip("/").split("/") if parts.path.strip("/") else []
+
+
+def is_valid_url(url: str) -> bool:
+    """Validates if a given string is a properly formatted URL."""
+    return parse_url(url) is not None
+
+
+def is_valid_linkedin_url(url: str) -> bool:
+    """Validates a LinkedIn profile URL (https://www.linkedin.com/in/<slug>)."""
+    parts = parse_url(url, schemes=("https",))
+    # Country editions (uk.linkedin.com) serve the same profiles
+    if parts is None or not (parts.hostname in LINKEDIN_HOSTS or parts.hostname.endswith(".linkedin.com")):
+        return False
+    segments = _path_segments(parts)
+    return len(segments) == 2 and segments[0] == "in" and bool(LINKEDIN_SLUG_RE.match(segments[1]))
+
+
+def is_valid_github_url(url: str) -> bool:
+    """Validates a GitHub profile URL (https://github.com/<login>)."""
+    parts = parse_url(url, schemes=("https",))
+    if parts is None or parts.hostname not in GITHUB_HOSTS:
+        return False
+    segments = _path_segments(parts)
+    return len(segments) == 1 and bool(GITHUB_LOGIN_RE.match(segments[0]))
+
+
+VALIDATORS: Dict[str, Callable[[str], bool]] = {
+    "url": is_valid_url,
+    "linkedin": is_valid_linkedin_url,
+    "github": is_valid_github_url,
+}
+
+
+def validate_urls(urls: Iterable[Optional[str]], kind: str = "url") -> List[Optional[str]]:
+    """
+    Validates many URLs at once, e.g. a manifest column.
+
+    Each distinct URL is checked and normalized once, however often it repeats.
+
+    Parameters:
+    - urls (iterable): URLs; empty values count as invalid.
+    - kind (str): "url", "linkedin" or "github".
+
+    Returns:
+    - list: The normalized form of each valid URL, None for each invalid one, in input order.
+    """
+    validator = VALIDATORS.get(kind)
+    if validator is None:
+        raise ValueError(f"Unknown URL kind '{kind}'. Use one of: {', '.join(VALIDATORS)}.")
+    results: Dict[Optional[str], Optional[str]] = {}
+    checked = []
+    for url in urls:
+        if url not in results:
+            results[url] = normalize_url(url) if url and validator(url) else None
+        checked.append(results[url])
+    return checked
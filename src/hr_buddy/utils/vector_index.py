@@ -0,0 +1,315 @@
+import os
+import re
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hr_buddy.utils.disk_cache import default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+RESUME = "resume"
+JOB = "job"
+
+DEFAULT_DIM = 384
+CHUNK_WORDS = 200
+CHUNK_OVERLAP = 50
+
+WORD_RE = re.compile(r"\w+")
+
+
+def content_hash(text: str) -> str:
+    """Returns the SHA-256 hex digest of a document's text; identical texts share one set of embeddings."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def chunk_text(text: str, max_words: int = CHUNK_WORDS, overlap: int = CHUNK_OVERLAP) -> List[str]:
+    """Splits text into windows of `max_words` words, each overlapping the previous by `overlap` words."""
+    words = text.split()
+    if not words:
+        return []
+    step = max(max_words - overlap, 1)
+    return [" ".join(words[i:i + max_words]) for i in range(0, max(len(words) - overlap, 1), step)]
+
+
+class HashingEmbedder:
+    """
+    Deterministic bag-of-words embedder based on feature hashing; no model download needed.
+
+    Each unigram/bigram is hashed (with BLAKE2, so results are stable across processes and
+    machines) to a signed slot in a `dim`-sized vector, weighted by sublinear term frequency,
+    and the vector is L2-normalized. Quality is below a neural embedder, but it is fast,
+    reproducible and good enough for keyword-heavy resume/job matching.
+    """
+
+    def __init__(self, dim: int = DEFAULT_DIM, ngram_range: Tuple[int, int] = (1, 2)):
+        self.dim = dim
+        self.ngram_range = ngram_range
+        self.name = f"hashing-v1-{dim}-{ngram_range[0]}{ngram_range[1]}"
+        self._slots: Dict[str, Tuple[int, float]] = {}
+
+    def _slot(self, feature: str) -> Tuple[int, float]:
+        slot = self._slots.get(feature)
+        if slot is None:
+            value = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+            slot = (value % self.dim, 1.0 if value >> 63 else -1.0)
+            if len(self._slots) < 500_000:
+                self._slots[feature] = slot
+        return slot
+
+    def _features(self, text: str) -> List[str]:
+        words = WORD_RE.findall(text.lower())
+        low, high = self.ngram_range
+        features = list(words) if low == 1 else []
+        for n in range(max(low, 2), high + 1):
+            features.extend(" ".join(words[i:i + n]) for i in range(len(words) - n + 1))
+        return features
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Returns a float32 array of shape (len(texts), dim) with unit-length rows (zero rows for empty texts)."""
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            counts: Dict[str, int] = {}
+            for feature in self._features(text):
+                counts[feature] = counts.get(feature, 0) + 1
+            for feature, count in counts.items():
+                index, sign = self._slot(feature)
+                vectors[row, index] += sign * (1.0 + np.log(count))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+class VectorIndex:
+    """
+    On-disk index of chunk embeddings for resumes and job postings.
+
+    Documents are chunked and embedded once per distinct text: embeddings are stored under the
+    text's content hash, so re-adding an unchanged document is free and identical uploads share
+    vectors. Vectors are appended to `vectors.f32` (raw float32 rows) and memory-mapped for
+    search; `index.json` maps document ids to their kind, hash and metadata, and each hash to
+    its row range. Removing or replacing a document leaves its rows behind until `compact`.
+
+    Documents are ranked by the mean, over the query's chunks, of the best-matching chunk in the
+    document (cosine similarity). One process should write to a given directory at a time.
+    """
+
+    def __init__(self, directory: Optional[str] = None, embedder: Optional[HashingEmbedder] = None,
+                 max_words: int = CHUNK_WORDS, overlap: int = CHUNK_OVERLAP):
+        self.directory = directory or default_cache_dir("vectors")
+        self.embedder = embedder or HashingEmbedder()
+        self.max_words = max_words
+        self.overlap = overlap
+        self._lock = threading.RLock()
+        self._matrix_cache = None
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._meta = self._load_meta()
+        expected = {"embedder": self.embedder.name, "dim": self.embedder.dim,
+                    "max_words": max_words, "overlap": overlap}
+        if self._meta is None:
+            self._meta = dict(expected, rows=0, blocks={}, documents={})
+            self._save_meta()
+        elif any(self._meta[key] != value for key, value in expected.items()):
+            raise ValueError(f"Index at {self.directory} was built with different settings "
+                             f"({', '.join(f'{key}={self._meta[key]}' for key in expected)}); "
+                             f"use another directory or rebuild it")
+
+    @property
+    def _vectors_path(self) -> str:
+        return os.path.join(self.directory, "vectors.f32")
+
+    @property
+    def _meta_path(self) -> str:
+        return os.path.join(self.directory, "index.json")
+
+    def _load_meta(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._meta_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _save_meta(self) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._meta, f)
+            os.replace(tmp_path, self._meta_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def __len__(self) -> int:
+        return len(self._meta["documents"])
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._meta["documents"]
+
+    def documents(self, kind: Optional[str] = None) -> List[str]:
+        return [doc_id for doc_id, doc in self._meta["documents"].items() if kind is None or doc["kind"] == kind]
+
+    def add(self, doc_id: str, text: str, kind: str = RESUME, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Adds or updates one document. Returns True if its text had to be embedded."""
+        return self.add_many([(doc_id, text, metadata)], kind) == 1
+
+    def add_many(self, documents: Iterable[Tuple], kind: str = RESUME) -> int:
+        """
+        Adds or updates documents, embedding all new texts in one batch.
+
+        Parameters:
+        - documents (iterable): (doc_id, text) or (doc_id, text, metadata) tuples.
+        - kind (str): RESUME or JOB.
+
+        Returns:
+        - int: Number of distinct texts that were embedded (unchanged or duplicate texts are not).
+        """
+        with self._lock:
+            blocks = self._meta["blocks"]
+            docs = self._meta["documents"]
+            pending: Dict[str, List[str]] = {}
+            updates: Dict[str, Dict[str, Any]] = {}
+
+            for doc_id, text, *rest in documents:
+                metadata = rest[0] if rest else None
+                digest = content_hash(text)
+                doc = {"kind": kind, "hash": digest, "metadata": metadata or {}}
+                if updates.get(doc_id, docs.get(doc_id)) == doc:
+                    continue
+                if digest not in blocks and digest not in pending:
+                    # Empty documents still get a (zero) row so every hash has a block
+                    pending[digest] = chunk_text(text, self.max_words, self.overlap) or [""]
+                updates[doc_id] = doc
+            if not updates:
+                return 0
+
+            # The index only changes once both the vectors and index.json are written
+            meta = dict(self._meta, blocks=dict(blocks), documents=dict(docs, **updates))
+            if pending:
+                chunks = [chunk for digest_chunks in pending.values() for chunk in digest_chunks]
+                vectors = self.embedder.embed(chunks)
+                row = meta["rows"]
+                with open(self._vectors_path, "ab") as f:
+                    # Drop rows an interrupted earlier call appended without recording them in index.json
+                    expected = row * meta["dim"] * 4
+                    if f.seek(0, os.SEEK_END) < expected:
+                        raise ValueError(f"Vector file in {self.directory} is shorter than its index; rebuild it")
+                    f.truncate(expected)
+                    f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+                for digest, digest_chunks in pending.items():
+                    meta["blocks"][digest] = [row, row + len(digest_chunks)]
+                    row += len(digest_chunks)
+                meta["rows"] = row
+            previous, self._meta = self._meta, meta
+            try:
+                self._save_meta()
+            except BaseException:
+                self._meta = previous
+                raise
+            return len(pending)
+
+    def remove(self, doc_id: str) -> bool:
+        """Removes a document from search results. Its vectors are reclaimed by `compact`."""
+        with self._lock:
+            if self._meta["documents"].pop(doc_id, None) is None:
+                return False
+            self._save_meta()
+            return True
+
+    def compact(self) -> int:
+        """Rewrites the vector file without rows no document refers to. Returns the number of rows dropped."""
+        with self._lock:
+            matrix = self._matrix()
+            live = sorted({doc["hash"] for doc in self._meta["documents"].values()},
+                          key=lambda digest: self._meta["blocks"][digest][0])
+            blocks, row = {}, 0
+            tmp_path = self._vectors_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                for digest in live:
+                    start, end = self._meta["blocks"][digest]
+                    f.write(np.ascontiguousarray(matrix[start:end]).tobytes())
+                    blocks[digest] = [row, row + end - start]
+                    row += end - start
+            dropped = self._meta["rows"] - row
+            self._matrix_cache = None
+            del matrix
+            os.replace(tmp_path, self._vectors_path)
+            self._meta.update(rows=row, blocks=blocks)
+            self._save_meta()
+            return dropped
+
+    def _matrix(self) -> np.ndarray:
+        rows, dim = self._meta["rows"], self._meta["dim"]
+        if self._matrix_cache is None or self._matrix_cache.shape[0] != rows:
+            if rows == 0:
+                self._matrix_cache = np.zeros((0, dim), dtype=np.float32)
+            else:
+                self._matrix_cache = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(rows, dim))
+        return self._matrix_cache
+
+    def search(self, text: str, kind: str = RESUME, top_k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Finds the documents of `kind` most similar to a query text.
+
+        Returns:
+        - list: Up to `top_k` {"id", "score", "metadata"} dicts, best first; scores are in [-1, 1].
+        """
+        query = self.embedder.embed(chunk_text(text, self.max_words, self.overlap) or [""])
+        return self._search(query, kind, top_k, exclude=None)
+
+    def similar(self, doc_id: str, kind: str = RESUME, top_k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Like `search`, using an indexed document as the query without re-embedding it.
+
+        `index.similar(job_id, kind=RESUME, top_k=50)` returns the 50 best candidates for a job.
+        """
+        with self._lock:
+            doc = self._meta["documents"].get(doc_id)
+            if doc is None:
+                raise KeyError(f"No document '{doc_id}' in the index")
+            start, end = self._meta["blocks"][doc["hash"]]
+            query = np.array(self._matrix()[start:end])
+        return self._search(query, kind, top_k, exclude=doc_id)
+
+    def _search(self, query: np.ndarray, kind: str, top_k: int, exclude: Optional[str]) -> List[Dict[str, Any]]:
+        with self._lock:
+            matrix = self._matrix()
+            blocks = self._meta["blocks"]
+            candidates = [(doc_id, doc) for doc_id, doc in self._meta["documents"].items()
+                          if doc["kind"] == kind and doc_id != exclude]
+            if not candidates or top_k <= 0:
+                return []
+
+            # Blocks tile the rows in order, so each block's best chunk per query chunk is one reduceat
+            order = sorted(blocks, key=lambda digest: blocks[digest][0])
+            starts = np.array([blocks[digest][0] for digest in order], dtype=np.int64)
+            block_position = {digest: position for position, digest in enumerate(order)}
+
+            similarities = matrix @ query.T
+            block_scores = np.maximum.reduceat(similarities, starts, axis=0).mean(axis=1)
+
+        scores = np.array([block_scores[block_position[doc["hash"]]] for _, doc in candidates])
+        top_k = min(top_k, len(candidates))
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [{"id": candidates[i][0], "score": round(float(scores[i]), 4), "metadata": candidates[i][1]["metadata"]}
+                for i in best]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_vector_index() -> VectorIndex:
+    """Returns the process-wide index in HR Buddy's cache directory."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = VectorIndex()
+        return _index
@@ -0,0 +1,103 @@
+import threading
+import time
+
+import pytest
+
+from hr_buddy.batch import BatchRunner, _SharedCalls, load_manifest
+
+
+class StubCrew:
+    def __init__(self, profiles=None):
+        self.profiles = profiles or (lambda linkedin_url, github_url: {"linkedin": {"url": linkedin_url},
+                                                                       "github": None})
+
+    def extract_job_details(self, job_url):
+        return {"title": "Engineer", "url": job_url}
+
+    def parse_resume(self, resume_file, missing_info):
+        return {"name": resume_file}
+
+    def fetch_social_profiles(self, linkedin_url, github_url):
+        return self.profiles(linkedin_url, github_url)
+
+    def _write(self, filename, content):
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(content)
+        return filename
+
+    def generate_resume(self, job_details, resume_data, filename=None):
+        return self._write(filename, f"resume of {resume_data['name']}")
+
+    def generate_interview_questions(self, job_details, resume_data, filename=None):
+        return self._write(filename, f"questions for {resume_data['name']}")
+
+
+def run(tmp_path, rows, crew=None):
+    runner = BatchRunner(crew=crew or StubCrew(), max_workers=2, output_dir=str(tmp_path / "out"))
+    return {result["id"]: result for result in runner.run(rows)}
+
+
+def test_rows_return_their_profiles(tmp_path):
+    results = run(tmp_path, [
+        {"id": "a", "job_url": "https://jobs.example.com/1", "resume_file": "a.pdf",
+         "linkedin_url": "https://www.linkedin.com/in/a"},
+        {"id": "b", "job_url": "https://jobs.example.com/1", "resume_file": "b.pdf"},
+    ])
+
+    assert results["a"]["status"] == "ok"
+    assert results["a"]["social_profiles"] == {"linkedin": {"url": "https://www.linkedin.com/in/a"}, "github": None}
+    assert results["b"]["social_profiles"] is None
+
+
+def test_failed_profile_fetch_does_not_fail_the_row(tmp_path):
+    def down(linkedin_url, github_url):
+        raise ConnectionError("LinkedIn is down")
+
+    result = run(tmp_path, [{"id": "a", "job_url": "https://jobs.example.com/1", "resume_file": "a.pdf",
+                             "linkedin_url": "https://www.linkedin.com/in/a"}], StubCrew(down))["a"]
+
+    assert result["status"] == "ok"
+    assert result["social_profiles"] is None
+    with open(result["resume_pdf_path"], encoding="utf-8") as f:
+        assert f.read() == "resume of a.pdf"
+
+
+def test_manifest_rejects_duplicate_ids(tmp_path):
+    manifest = tmp_path / "rows.jsonl"
+    manifest.write_text('{"id": "1", "job_url": "https://jobs.example.com/1", "resume_file": "a.pdf"}\n'
+                        '{"job_url": "https://jobs.example.com/2", "resume_file": "b.pdf"}\n'  # Defaults to "1"
+                        '{"id": "x", "job_url": "https://jobs.example.com/3", "resume_file": "c.pdf"}\n')
+
+    with pytest.raises(ValueError, match="Duplicate manifest ids: 1"):
+        load_manifest(str(manifest))
+
+
+def test_shared_call_interrupted_by_base_exception_releases_waiters():
+    started, release = threading.Event(), threading.Event()
+
+    def fn(key):
+        started.set()
+        release.wait(5)
+        raise KeyboardInterrupt()
+
+    calls = _SharedCalls(fn)
+    outcomes = []
+
+    def call():
+        try:
+            calls.get("key")
+        except BaseException as e:
+            outcomes.append(type(e).__name__)
+
+    owner = threading.Thread(target=call)
+    owner.start()
+    started.wait(5)
+    waiter = threading.Thread(target=call)
+    waiter.start()
+    time.sleep(0.05)  # Let the waiter block on the owner's future
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+
+    assert not waiter.is_alive()
+    assert outcomes == ["KeyboardInterrupt", "KeyboardInterrupt"]
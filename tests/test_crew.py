@@ -0,0 +1,136 @@
+import io
+import threading
+import time
+
+import pytest
+
+from hr_buddy.agents.registry import AgentRegistry
+from hr_buddy.crew import HRBuddyCrew, _run_stage_graph
+from hr_buddy.utils.job_parser import JobPosting
+
+
+def test_stages_run_after_their_dependencies():
+    order = []
+    lock = threading.Lock()
+
+    def stage(name, value):
+        def run(*deps):
+            with lock:
+                order.append(name)
+            return value + sum(deps)
+        return run
+
+    results, timings = _run_stage_graph({
+        "total": (stage("total", 100), ("a", "b")),
+        "a": (stage("a", 1), ()),
+        "b": (stage("b", 2), ("a",)),
+    }, {}, max_workers=3)
+
+    assert results == {"a": 1, "b": 3, "total": 104}
+    assert order == ["a", "b", "total"]
+    assert set(timings) == {"a", "b", "total"}
+
+
+def test_independent_stages_run_concurrently():
+    barrier = threading.Barrier(2, timeout=2)  # Only passes if both stages are running at once
+
+    results, _ = _run_stage_graph({
+        "a": (lambda: barrier.wait() is not None, ()),
+        "b": (lambda: barrier.wait() is not None, ()),
+    }, {}, max_workers=2)
+
+    assert results == {"a": True, "b": True}
+
+
+def test_stage_error_fails_the_run_and_skips_dependents():
+    ran = []
+
+    with pytest.raises(ValueError, match="bad page"):
+        _run_stage_graph({
+            "job": (lambda: (_ for _ in ()).throw(ValueError("bad page")), ()),
+            "pdf": (lambda job: ran.append(job), ("job",)),
+        }, {}, max_workers=2)
+    assert ran == []
+
+
+def test_stage_timeout_fails_the_run_without_waiting_for_it():
+    release = threading.Event()
+    start = time.monotonic()
+
+    with pytest.raises(TimeoutError, match="'slow'"):
+        _run_stage_graph({"slow": (lambda: release.wait(5), ())}, {"slow": 0.1}, max_workers=1)
+
+    assert time.monotonic() - start < 2
+    release.set()
+
+
+def test_optional_stage_failure_and_timeout_yield_none():
+    release = threading.Event()
+
+    results, _ = _run_stage_graph({
+        "broken": (lambda: 1 / 0, ()),
+        "slow": (lambda: release.wait(5), ()),
+        "after": (lambda broken: broken, ("broken",)),
+        "main": (lambda: "ok", ()),
+    }, {"slow": 0.1}, max_workers=4, optional=("broken", "slow"))
+
+    assert results == {"broken": None, "slow": None, "after": None, "main": "ok"}
+    release.set()
+
+
+def test_unresolvable_dependencies_are_reported():
+    with pytest.raises(RuntimeError, match=r"\['a'\]"):
+        _run_stage_graph({"a": (lambda missing: missing, ("missing",))}, {}, max_workers=1)
+
+
+class StubResearcher:
+    def extract_job_details(self, url):
+        return JobPosting(title="Engineer", url=url)
+
+
+class StubStrategist:
+    def render_resume(self, job_details, resume_data):
+        return io.BytesIO(b"resume for " + job_details.title.encode())
+
+
+class StubPreparer:
+    def generate_questions(self, job_details, resume_data):
+        return ["Why?"]
+
+    def render_questions_pdf(self, questions):
+        return io.BytesIO("\n".join(questions).encode())
+
+
+class BrokenProfiler:
+    def extract_profiles(self, linkedin_url, github_url):
+        raise ConnectionError("LinkedIn is down")
+
+
+def stub_crew(profiler):
+    registry = AgentRegistry()
+    registry.register("researcher", StubResearcher)
+    registry.register("profiler", profiler)
+    registry.register("strategist", StubStrategist)
+    registry.register("preparer", StubPreparer)
+    return HRBuddyCrew(registry=registry)
+
+
+def test_failed_profile_fetch_does_not_fail_the_run():
+    crew = stub_crew(BrokenProfiler)
+
+    for result in (crew.run_crew_concurrent("https://jobs.example.com/1", "https://linkedin.com/in/x", in_memory=True),
+                   crew.run_crew("https://jobs.example.com/1", "https://linkedin.com/in/x", in_memory=True)):
+        assert result["resume_pdf"].getvalue() == b"resume for Engineer"
+        assert result["interview_pdf"].getvalue() == b"Why?"
+        assert result["social_profiles"] is None
+
+
+def test_fetched_profiles_are_returned():
+    class Profiler:
+        def extract_profiles(self, linkedin_url, github_url):
+            return {"linkedin": {"name": "X"}, "github": None}
+
+    result = stub_crew(Profiler).run_crew_concurrent("https://jobs.example.com/1", "https://linkedin.com/in/x",
+                                                     in_memory=True)
+
+    assert result["social_profiles"] == {"linkedin": {"name": "X"}, "github": None}
@@ -0,0 +1,108 @@
+import zipfile
+
+import pytest
+
+from hr_buddy.utils.resume_parser import DOCX_DOCUMENT_PART, extract_text_from_docx, iter_docx_lines
+
+NAMESPACES = ('xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+              'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+              'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" '
+              'xmlns:v="urn:schemas-microsoft-com:vml"')
+
+
+def paragraph(*runs):
+    return "<w:p>" + "".join(f"<w:r>{run}</w:r>" for run in runs) + "</w:p>"
+
+
+def text(value):
+    return f'<w:t xml:space="preserve">{value}</w:t>'
+
+
+def text_box(*paragraphs):
+    """A text box as Word writes it: the DrawingML version, plus a legacy VML copy in mc:Fallback."""
+    content = "".join(paragraphs)
+    return (f"<w:r><mc:AlternateContent>"
+            f"<mc:Choice Requires=\"wps\"><wps:txbx><w:txbxContent>{content}</w:txbxContent></wps:txbx></mc:Choice>"
+            f"<mc:Fallback><v:textbox><w:txbxContent>{content}</w:txbxContent></v:textbox></mc:Fallback>"
+            f"</mc:AlternateContent></w:r>")
+
+
+def write_docx(path, body, document=None):
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        if document is None:
+            document = f"<w:document {NAMESPACES}><w:body>{body}</w:body></w:document>"
+        archive.writestr(DOCX_DOCUMENT_PART, document)
+    return str(path)
+
+
+def lines(tmp_path, body):
+    return list(iter_docx_lines(write_docx(tmp_path / "resume.docx", body)))
+
+
+def test_paragraphs_in_order(tmp_path):
+    body = paragraph(text("Jane "), text("Doe")) + paragraph(text("jane@example.com")) + "<w:p/>"
+    assert lines(tmp_path, body) == ["Jane Doe", "jane@example.com", ""]
+
+
+def test_tabs_and_breaks(tmp_path):
+    body = paragraph(text("Python"), "<w:tab/>", text("5 years"), "<w:br/>", text("Go"),
+                     '<w:br w:type="page"/>', text("!"))
+    assert lines(tmp_path, body) == ["Python\t5 years\nGo!"]
+
+
+def test_tab_stop_definitions_are_not_text(tmp_path):
+    body = '<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr><w:r><w:t>Skills</w:t></w:r></w:p>'
+    assert lines(tmp_path, body) == ["Skills"]
+
+
+def test_table_rows_become_tab_separated_lines(tmp_path):
+    row = "<w:tr>" + "".join(f"<w:tc>{cell}</w:tc>" for cell in (
+        paragraph(text("Acme")),
+        paragraph(text("Engineer")) + paragraph(text("Team lead")),
+        "",
+    )) + "</w:tr>"
+    body = paragraph(text("Experience")) + f"<w:tbl>{row}</w:tbl>" + paragraph(text("Education"))
+
+    assert lines(tmp_path, body) == ["Experience", "Acme\tEngineer Team lead\t", "Education"]
+
+
+def test_text_box_is_read_once_where_it_is_anchored(tmp_path):
+    body = ("<w:p>" + "<w:r><w:t>Contact</w:t></w:r>" + text_box(paragraph(text("jane@example.com"))) + "</w:p>"
+            + paragraph(text("Summary")))
+
+    assert lines(tmp_path, body) == ["jane@example.com", "Contact", "Summary"]
+
+
+def test_deleted_revisions_are_skipped(tmp_path):
+    body = "<w:p><w:r><w:t>Senior </w:t></w:r><w:del><w:r><w:delText>Junior </w:delText></w:r></w:del>" \
+           "<w:r><w:t>Engineer</w:t></w:r></w:p>"
+    assert lines(tmp_path, body) == ["Senior Engineer"]
+
+
+def test_extract_text_joins_lines(tmp_path):
+    path = write_docx(tmp_path / "resume.docx", paragraph(text("Jane Doe")) + paragraph(text("Python")))
+    assert extract_text_from_docx(path) == "Jane Doe\nPython"
+
+
+@pytest.mark.parametrize("document", [
+    f"<w:document {NAMESPACES}><w:body><w:p><w:r><w:t>Jane",  # Truncated
+    f"<w:document {NAMESPACES}><w:body></w:p></w:body></w:document>",  # Mismatched tag
+    "",
+])
+def test_malformed_document_xml_is_a_value_error(tmp_path, document):
+    path = write_docx(tmp_path / "broken.docx", None, document=document)
+    with pytest.raises(ValueError, match="Not a valid DOCX file"):
+        list(iter_docx_lines(path))
+
+
+def test_not_a_docx_is_a_value_error(tmp_path):
+    not_zip = tmp_path / "resume.docx"
+    not_zip.write_bytes(b"%PDF-1.7")
+    no_document = tmp_path / "empty.docx"
+    with zipfile.ZipFile(no_document, "w") as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+
+    for path in (not_zip, no_document):
+        with pytest.raises(ValueError, match="Not a valid DOCX file"):
+            list(iter_docx_lines(str(path)))
@@ -0,0 +1,241 @@
+"""
+GitHubClient and ProfileEnricher against a local mock server standing in for the GitHub API
+and a LinkedIn profile page.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from hr_buddy.utils import fetcher
+from hr_buddy.utils.disk_cache import DiskCache
+from hr_buddy.utils.enrichment import GitHubClient, ProfileEnricher, RateLimitError
+
+REPOS_PER_PAGE = 2
+
+
+def _repo(login, index):
+    return {"name": f"{login}-repo-{index}", "description": None, "html_url": f"https://github.com/{login}/r{index}",
+            "stargazers_count": index, "forks_count": 0, "language": "Python" if index % 2 else "Go",
+            "pushed_at": "2024-01-01T00:00:00Z", "fork": False}
+
+
+def _graphql_repos(login, start, count, total):
+    nodes = [{"name": f"{login}-repo-{i}", "description": None, "url": f"https://github.com/{login}/r{i}",
+              "stargazerCount": i, "forkCount": 0, "pushedAt": "2024-01-01T00:00:00Z",
+              "primaryLanguage": {"name": "Rust"}} for i in range(start, min(start + count, total))]
+    end = start + len(nodes)
+    return {"totalCount": total, "nodes": nodes,
+            "pageInfo": {"hasNextPage": end < total, "endCursor": str(end)}}
+
+
+class MockServer:
+    """Serves the GitHub REST and GraphQL endpoints HR Buddy uses, plus LinkedIn-like pages."""
+
+    def __init__(self):
+        self.users = {"octocat": 5, "hubot": 1}  # login -> number of repositories
+        self.requests = []  # (method, path, headers, body)
+        self.scripted = []  # (status, headers) answered before the next matching request
+        self.pages = {}  # path -> (etag, body)
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body=b"", headers=None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _json(self, payload, headers=None):
+                self._send(200, json.dumps(payload).encode(), dict(headers or {}, **{"Content-Type": "application/json"}))
+
+            def _handle(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                server.requests.append((method, self.path, dict(self.headers), body))
+                if server.scripted:
+                    status, headers = server.scripted.pop(0)
+                    return self._send(status, b"{}", headers)
+                return server.route(self, method, body)
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def route(self, handler, method, body):
+        parts = urlsplit(handler.path)
+        segments = parts.path.strip("/").split("/")
+        if method == "POST" and parts.path == "/graphql":
+            return handler._json({"data": self.graphql(body["variables"])})
+        if segments[0] == "users" and segments[1] in self.users:
+            login, total = segments[1], self.users[segments[1]]
+            if len(segments) == 2:
+                return handler._json({"login": login, "name": login.title(), "bio": "Builds things",
+                                      "html_url": f"https://github.com/{login}", "followers": 3,
+                                      "public_repos": total})
+            page = int(parse_qs(parts.query).get("page", ["1"])[0])
+            start = (page - 1) * REPOS_PER_PAGE
+            headers = {}
+            if start + REPOS_PER_PAGE < total:
+                headers["Link"] = f'<{self.url}/users/{login}/repos?page={page + 1}>; rel="next"'
+            return handler._json([_repo(login, i) for i in range(start, min(start + REPOS_PER_PAGE, total))], headers)
+        if parts.path in self.pages:
+            etag, content = self.pages[parts.path]
+            if handler.headers.get("If-None-Match") == etag:
+                return handler._send(304, headers={"ETag": etag})
+            return handler._send(200, content.encode(), {"ETag": etag, "Content-Type": "text/html"})
+        return handler._send(404, b'{"message": "Not Found"}')
+
+    def graphql(self, variables):
+        if "login" in variables:  # A further page of one user's repositories
+            login = variables["login"]
+            return {"user": {"repositories": _graphql_repos(login, int(variables["after"]), variables["first"],
+                                                            self.users[login])}}
+        data = {}
+        for name, login in variables.items():
+            if not name.startswith("l"):
+                continue
+            total = self.users.get(login)
+            data[f"u{name[1:]}"] = None if total is None else {
+                "login": login, "name": login.title(), "bio": None, "company": None, "location": None,
+                "websiteUrl": None, "url": f"https://github.com/{login}", "followers": {"totalCount": 3},
+                "repositories": _graphql_repos(login, 0, REPOS_PER_PAGE, total),
+            }
+        return data
+
+    def count(self, method=None, path_prefix=""):
+        return sum(1 for m, path, _, _ in self.requests
+                   if (method is None or m == method) and path.startswith(path_prefix))
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    mock = MockServer()
+    yield mock
+    mock.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("HR_BUDDY_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    # The LinkedIn path goes through the shared fetcher; give each test its own
+    monkeypatch.setattr(fetcher, "_fetcher", None)
+
+
+def rest_client(server, **kwargs):
+    return GitHubClient(token="", base_url=server.url, backoff_factor=0, **kwargs)
+
+
+def graphql_client(server, **kwargs):
+    return GitHubClient(token="test-token", base_url=server.url, backoff_factor=0, **kwargs)
+
+
+def test_rest_fallback_follows_repository_pages(server):
+    profile = rest_client(server).fetch_profile("octocat")
+
+    assert profile["name"] == "Octocat"
+    assert len(profile["top_repos"]) == 5
+    assert profile["total_stars"] == sum(range(5))
+    assert set(profile["languages"]) == {"Python", "Go"}
+    assert server.count("GET", "/users/octocat/repos") == 3  # 5 repositories, 2 per page
+    assert server.count("POST") == 0
+
+
+def test_rest_missing_user_is_none(server):
+    assert rest_client(server).fetch_profile("nobody") is None
+
+
+def test_graphql_batches_users_into_one_query(server):
+    profiles = graphql_client(server).fetch_profiles(["octocat", "hubot", "nobody"])
+
+    assert profiles["nobody"] is None
+    assert profiles["hubot"]["public_repos"] == 1
+    assert len(profiles["octocat"]["top_repos"]) == 5
+    batched = [body for method, path, _, body in server.requests if method == "POST" and "login" not in body["variables"]]
+    assert len(batched) == 1  # All three users in one query
+    assert server.count("POST") == 2  # Plus one page with the rest of octocat's repositories
+    assert server.requests[0][2]["Authorization"] == "Bearer test-token"
+
+
+def test_retries_after_rate_limit(server):
+    server.scripted = [(429, {"Retry-After": "0"}), (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"})]
+
+    profile = rest_client(server).fetch_profile("hubot")
+
+    assert profile["login"] == "hubot"
+    assert server.count("GET", "/users/hubot") == 4  # Two rate-limited attempts, the profile, its repositories
+
+
+def test_retries_server_errors_with_backoff(server):
+    server.scripted = [(502, {}), (503, {})]
+    assert rest_client(server).fetch_profile("hubot")["login"] == "hubot"
+
+
+def test_rate_limit_resetting_too_late_raises(server):
+    server.scripted = [(429, {"Retry-After": "3600"})]
+    with pytest.raises(RateLimitError):
+        rest_client(server, max_wait=1).fetch_profile("hubot")
+
+
+def test_enricher_fetches_both_profiles_and_caches_them(server, tmp_path):
+    server.pages["/in/jane"] = ('"v1"', "<html><head><title>Jane Doe | LinkedIn</title></head></html>")
+    enricher = ProfileEnricher(github=rest_client(server), cache=DiskCache(str(tmp_path / "profiles")))
+
+    first = enricher.enrich(f"{server.url}/in/jane", "https://github.com/octocat")
+    requests_made = len(server.requests)
+    second = enricher.enrich(f"{server.url}/in/jane", "https://github.com/octocat")
+
+    assert first["linkedin"]["name"] == "Jane Doe | LinkedIn"
+    assert first["github"]["login"] == "octocat"
+    assert second == first
+    assert len(server.requests) == requests_made  # Served from the profile cache
+
+
+def test_enricher_reports_errors_per_source(server, tmp_path):
+    enricher = ProfileEnricher(github=rest_client(server), cache=DiskCache(str(tmp_path / "profiles")))
+
+    result = enricher.enrich(f"{server.url}/in/missing", "https://github.com/nobody")
+
+    assert "error" in result["linkedin"]
+    assert "error" in result["github"]
+
+
+def test_linkedin_revalidates_with_etag(server, tmp_path, monkeypatch):
+    monkeypatch.setenv("HR_BUDDY_NO_CACHE", "1")  # No profile cache, so every call reaches the fetcher
+    monkeypatch.setattr(fetcher, "_fetcher", fetcher.Fetcher(ttl=0, cache=DiskCache(str(tmp_path / "http"))))
+    server.pages["/in/jane"] = ('"v1"', "<html><title>Jane Doe</title></html>")
+    enricher = ProfileEnricher(github=rest_client(server))
+
+    assert enricher.linkedin(f"{server.url}/in/jane")["name"] == "Jane Doe"
+    assert enricher.linkedin(f"{server.url}/in/jane")["name"] == "Jane Doe"
+
+    conditional = [headers.get("If-None-Match") for _, path, headers, _ in server.requests if path == "/in/jane"]
+    assert conditional == [None, '"v1"']  # The second fetch was a 304 served from the stale copy
+
+
+def test_linkedin_empty_page_has_no_name(server, tmp_path):
+    server.pages["/in/blank"] = ('"e"', "")
+    enricher = ProfileEnricher(github=rest_client(server), cache=DiskCache(str(tmp_path / "profiles")))
+
+    profile = enricher.enrich(f"{server.url}/in/blank", None)["linkedin"]
+
+    assert profile["name"] is None
+
@@ -0,0 +1,82 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from hr_buddy.agents import researcher
+from hr_buddy.agents.researcher import ResearcherAgent
+from hr_buddy.utils.job_parser import JobPosting, parse_job_page, parse_job_posting
+
+POSTING_HTML = """
+<html><head><title>Careers</title></head><body>
+<nav>Home | Jobs</nav>
+<h1>Senior Backend Engineer</h1>
+<h2>Requirements</h2>
+<ul><li>5+ years of Python</li><li>Experience with Docker and Kubernetes</li></ul>
+<h2>Responsibilities</h2>
+<ul><li>Design APIs</li></ul>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("HR_BUDDY_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.mark.parametrize("html", ["", "   \n\t", "<!-- nothing here -->"])
+def test_blank_page_is_an_empty_posting(html):
+    posting = parse_job_posting(html, "https://jobs.example.com/1")
+
+    assert isinstance(posting, JobPosting)
+    assert posting.is_empty()
+    assert posting.url == "https://jobs.example.com/1"
+
+
+def test_blank_page_through_the_cache():
+    assert parse_job_page("", "https://jobs.example.com/1").is_empty()
+    assert parse_job_page("", "https://jobs.example.com/1").is_empty()  # Served from the cache
+
+
+def test_sections_from_page_html():
+    posting = parse_job_posting(POSTING_HTML)
+
+    assert posting.source == "html"
+    assert posting.title == "Senior Backend Engineer"
+    assert posting.seniority == "senior"
+    assert posting.requirements == ["5+ years of Python", "Experience with Docker and Kubernetes"]
+    assert posting.responsibilities == ["Design APIs"]
+    assert {"Python", "Docker", "Kubernetes"} <= set(posting.required_skills)
+
+
+def test_json_ld_takes_precedence():
+    ld = {"@context": "https://schema.org", "@type": "JobPosting", "title": "Data Engineer",
+          "hiringOrganization": {"@type": "Organization", "name": "Acme"},
+          "description": "<h3>Requirements</h3><ul><li>SQL</li></ul>"}
+    html = f'<html><body><h1>Ignored</h1><script type="application/ld+json">{json.dumps(ld)}</script></body></html>'
+
+    posting = parse_job_posting(html)
+
+    assert posting.source == "json-ld"
+    assert posting.title == "Data Engineer"
+    assert posting.company == "Acme"
+    assert posting.requirements == ["SQL"]
+
+
+class StubFetcher:
+    def __init__(self, status_code, text):
+        self.response = SimpleNamespace(status_code=status_code, text=text)
+
+    def get(self, url):
+        return self.response
+
+
+@pytest.mark.parametrize("status_code, text", [(200, ""), (200, "  "), (404, POSTING_HTML)])
+def test_researcher_returns_none_without_content(monkeypatch, status_code, text):
+    monkeypatch.setattr(researcher, "get_fetcher", lambda: StubFetcher(status_code, text))
+    assert ResearcherAgent().extract_job_details("https://jobs.example.com/1") is None
+
+
+def test_researcher_parses_the_fetched_page(monkeypatch):
+    monkeypatch.setattr(researcher, "get_fetcher", lambda: StubFetcher(200, POSTING_HTML))
+    assert ResearcherAgent().extract_job_details("https://jobs.example.com/1").title == "Senior Backend Engineer"
@@ -0,0 +1,215 @@
+import io
+import sqlite3
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from hr_buddy import jobs
+from hr_buddy.jobs import (JobQueue, WorkerPool, QUEUED, RUNNING, SUCCEEDED, FAILED, TIMED_OUT, EXPIRED,
+                           MAX_ATTEMPTS)
+
+LEASE = 60.0
+RESULT_TTL = 3600.0
+
+
+class Clock:
+    """Stands in for the `time` module inside jobs.py, so leases and deadlines can lapse instantly."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(jobs, "time", SimpleNamespace(time=clock.time, sleep=time.sleep))
+    return clock
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / "jobs.sqlite3"), result_ttl=RESULT_TTL, lease=LEASE)
+
+
+def artifact_count(queue):
+    with queue._connect() as conn:
+        return conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+
+
+def test_claim_complete_and_artifacts(queue, clock):
+    job_id = queue.submit({"job_url": "https://jobs.example.com/1"})
+
+    job = queue.claim()
+    assert (job["id"], job["params"], job["attempt"]) == (job_id, {"job_url": "https://jobs.example.com/1"}, 1)
+    assert queue.status(job_id)["status"] == RUNNING
+    assert queue.claim() is None
+
+    queue.complete(job_id, {"resume_pdf": io.BytesIO(b"%PDF-1"), "interview_pdf": b"%PDF-2", "timings": {"total": 1}},
+                   attempt=job["attempt"])
+
+    assert queue.status(job_id)["status"] == SUCCEEDED
+    assert queue.result(job_id) == {"resume_pdf": b"%PDF-1", "interview_pdf": b"%PDF-2", "timings": {"total": 1}}
+
+
+def test_idempotent_resubmit_reuses_live_and_succeeded_jobs(queue, clock):
+    first = queue.submit({"n": 1}, idempotency_key="k")
+    assert queue.submit({"n": 1}, idempotency_key="k") == first  # Queued
+
+    job = queue.claim()
+    assert queue.submit({"n": 1}, idempotency_key="k") == first  # Running
+
+    queue.complete(first, {"ok": True}, attempt=job["attempt"])
+    assert queue.submit({"n": 1}, idempotency_key="k") == first  # Succeeded
+
+
+def test_idempotent_resubmit_after_failure_creates_a_new_job(queue, clock):
+    first = queue.submit({"n": 1}, idempotency_key="k")
+    queue.fail(first, "boom", attempt=queue.claim()["attempt"])
+
+    second = queue.submit({"n": 1}, idempotency_key="k")
+
+    assert second != first
+    assert queue.status(second)["status"] == QUEUED
+    assert queue.status(first)["error"] == "boom"  # The failed job is kept until it expires
+    assert queue.submit({"n": 1}, idempotency_key="k") == second
+
+
+def test_queued_job_expires_at_its_deadline(queue, clock):
+    job_id = queue.submit({}, deadline=10)
+    clock.advance(11)
+
+    assert queue.claim() is None
+    assert queue.status(job_id)["status"] == EXPIRED
+
+
+def test_running_job_times_out_at_its_deadline(queue, clock):
+    job_id = queue.submit({}, deadline=10)
+    job = queue.claim()
+    clock.advance(11)
+
+    assert queue.claim() is None
+    assert queue.status(job_id)["status"] == TIMED_OUT
+    queue.complete(job_id, {"late": True}, attempt=job["attempt"])  # Too late to count
+    assert queue.status(job_id)["status"] == TIMED_OUT
+
+
+def test_heartbeat_keeps_the_lease(queue, clock):
+    job_id = queue.submit({})
+    job = queue.claim()
+    for _ in range(3):
+        clock.advance(LEASE - 1)
+        assert queue.heartbeat(job_id, job["attempt"])
+
+    assert queue.claim() is None
+    assert queue.status(job_id)["status"] == RUNNING
+
+
+def test_lost_heartbeat_requeues_the_job(queue, clock):
+    job_id = queue.submit({})
+    first = queue.claim()
+    clock.advance(LEASE + 1)
+
+    second = queue.claim()
+
+    assert (second["id"], second["attempt"]) == (job_id, 2)
+    assert not queue.heartbeat(job_id, first["attempt"])  # The first worker no longer owns it
+    assert queue.heartbeat(job_id, second["attempt"])
+
+
+def test_job_fails_after_max_attempts(queue, clock):
+    job_id = queue.submit({})
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        assert queue.claim()["attempt"] == attempt
+        clock.advance(LEASE + 1)
+
+    assert queue.claim() is None
+    status = queue.status(job_id)
+    assert status["status"] == FAILED
+    assert "stopped responding" in status["error"]
+
+
+def test_finish_from_a_stale_attempt_is_ignored(queue, clock):
+    job_id = queue.submit({})
+    stale = queue.claim()
+    clock.advance(LEASE + 1)
+    current = queue.claim()
+
+    queue.complete(job_id, {"resume_pdf": b"stale"}, attempt=stale["attempt"])
+    assert queue.status(job_id)["status"] == RUNNING
+    assert artifact_count(queue) == 0
+
+    queue.complete(job_id, {"resume_pdf": b"current"}, attempt=current["attempt"])
+    assert queue.result(job_id) == {"resume_pdf": b"current"}
+
+
+def test_purge_expired_removes_jobs_and_their_artifacts(queue, clock):
+    done = queue.submit({})
+    queue.complete(done, {"resume_pdf": b"%PDF"}, attempt=queue.claim()["attempt"])
+    pending = queue.submit({})
+    assert artifact_count(queue) == 1
+
+    clock.advance(RESULT_TTL - 1)
+    assert queue.purge_expired() == 0
+    clock.advance(2)
+    assert queue.purge_expired() == 1
+
+    assert queue.status(done) is None
+    assert artifact_count(queue) == 0
+    assert queue.status(pending)["status"] == QUEUED
+
+
+def test_database_from_before_leases_is_migrated(tmp_path, clock):
+    path = str(tmp_path / "old.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE jobs (id TEXT PRIMARY KEY, idempotency_key TEXT UNIQUE, status TEXT NOT NULL, "
+                 "params TEXT NOT NULL, result TEXT, error TEXT, created_at REAL NOT NULL, started_at REAL, "
+                 "finished_at REAL, deadline_at REAL, expires_at REAL)")
+    conn.execute("INSERT INTO jobs (id, status, params, created_at) VALUES ('old', 'running', '{}', 0)")
+    conn.commit()
+    conn.close()
+
+    queue = JobQueue(path, lease=LEASE)
+
+    assert queue.claim()["id"] == "old"  # Running without a lease counts as abandoned
+
+
+def test_worker_pool_runs_jobs_and_records_failures(queue):
+    pool = WorkerPool(queue, handler=lambda params: {"double": params["n"] * 2}, concurrency=1)
+    ok = queue.submit({"n": 2})
+    assert pool.run_one()
+    assert queue.result(ok) == {"double": 4}
+
+    pool.handler = lambda params: 1 / 0
+    bad = queue.submit({"n": 2})
+    assert pool.run_one()
+    assert queue.status(bad)["status"] == FAILED
+    assert "division by zero" in queue.status(bad)["error"]
+    assert not pool.run_one()  # Nothing left
+
+
+def test_worker_pool_abandons_timed_out_handlers_and_holds_their_slot(queue):
+    release = threading.Event()
+    pool = WorkerPool(queue, handler=lambda params: release.wait(5) and {"ok": True}, concurrency=1)
+    slow = queue.submit({}, deadline=0.2)
+    queue.submit({})
+
+    assert pool.run_one()
+    assert queue.status(slow)["status"] == TIMED_OUT
+    assert pool.abandoned() == 1
+    assert not pool.run_one()  # The abandoned call still occupies the only slot
+
+    release.set()
+    for _ in range(50):
+        if not pool.abandoned():
+            break
+        time.sleep(0.02)
+    assert pool.abandoned() == 0
+    assert pool.run_one()